@@ -0,0 +1,85 @@
+"""
+Benchmark of DataCore snapshots against pickle.
+
+The texts of the test suite are concatenated until the document reaches the
+requested number of words, then the statistics of the document are saved and
+loaded repeatedly with DataCore.to_bytes/from_bytes and with pickle. The
+script reports the best time of each and the size of the saved data, and
+exits with an error if loading a snapshot is slower than unpickling.
+
+Usage:
+    python benchmarks/serialization.py [--words N] [--repeat N]
+"""
+
+import argparse
+import pickle
+import sys
+import time
+
+# Sibling benchmark module, found since the script directory is on the path
+from tokenizers import load_texts
+
+import yake
+from yake.data import DataCore
+
+
+def best_time(function, repeat):
+    """Get the shortest time of several calls of a function, in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    """Run the benchmark and print a report."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--words",
+        type=int,
+        default=60000,
+        help="document size",
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="timed runs")
+    args = parser.parse_args()
+
+    texts = load_texts()
+    parts = []
+    words = 0
+    while words < args.words:
+        for text in texts:
+            parts.append(text)
+            words += len(text.split())
+    extractor = yake.KeywordExtractor(lan="en")
+    dc = DataCore("\n\n".join(parts), extractor.stopword_set)
+    print(f"{dc.number_of_words} words, {len(dc.terms)} terms\n")
+
+    snapshot = dc.to_bytes()
+    pickled = pickle.dumps(dc, protocol=pickle.HIGHEST_PROTOCOL)
+    timings = {
+        "snapshot": (
+            best_time(dc.to_bytes, args.repeat),
+            best_time(lambda: DataCore.from_bytes(snapshot), args.repeat),
+            len(snapshot),
+        ),
+        "pickle": (
+            best_time(
+                lambda: pickle.dumps(dc, protocol=pickle.HIGHEST_PROTOCOL),
+                args.repeat,
+            ),
+            best_time(lambda: pickle.loads(pickled), args.repeat),
+            len(pickled),
+        ),
+    }
+    for name, (save, load, size) in timings.items():
+        mb = size / 1e6
+        print(f"{name:>8}: save {save:.3f}s, load {load:.3f}s, {mb:.1f} MB")
+
+    if timings["snapshot"][1] > timings["pickle"][1]:
+        sys.exit("\nloading a snapshot is slower than unpickling")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+Benchmark of the tokenizer backends on the texts of the test suite.
+
+The texts are read from tests/test_yake.py without importing it, then each
+tokenizer splits them repeatedly. The script reports the throughput of each
+backend, how many sentences the fast backend tokenizes exactly like segtok,
+and how many of the top keywords both backends have in common.
+
+Usage:
+    python benchmarks/tokenizers.py [--repeat N]
+"""
+
+import argparse
+import ast
+import os
+import time
+
+import yake
+from yake.data.tokenizers import TOKENIZERS
+
+BENCHMARKS_DIR = os.path.dirname(__file__)
+TESTS_PATH = os.path.join(BENCHMARKS_DIR, "..", "tests", "test_yake.py")
+
+
+def load_texts(path=TESTS_PATH, min_length=100):
+    """
+    Collect the long string literals assigned to text variables in a module.
+
+    Args:
+        path (str): Path of the Python module to read
+        min_length (int): Minimum number of characters of a text
+
+    Returns:
+        list: The distinct texts, in order of appearance
+    """
+    with open(path, encoding="utf-8") as source:
+        tree = ast.parse(source.read())
+
+    texts = []
+    for node in ast.walk(tree):
+        if not isinstance(node, ast.Assign):
+            continue
+        names = [t.id for t in node.targets if isinstance(t, ast.Name)]
+        if not any(name.startswith("text") for name in names):
+            continue
+        assigned = node.value
+        values = [assigned]
+        if isinstance(assigned, ast.List):
+            values = assigned.elts
+        for value in values:
+            if not isinstance(value, ast.Constant):
+                continue
+            text = value.value
+            long_text = isinstance(text, str) and len(text) >= min_length
+            if long_text and text not in texts:
+                texts.append(text)
+    return texts
+
+
+def tokenize_all(tokenizer, texts):
+    """Split every text into tokenized sentences."""
+    tokenized = []
+    for text in texts:
+        sentences = tokenizer.split_sentences(text)
+        tokenized.append([tokenizer.tokenize(s) for s in sentences])
+    return tokenized
+
+
+def main():
+    """Run the benchmark and print a report."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=200,
+        help="passes over the texts",
+    )
+    args = parser.parse_args()
+
+    texts = load_texts()
+    characters = sum(len(text) for text in texts) * args.repeat
+    print(f"{len(texts)} texts, {characters} characters per backend\n")
+
+    tokenized = {}
+    for name, tokenizer_class in TOKENIZERS.items():
+        tokenizer = tokenizer_class()
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            tokenized[name] = tokenize_all(tokenizer, texts)
+        elapsed = time.perf_counter() - start
+        rate = characters / elapsed / 1e6
+        print(f"{name:>8}: {elapsed:.3f}s, {rate:.2f} MB/s")
+
+    reference = [s for text in tokenized["segtok"] for s in text]
+    fast = [s for text in tokenized["fast"] for s in text]
+    # Sentences are compared position by position, so duplicates count
+    identical = sum(ours == theirs for ours, theirs in zip(reference, fast))
+    print(f"\nsentences identical to segtok: {identical}/{len(reference)}")
+
+    overlap = []
+    for text in texts:
+        keywords = {}
+        for name in TOKENIZERS:
+            extractor = yake.KeywordExtractor(lan="en", top=10, tokenizer=name)
+            keywords[name] = {kw for kw, _ in extractor.extract_keywords(text)}
+        overlap.append(len(keywords["segtok"] & keywords["fast"]) / 10)
+    print(f"top-10 keyword overlap: {sum(overlap) / len(overlap):.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,11 +3,13 @@
 
 """Tests for yake package."""
 
-
+import pytest
 from click.testing import CliRunner
 
 import yake
 from yake.core.highlight import TextHighlighter
+from yake.core.Levenshtein import Levenshtein
+from yake.data import DataCore, LRUCache, SQLiteCache
 
 
 def test_phraseless_example():
@@ -198,6 +200,619 @@ def test_n1_EL():
     )
 
 
+def test_extract_keywords_batch():
+    texts = [
+        "Google is acquiring data science community Kaggle. Sources tell us that Google is acquiring Kaggle.",
+        "",
+        "Kaggle is a platform that hosts data science and machine learning competitions.",
+        "Reached by phone, Kaggle co-founder CEO Anthony Goldbloom declined to deny that the acquisition is happening.",
+    ]
+
+    pyake = yake.KeywordExtractor(lan="en", n=2, top=5)
+    expected = [pyake.extract_keywords(text) for text in texts]
+
+    batch = pyake.extract_keywords_batch(texts, workers=2, max_in_flight=2)
+    assert list(batch) == expected
+
+    result = list(pyake.extract_keywords_batch(iter(texts), workers=1))
+    assert result == expected
+
+
+def test_stopwords_registry():
+    yake.stopwords_registry.clear()
+    assert yake.preload(["en", "pt_PT"]) == ["en", "pt"]
+    assert "en" in yake.stopwords_registry
+
+    first = yake.KeywordExtractor(lan="en")
+    second = yake.KeywordExtractor(lan="EN")
+    assert isinstance(first.stopword_set, frozenset)
+    assert first.stopword_set is second.stopword_set
+
+    custom = yake.KeywordExtractor(stopwords=["the", "a"])
+    assert (
+        custom.stopword_set
+        is yake.KeywordExtractor(stopwords={"a", "the"}).stopword_set
+    )
+    assert yake.stopwords_registry.info()["custom"] == 1
+
+    assert yake.stopwords_registry.evict("en")
+    assert "en" not in yake.stopwords_registry
+    assert yake.KeywordExtractor(lan="en").stopword_set == first.stopword_set
+
+
+def test_levenshtein_bounded():
+    assert Levenshtein.distance("kitten", "sitting") == 3
+    assert Levenshtein.bounded_distance("kitten", "sitting", 3) == 3
+    assert Levenshtein.bounded_distance("kitten", "sitting", 2) == 3
+    assert Levenshtein.bounded_distance("data", "data science", 4) == 5
+
+    pairs = [
+        ("google cloud", "google cloud platform"),
+        ("kaggle", "kaggles"),
+        ("machine learning", "machine learnings"),
+        ("data science", "science"),
+        ("", "data"),
+    ]
+    for seq1, seq2 in pairs:
+        for threshold in (0.5, 0.8, 0.9):
+            assert Levenshtein.within(seq1, seq2, threshold) == (
+                Levenshtein.ratio(seq1, seq2) > threshold
+            )
+
+
+def test_levenshtein_bitparallel():
+    long_text = "data science and machine learning competitions " * 2
+    pairs = [
+        ("kitten", "sitting", 3),
+        ("", "abc", 3),
+        ("google cloud platform", "google cloud", 9),
+        ("conta-me histórias", "histórias", 9),
+        (long_text, long_text.replace("data", "big data"), 8),
+    ]
+    for seq1, seq2, expected in pairs:
+        assert Levenshtein.bitparallel_distance(seq1, seq2) == expected
+        for backend in ("auto", "bitparallel", "dp"):
+            assert Levenshtein.distance(seq1, seq2, backend) == expected
+            bounded = Levenshtein.bounded_distance(seq1, seq2, 10, backend)
+            assert bounded == expected
+
+    # The backend can be chosen for the deduplication of the extractor
+    text_content = "Google is acquiring data science community Kaggle. Sources tell us that Google is acquiring Kaggle, a platform that hosts data science and machine learning competitions."
+    for dedup_func in ("seqm", "levs"):
+        reference = yake.KeywordExtractor(dedup_func=dedup_func)
+        expected = reference.extract_keywords(text_content)
+        for backend in ("bitparallel", "dp"):
+            kw_extractor = yake.KeywordExtractor(
+                dedup_func=dedup_func, levenshtein_backend=backend
+            )
+            assert kw_extractor.extract_keywords(text_content) == expected
+    with pytest.raises(ValueError):
+        yake.KeywordExtractor(levenshtein_backend="matrix")
+
+
+def test_cooccurrence_graph():
+    text_content = "Google is acquiring Kaggle. Kaggle hosts data science competitions and Google hosts data science events."
+
+    pyake = yake.KeywordExtractor(lan="en")
+    dc = DataCore(
+        text=text_content,
+        stopword_set=pyake.stopword_set,
+        config={"windows_size": 1, "n": 3},
+    )
+    google = dc.terms["google"].id
+    data = dc.terms["data"].id
+    science = dc.terms["science"].id
+
+    assert dc.g.number_of_nodes() == len(dc.terms)
+    assert dc.g.has_edge(data, science)
+    assert not dc.g.has_edge(science, data)
+    assert dc.g.weight(data, science) == 2.0
+    assert dc.g.out_degree(google) == 2
+    assert dc.g.out_weight(google) == 2.0
+    assert dc.g.in_weight(science) == 2.0
+    assert dc.terms["google"].sentence_ids == [0, 1]
+    assert dc.terms["google"].median_sentence() == 0.5
+
+    graph = dc.g.to_networkx()
+    assert graph.number_of_edges() == dc.g.number_of_edges()
+    assert graph[data][science]["tf"] == 2.0
+
+
+def test_slotted_terms():
+    text_content = "Google is acquiring Kaggle. Kaggle hosts data science competitions."
+
+    pyake = yake.KeywordExtractor(lan="en")
+    dc = DataCore(text=text_content, stopword_set=pyake.stopword_set)
+    term = dc.terms["kaggle"]
+    cand = dc.candidates["data science"]
+
+    assert not hasattr(term, "__dict__")
+    assert not hasattr(cand, "__dict__")
+    assert term["tf"] == term.tf == 2.0
+    assert term.get_metric("wrel") == 1.0
+    term.set_metric("custom", 0.5)
+    assert term.get("custom") == 0.5
+    assert term.get("missing", 0.0) == 0.0
+    assert cand["tf"] == 1.0
+
+
+def test_vectorized_scoring():
+    text_content = """
+    Google is acquiring data science community Kaggle. Sources tell us that Google is acquiring Kaggle, a platform that hosts data science and machine learning competitions. Details about the transaction remain somewhat vague, but given that Google is hosting its Cloud Next conference in San Francisco this week, the official announcement could come as early as tomorrow. Reached by phone, Kaggle co-founder CEO Anthony Goldbloom declined to deny that the acquisition is happening."""
+
+    for features in (None, ["wrel", "wfreq", "wpos"]):
+        scalar = yake.KeywordExtractor(lan="en", n=3, features=features)
+        vectorized = yake.KeywordExtractor(
+            lan="en", n=3, features=features, vectorized=True
+        )
+
+        expected = scalar.extract_keywords(text_content)
+        result = vectorized.extract_keywords(text_content)
+        assert [kw for kw, _ in result] == [kw for kw, _ in expected]
+        scores = [h for _, h in expected]
+        assert [h for _, h in result] == pytest.approx(scores)
+
+    # The features are returned as arrays, only the score is set on the terms
+    stopwords = yake.KeywordExtractor(lan="en").stopword_set
+    scalar = DataCore(text_content, stopwords, {"windows_size": 1, "n": 3})
+    assert scalar.build_single_terms_features() is None
+    vectorized = DataCore(text_content, stopwords, {"windows_size": 1, "n": 3})
+    arrays = vectorized.build_single_terms_features(vectorized=True)
+    for index, (key, term) in enumerate(scalar.terms.items()):
+        assert vectorized.terms[key].h == pytest.approx(term.h)
+        assert vectorized.terms[key].wfreq == 0.0
+        for name in ("wrel", "wfreq", "wspread", "wcase", "wpos", "h"):
+            assert arrays[name][index] == pytest.approx(term[name])
+
+
+def test_array_engine():
+    text_content = "The data science community of Kaggle. Kaggle hosts data science competitions, and the machine learning community of data science."
+    stopwords = yake.KeywordExtractor(lan="en").stopword_set
+
+    for windows_size in (1, 3):
+        config = {"windows_size": windows_size, "n": 3}
+        expected = DataCore(text_content, stopwords, config)
+        array_config = {**config, "engine": "array"}
+        result = DataCore(text_content, stopwords, array_config)
+
+        assert list(result.terms) == list(expected.terms)
+        for key, term in expected.terms.items():
+            assert result.terms[key].occurs == term.occurs
+            assert result.terms[key].tf_n == term.tf_n
+        assert sorted(result.g.edges()) == sorted(expected.g.edges())
+        assert list(result.candidates) == list(expected.candidates)
+        for key, cand in expected.candidates.items():
+            assert result.candidates[key].tags == cand.tags
+            assert result.candidates[key].tf == cand.tf
+        assert result.freq_ns == expected.freq_ns
+
+    kw_extractor = yake.KeywordExtractor(lan="en", n=3, window_size=2, engine="array")
+    reference = yake.KeywordExtractor(lan="en", n=3, window_size=2)
+    expected = reference.extract_keywords(text_content)
+    assert kw_extractor.extract_keywords(text_content) == expected
+
+    # Texts whose blocks hold a single word have no longer n-grams
+    for single_words in ("Hello world. Foo.", "Data, science, Kaggle."):
+        expected = reference.extract_keywords(single_words)
+        assert kw_extractor.extract_keywords(single_words) == expected
+
+
+def test_rank_candidates():
+    text_content = "The data science community of Kaggle. Kaggle hosts data science competitions, and the machine learning community of data science."
+
+    for dedup_lim in (0.9, 1.0):
+        kw_extractor = yake.KeywordExtractor(lan="en", n=2, dedup_lim=dedup_lim)
+        full = kw_extractor.extract_keywords(text_content)
+        for top in (1, 3, 5):
+            kw_extractor.config["top"] = top
+            assert kw_extractor.extract_keywords(text_content) == full[:top]
+
+    # Candidates with equal scores keep their order of appearance
+    config = {"windows_size": 1, "n": 2}
+    dc = DataCore(text_content, kw_extractor.stopword_set, config)
+    dc.build_single_terms_features()
+    candidates = dc.build_mult_terms_features()
+    expected = sorted(candidates, key=lambda c: c.h)
+    kw_extractor.config["top"] = len(candidates)
+    assert kw_extractor._rank_candidates(candidates) == [
+        (cand.unique_kw, cand.h) for cand in expected
+    ]
+
+
+def test_pruned_scoring():
+    text_content = """
+    Google is acquiring data science community Kaggle. Sources tell us that Google is acquiring Kaggle, a platform that hosts data science and machine learning competitions. Details about the transaction remain somewhat vague, but given that Google is hosting its Cloud Next conference in San Francisco this week, the official announcement could come as early as tomorrow. Reached by phone, Kaggle co-founder CEO Anthony Goldbloom declined to deny that the acquisition is happening."""
+
+    for dedup_lim in (0.3, 0.9, 1.0):
+        for top in (1, 5, 20):
+            options = {"lan": "en", "dedup_lim": dedup_lim, "top": top}
+            expected = yake.KeywordExtractor(**options)
+            pruned = yake.KeywordExtractor(**options, prune=True)
+            keywords = expected.extract_keywords(text_content)
+            assert pruned.extract_keywords(text_content) == keywords
+
+    config = {"windows_size": 1, "n": 3}
+    dc = DataCore(text_content, expected.stopword_set, config)
+    dc.build_single_terms_features()
+    scored = dc.build_mult_terms_features(prune=5)
+    assert 5 <= len(scored) < len(dc.score_pruned_candidates())
+    assert dc.pruning_threshold is None
+
+
+def test_token_memoization():
+    stopwords = yake.KeywordExtractor(lan="en").stopword_set
+    dc = DataCore("Data and more Data. The data sets.", stopwords)
+
+    assert dc.get_tag("Data", 0) == "p"
+    assert dc.get_tag("Data", 3) == "n"
+    assert dc.get_tag("Data", 5) == "n"
+    assert dc.get_term("Data") is dc.get_term("data")
+    assert dc.get_term("sets") is dc.get_term("set")
+    assert dc.get_term("The").stopword
+    assert dc.get_term("a-b").stopword
+    assert ("Data", True) in dc._state["caches"]["tags"]
+
+
+def test_token_cache():
+    footer = "Sent from my phone. Please consider the environment before printing."
+    texts = [
+        f"Kaggle hosts data science competitions. {footer}",
+        f"Google acquired Kaggle. {footer}",
+    ]
+
+    kw_extractor = yake.KeywordExtractor(lan="en", token_cache_size=3)
+    results = [kw_extractor.extract_keywords(text) for text in texts]
+
+    assert results == [
+        yake.KeywordExtractor(lan="en").extract_keywords(text) for text in texts
+    ]
+    assert kw_extractor.token_cache.info() == {
+        "hits": 2,
+        "misses": 4,
+        "evictions": 1,
+        "size": 3,
+        "maxsize": 3,
+        "nbytes": 0,
+        "maxbytes": None,
+    }
+
+
+def test_tokenizers():
+    from yake.data.tokenizers import FastTokenizer, SegtokTokenizer
+
+    text_content = (
+        "Kaggle's co-founder didn't say. It costs 1,000.50 dollars in the U.S. today!"
+    )
+    fast = FastTokenizer()
+    expected = SegtokTokenizer()
+    assert fast.split_sentences(text_content) == expected.split_sentences(text_content)
+    assert [fast.tokenize(s) for s in fast.split_sentences(text_content)] == [
+        expected.tokenize(s) for s in expected.split_sentences(text_content)
+    ]
+
+    kw_extractor = yake.KeywordExtractor(lan="en", tokenizer="fast")
+    assert kw_extractor.extract_keywords(text_content) == yake.KeywordExtractor(
+        lan="en"
+    ).extract_keywords(text_content)
+
+    with pytest.raises(ValueError):
+        yake.KeywordExtractor(lan="en", tokenizer="unknown").extract_keywords("Text.")
+
+
+def test_extract_keywords_from_tokens():
+    from yake.data.utils import pre_filter, tokenize_sentences
+
+    text_content = "Google is acquiring data science community Kaggle. Sources tell us that Google is acquiring Kaggle, a platform that hosts data science and machine learning competitions."
+    sentences = tokenize_sentences(pre_filter(text_content))
+
+    for engine in ("object", "array"):
+        kw_extractor = yake.KeywordExtractor(lan="en", engine=engine)
+        expected = kw_extractor.extract_keywords(text_content)
+        assert kw_extractor.extract_keywords_from_tokens(sentences) == expected
+        assert (
+            kw_extractor.extract_keywords_from_tokens([[]] + sentences + [[]])
+            == expected
+        )
+
+        # Sentences can also be added in several batches
+        dc = DataCore(None, kw_extractor.stopword_set, kw_extractor._core_config())
+        dc.add_sentences(sentences[:1])
+        dc.add_sentences(sentences[1:])
+        assert kw_extractor._extract_from_core(dc) == expected
+
+
+def test_preprocess():
+    from yake.data.utils import pre_filter, preprocess
+
+    text_content = "Data science\nis fun\n\tKaggle hosts competitions\nMachine learning"
+    assert pre_filter(text_content) == (
+        "\n\nData science is fun\n\n Kaggle hosts competitions\n\nMachine learning"
+    )
+    assert preprocess(text_content, keep_paragraphs=False) == pre_filter(
+        text_content.replace("\n", " ")
+    )
+
+    stopwords = yake.KeywordExtractor(lan="en").stopword_set
+    dc = DataCore(text_content, stopwords)
+    assert dc.number_of_sentences == 3
+    assert set(dc.timings) == {"preprocess", "tokenize", "build"}
+    assert all(seconds >= 0 for seconds in dc.timings.values())
+
+    flat = DataCore(text_content, stopwords, {"keep_paragraphs": False})
+    assert flat.number_of_sentences == 1
+
+
+def test_stream():
+    text_content = """
+    Google is acquiring data science community Kaggle. Sources tell us that Google is acquiring Kaggle, a platform that hosts data science and machine learning competitions.
+    Details about the transaction remain somewhat vague, but given that Google is hosting its Cloud Next conference in San Francisco this week, the official announcement could come as early as tomorrow."""
+
+    for paragraphs in (False, True):
+        kw_extractor = yake.KeywordExtractor(lan="en", paragraphs=paragraphs)
+        stream = kw_extractor.stream()
+        for start in range(0, len(text_content), 10):
+            stream.feed(text_content[start : start + 10])
+
+        assert stream.finalize() == kw_extractor.extract_keywords(text_content)
+        assert stream.data_core.number_of_sentences == 3
+        assert stream.data_core.sentences_str == []
+
+    with pytest.raises(RuntimeError):
+        stream.feed("More text.")
+
+
+def test_stream_sentence_boundaries():
+    # Boundaries that depend on the following text, such as inside brackets
+    text_content = """Sources tell us that Google is acquiring Kaggle, a platform that hosts data science and machine learning competitions. Details about the transaction remain somewhat vague, but given that Google is hosting its Cloud Next conference in San Francisco this week, the official announcement could come as early as tomorrow.
+
+Reached by phone, Kaggle co-founder CEO Anthony Goldbloom declined to deny that the acquisition is happening. Google itself declined 'to comment on rumors'. Kaggle, which has about half a million data scientists on its platform, was founded by Goldbloom  and Ben Hamner in 2010.
+Our paper was presented at ECIR 2018 (Grenoble, France. March 26 - 29). Keyword extraction research is fun. Keyword extraction with YAKE works.
+
+According to Crunchbase, Kaggle raised $12.5 million (though PitchBook says it's $12.75) since its   launch in 2010. Investors in Kaggle include Index Ventures, SV Angel, Max Levchin, Naval Ravikant, Google chief economist Hal Varian, Khosla Ventures and Yuri Milner"""
+
+    for paragraphs in (False, True):
+        kw_extractor = yake.KeywordExtractor(lan="en", paragraphs=paragraphs)
+        expected = kw_extractor.extract_keywords(text_content)
+        for chunk_size in (1, 7, 60, 256):
+            stream = kw_extractor.stream()
+            for start in range(0, len(text_content), chunk_size):
+                stream.feed(text_content[start : start + chunk_size])
+            assert stream.finalize() == expected
+
+
+def test_extract_keywords_from_file(tmp_path):
+    text_content = "Conta-me Histórias é um projeto.\r\nO Arquivo.pt e a Universidade da Beira Interior apresentam o projeto Conta-me Histórias.\r\n"
+    path = tmp_path / "document.txt"
+    path.write_bytes(text_content.encode("utf-8"))
+
+    kw_extractor = yake.KeywordExtractor(lan="pt")
+    with open(path, encoding="utf-8") as f:
+        expected = kw_extractor.extract_keywords(f.read())
+
+    assert kw_extractor.extract_keywords_from_file(path, chunk_size=7) == expected
+    assert kw_extractor.extract_keywords_from_file(path) == expected
+
+    from yake.cli import keywords
+
+    result = CliRunner().invoke(keywords, ["-i", str(path), "-l", "pt", "-t", "3"])
+    assert result.exit_code == 0
+    lines = [line.strip() for line in result.output.splitlines()]
+    assert lines[2:5] == [kw for kw, _ in expected[:3]]
+
+    # Sentence boundaries depending on the following text split across chunks
+    text_content = "Our paper was presented at ECIR 2018 (Grenoble, France. March 26 - 29).\n\nKeyword extraction research is fun. Keyword extraction with YAKE works.\n"
+    path.write_bytes(text_content.encode("utf-8"))
+    kw_extractor = yake.KeywordExtractor(lan="en")
+    expected = kw_extractor.extract_keywords(text_content)
+    for chunk_size in (7, 60):
+        assert kw_extractor.extract_keywords_from_file(path, chunk_size=chunk_size) == (
+            expected
+        )
+
+    # Files are keyed by their bytes, which match the text when encoded in UTF-8
+    kw_extractor = yake.KeywordExtractor(lan="en", result_cache_size=10)
+    assert kw_extractor.extract_keywords(text_content) == expected
+    assert kw_extractor.extract_keywords_from_file(path) == expected
+    assert kw_extractor.result_cache.info()["hits"] == 1
+
+    path.write_bytes(b"")
+    assert kw_extractor.extract_keywords_from_file(path) == []
+
+
+def test_extract_keywords_corpus():
+    texts = [
+        "Google is acquiring data science community Kaggle.",
+        "Sources tell us that Google is acquiring Kaggle, a platform that hosts data science and machine learning competitions.",
+        "Details about the transaction remain somewhat vague.",
+        "Kaggle has a large community of data scientists.",
+        "Google is hosting its Cloud Next conference in San Francisco this week.",
+    ]
+
+    kw_extractor = yake.KeywordExtractor(lan="en", n=2)
+    expected = kw_extractor.extract_keywords(" ".join(texts))
+    assert kw_extractor.extract_keywords_corpus(texts, workers=1) == expected
+    assert (
+        kw_extractor.extract_keywords_corpus(texts, workers=2, chunksize=2) == expected
+    )
+
+    # Merging documents gives the statistics of the texts processed in order
+    merged = DataCore(text=texts[0], stopword_set=kw_extractor.stopword_set)
+    merged.merge(
+        DataCore(text=" ".join(texts[1:]), stopword_set=kw_extractor.stopword_set)
+    )
+    single = DataCore(text=" ".join(texts), stopword_set=kw_extractor.stopword_set)
+    assert merged.number_of_sentences == single.number_of_sentences
+    assert list(merged.terms) == list(single.terms)
+    assert list(merged.candidates) == list(single.candidates)
+    assert list(merged.g.edges()) == list(single.g.edges())
+    for term in single.terms.values():
+        assert merged.terms[term.unique_term].occurs == term.occurs
+
+    # Merging a snapshot gives the same statistics as merging the document
+    from_snapshot = DataCore(text=texts[0], stopword_set=kw_extractor.stopword_set)
+    from_snapshot.merge_bytes(
+        DataCore(
+            text=" ".join(texts[1:]), stopword_set=kw_extractor.stopword_set
+        ).to_bytes()
+    )
+    for dc in (merged, from_snapshot):
+        dc.timings.update(preprocess=0.0, tokenize=0.0, build=0.0)
+    assert from_snapshot.to_bytes() == merged.to_bytes()
+
+
+def test_extract_keywords_sharded():
+    text_content = """
+    Google is acquiring data science community Kaggle. Sources tell us that Google is acquiring Kaggle, a platform that hosts data science and machine learning competitions. Details about the transaction remain somewhat vague, but given that Google is hosting its Cloud Next conference in San Francisco this week, the official announcement could come as early as tomorrow. Reached by phone, Kaggle co-founder CEO Anthony Goldbloom declined to deny that the acquisition is happening. Google itself declined 'to comment on rumors'."""
+
+    kw_extractor = yake.KeywordExtractor(lan="en")
+    expected = kw_extractor.extract_keywords(text_content)
+    assert kw_extractor.extract_keywords_sharded(text_content, workers=1) == expected
+    assert (
+        kw_extractor.extract_keywords_sharded(text_content, workers=2, shard_size=2)
+        == expected
+    )
+    assert kw_extractor.extract_keywords_sharded("", workers=2) == []
+
+
+def test_data_core_serialization():
+    text_content = """
+    Google is acquiring data science community Kaggle. Sources tell us that Google is acquiring Kaggle, a platform that hosts data science and machine learning competitions.
+    Details about the transaction remain somewhat vague, but given that Google is hosting its Cloud Next conference in San Francisco this week, the official announcement could come as early as tomorrow."""
+
+    kw_extractor = yake.KeywordExtractor(lan="en")
+    dc = DataCore(
+        text=text_content,
+        stopword_set=kw_extractor.stopword_set,
+        config=kw_extractor._core_config(),
+    )
+    snapshot = dc.to_bytes()
+    loaded = DataCore.from_bytes(snapshot)
+
+    assert loaded.stopword_set == dc.stopword_set
+    assert loaded.sentences_str == dc.sentences_str
+    assert list(loaded.g.edges()) == list(dc.g.edges())
+    assert [(t.unique_term, t.tf, t.occurs) for t in loaded.terms.values()] == [
+        (t.unique_term, t.tf, t.occurs) for t in dc.terms.values()
+    ]
+    assert [(c.kw, c.tf, c.tags) for c in loaded.candidates.values()] == [
+        (c.kw, c.tf, c.tags) for c in dc.candidates.values()
+    ]
+    assert kw_extractor._extract_from_core(loaded) == kw_extractor._extract_from_core(
+        dc
+    )
+
+    # Scores are kept, and snapshots of a loaded document are identical
+    assert DataCore.from_bytes(loaded.to_bytes()).to_bytes() == loaded.to_bytes()
+
+    with pytest.raises(ValueError):
+        DataCore.from_bytes(b"not a snapshot")
+    with pytest.raises(ValueError):
+        DataCore.from_bytes(snapshot[:6] + b"\xff\xff" + snapshot[8:])
+
+
+def test_result_cache():
+    texts = [
+        "Google is acquiring data science community Kaggle.",
+        "Sources tell us that Google is acquiring Kaggle, a platform that hosts data science and machine learning competitions.",
+    ]
+    expected = [yake.KeywordExtractor(lan="en").extract_keywords(t) for t in texts]
+
+    kw_extractor = yake.KeywordExtractor(lan="en", result_cache_size=2)
+    for _ in range(3):
+        assert [kw_extractor.extract_keywords(t) for t in texts] == expected
+    info = kw_extractor.result_cache.info()
+    assert (info["hits"], info["misses"], info["size"]) == (4, 2, 2)
+
+    # Returned lists can be modified without altering the cache
+    kw_extractor.extract_keywords(texts[0]).clear()
+    assert kw_extractor.extract_keywords(texts[0]) == expected[0]
+
+    # Changes to the configuration are part of the key
+    kw_extractor.config["top"] = 2
+    assert kw_extractor.extract_keywords(texts[1]) == expected[1][:2]
+    kw_extractor.config["top"] = 20
+
+    # The memory bound keeps only the results that fit
+    kw_extractor = yake.KeywordExtractor(
+        lan="en", result_cache_size=10, result_cache_bytes=4000
+    )
+    for text in texts:
+        kw_extractor.extract_keywords(text)
+    info = kw_extractor.result_cache.info()
+    assert info["size"] == 1 and info["evictions"] == 1
+    assert 0 < info["nbytes"] <= 4000
+
+    # Extractors sharing a cache only reuse results of the same configuration
+    shared = LRUCache(10)
+    top_5 = yake.KeywordExtractor(lan="en", top=5, result_cache=shared)
+    top_3 = yake.KeywordExtractor(lan="en", top=3, result_cache=shared)
+    assert top_5.config_fingerprint() != top_3.config_fingerprint()
+    assert (
+        yake.KeywordExtractor(lan="en", vectorized=True).config_fingerprint()
+        != yake.KeywordExtractor(lan="en").config_fingerprint()
+    )
+    assert len(top_5.extract_keywords(texts[1])) == 5
+    assert len(top_3.extract_keywords(texts[1])) == 3
+    assert shared.info()["misses"] == 2
+
+    # Batch workers are only sent the texts missing from the parent cache
+    kw_extractor = yake.KeywordExtractor(lan="en", result_cache_size=10)
+    for _ in range(2):
+        result = kw_extractor.extract_keywords_batch(texts + [""], workers=2)
+        assert list(result) == expected + [[]]
+    info = kw_extractor.result_cache.info()
+    assert (info["hits"], info["misses"], info["size"]) == (2, 2, 2)
+
+
+def test_sqlite_cache(tmp_path):
+    texts = [
+        "Google is acquiring data science community Kaggle.",
+        "Sources tell us that Google is acquiring Kaggle, a platform that hosts data science and machine learning competitions.",
+        "Details about the transaction remain somewhat vague.",
+    ]
+    expected = [yake.KeywordExtractor(lan="en").extract_keywords(t) for t in texts]
+    path = str(tmp_path / "results.db")
+
+    # Results are kept across extractors, connections and worker processes
+    with SQLiteCache(path, batch_size=2) as cache:
+        kw_extractor = yake.KeywordExtractor(lan="en", result_cache=cache)
+        assert list(kw_extractor.extract_keywords_batch(texts, workers=2)) == expected
+        info = cache.info()
+        assert (info["hits"], info["misses"], info["size"]) == (0, 3, 3)
+    with SQLiteCache(path) as cache:
+        kw_extractor = yake.KeywordExtractor(lan="en", result_cache=cache)
+        assert [kw_extractor.extract_keywords(t) for t in texts] == expected
+        assert list(kw_extractor.extract_keywords_batch(texts, workers=2)) == expected
+        assert list(kw_extractor.extract_keywords_batch(texts, workers=1)) == expected
+        info = cache.info()
+        assert (info["hits"], info["misses"], info["size"]) == (9, 0, 3)
+
+    # The oldest entries are evicted beyond the limits, expired ones are ignored
+    cache = SQLiteCache(path, max_entries=2)
+    cache.put(("other", "digest"), (("google", 0.5),))
+    info = cache.info()
+    assert (info["size"], info["evictions"]) == (2, 2)
+    assert cache.get(("other", "digest")) == (("google", 0.5),)
+    cache.ttl = -1
+    assert cache.get(("other", "digest")) is None
+    cache.clear()
+    cache.close()
+
+    # The command line shares the cache with files and direct text input
+    from yake.cli import keywords
+
+    document = tmp_path / "document.txt"
+    document.write_text(texts[1], encoding="utf-8")
+    for args in (["-i", str(document)], ["-ti", texts[1]]):
+        result = CliRunner().invoke(keywords, args + ["--cache", path, "-t", "20"])
+        assert result.exit_code == 0
+    with SQLiteCache(path) as cache:
+        assert cache.info()["size"] == 1
+        kw_extractor = yake.KeywordExtractor(lan="en", result_cache=cache)
+        assert kw_extractor.extract_keywords(texts[1]) == expected[1]
+        assert cache.hits == 1
+
+
 test_phraseless_example()
 test_null_and_blank_example()
 test_n1_EN()
@@ -6,4 +6,8 @@ __author__ = """vitordouzi"""
 __email__ = "vitordouzi@gmail.com"
 __version__ = "0.6.0"
 
+from yake.core.stopwords import preload as preload
+from yake.core.stopwords import registry as stopwords_registry
 from yake.core.yake import KeywordExtractor as KeywordExtractor
+
+__all__ = ["KeywordExtractor", "preload", "stopwords_registry"]
@@ -4,6 +4,7 @@ import sys
 import click
 from tabulate import tabulate
 import yake
+from yake.data import SQLiteCache
 
 
 @click.command()
@@ -61,13 +62,23 @@ import yake
     default=10,
     type=int,
 )
+@click.option(
+    "--cache",
+    help="SQLite file caching the results across runs",
+    required=False,
+)
+@click.option(
+    "--cache_ttl",
+    help="Time to live of the cached results, in seconds",
+    default=None,
+    type=float,
+)
 @click.option(
     "-v",
     "--verbose",
     count=True,
     help="Verbose output",
 )
-@click.pass_context
 def keywords(
     text_input,
     input_file,
@@ -77,20 +88,30 @@ def keywords(
     dedup_lim,
     window_size,
     top,
+    cache,
+    cache_ttl,
     verbose,
 ):
     """Extract keywords using YAKE!"""
 
-    def run_yake(text_content):
+    def run_yake(extract):
+        result_cache = None
+        if cache:
+            result_cache = SQLiteCache(cache, ttl=cache_ttl)
         extractor = yake.KeywordExtractor(
             lan=language,
             n=ngram_size,
-            dedupLim=dedup_lim,
-            dedupFunc=dedup_func,
-            windowsSize=window_size,
+            dedup_lim=dedup_lim,
+            dedup_func=dedup_func,
+            window_size=window_size,
             top=top,
+            result_cache=result_cache,
         )
-        results = extractor.extract_keywords(text_content)
+        try:
+            results = extract(extractor)
+        finally:
+            if result_cache is not None:
+                result_cache.close()
 
         table = [
             {"keyword": kw[0], "score": kw[1]} if verbose else {"keyword": kw[0]}
@@ -106,11 +127,11 @@ def keywords(
         sys.exit(1)
 
     if text_input:
-        run_yake(text_input)
+        run_yake(lambda extractor: extractor.extract_keywords(text_input))
     else:
         try:
-            with open(input_file, encoding="utf-8") as f:
-                run_yake(f.read())
+            # Files are memory-mapped and processed incrementally
+            run_yake(lambda ex: ex.extract_keywords_from_file(input_file))
         except FileNotFoundError:
             print(f"File '{input_file}' not found.")
             sys.exit(1)
@@ -9,6 +9,13 @@ and identifying potential matches with slight variations.
 
 import numpy as np
 
+# Longest string handled by the bit-parallel algorithm, one machine word
+BITPARALLEL_MAX_LEN = 64
+
+# Distance backends: bit-parallel up to BITPARALLEL_MAX_LEN characters then
+# dynamic programming, always bit-parallel, or always dynamic programming
+BACKENDS = ("auto", "bitparallel", "dp")
+
 
 class Levenshtein:
     """
@@ -43,7 +50,33 @@ class Levenshtein:
         return 1 - float(distance) / float(str_length)
 
     @staticmethod
-    def ratio(seq1: str, seq2: str) -> float:
+    def use_bitparallel(seq1: str, seq2: str, backend: str = "auto") -> bool:
+        """
+        Check whether the bit-parallel algorithm is used for two strings.
+
+        Args:
+            seq1 (str): The first string to compare.
+            seq2 (str): The second string to compare.
+            backend (str): One of BACKENDS (default: "auto").
+
+        Returns:
+            bool: True for the bit-parallel algorithm, False for dynamic
+                  programming.
+
+        Raises:
+            ValueError: If the backend is unknown.
+        """
+        if backend == "auto":
+            return min(len(seq1), len(seq2)) <= BITPARALLEL_MAX_LEN
+        if backend not in BACKENDS:
+            raise ValueError(
+                f"Unknown Levenshtein backend {backend!r}, "
+                f"expected one of {BACKENDS}"
+            )
+        return backend == "bitparallel"
+
+    @staticmethod
+    def ratio(seq1: str, seq2: str, backend: str = "auto") -> float:
         """
         Compute the similarity ratio between two strings.
 
@@ -54,17 +87,193 @@ class Levenshtein:
         Args:
             seq1 (str): The first string to compare.
             seq2 (str): The second string to compare.
+            backend (str): Distance backend, one of BACKENDS (default: "auto").
 
         Returns:
             float: The similarity ratio between the two strings, ranging from 0.0
                   (completely different) to 1.0 (identical).
         """
-        str_distance = Levenshtein.distance(seq1, seq2)
+        str_distance = Levenshtein.distance(seq1, seq2, backend)
         str_length = max(len(seq1), len(seq2))
         return Levenshtein.__ratio(str_distance, str_length)
 
     @staticmethod
-    def distance(seq1: str, seq2: str) -> int:
+    def within(
+        seq1: str,
+        seq2: str,
+        threshold: float,
+        backend: str = "auto",
+    ) -> bool:
+        """
+        Check whether the similarity ratio of two strings exceeds a threshold.
+
+        This is equivalent to ``Levenshtein.ratio(seq1, seq2) > threshold`` but
+        only computes as much of the edit distance as needed: the threshold is
+        turned into a maximum number of edits, pairs whose length difference
+        already exceeds it are rejected immediately, and the remaining ones are
+        compared with a banded computation that stops as soon as the bound can
+        no longer be met.
+
+        Args:
+            seq1 (str): The first string to compare.
+            seq2 (str): The second string to compare.
+            threshold (float): Similarity ratio that must be exceeded.
+            backend (str): Distance backend, one of BACKENDS (default: "auto").
+
+        Returns:
+            bool: True if the similarity ratio is strictly greater than the
+                  threshold.
+        """
+        str_length = max(len(seq1), len(seq2))
+        if str_length == 0:
+            return 1.0 > threshold
+
+        # Largest number of edits that still gives a ratio above the threshold,
+        # adjusted so that it agrees exactly with the floating point ratio
+        max_edits = int((1.0 - threshold) * str_length)
+        max_edits = min(str_length, max(0, max_edits))
+        while max_edits >= 0 and not (
+            Levenshtein.__ratio(max_edits, str_length) > threshold
+        ):
+            max_edits -= 1
+        if max_edits < 0:
+            return False
+        while max_edits < str_length and (
+            Levenshtein.__ratio(max_edits + 1, str_length) > threshold
+        ):
+            max_edits += 1
+
+        distance = Levenshtein.bounded_distance(seq1, seq2, max_edits, backend)
+        return distance <= max_edits
+
+    @staticmethod
+    def bounded_distance(
+        seq1: str, seq2: str, max_distance: int, backend: str = "auto"
+    ) -> int:
+        """
+        Calculate the Levenshtein distance between two strings up to a bound.
+
+        Only the cells of the dynamic programming matrix that lie within
+        max_distance of the main diagonal are computed, since any alignment
+        leaving that band needs more than max_distance edits. The computation
+        stops as soon as every cell of a row exceeds the bound.
+
+        Args:
+            seq1 (str): The first string to compare.
+            seq2 (str): The second string to compare.
+            max_distance (int): The largest distance of interest.
+            backend (str): Distance backend, one of BACKENDS (default: "auto").
+
+        Returns:
+            int: The Levenshtein distance if it is at most max_distance,
+                 otherwise max_distance + 1.
+        """
+        # Iterate over the shorter string to keep the rows short
+        if len(seq1) > len(seq2):
+            seq1, seq2 = seq2, seq1
+        size_x = len(seq1)
+        size_y = len(seq2)
+        over_bound = max_distance + 1
+
+        # The length difference alone is a lower bound of the distance
+        if size_y - size_x > max_distance:
+            return over_bound
+        if size_x == 0:
+            return size_y
+
+        # Short strings are faster with the bit-parallel algorithm
+        if Levenshtein.use_bitparallel(seq1, seq2, backend):
+            distance = Levenshtein.bitparallel_distance(seq1, seq2)
+            return min(distance, over_bound)
+
+        # Cells outside the band keep the over_bound value
+        previous = [min(y, over_bound) for y in range(size_y + 1)]
+        for x in range(1, size_x + 1):
+            current = [over_bound] * (size_y + 1)
+            if x <= max_distance:
+                current[0] = x
+            row_min = current[0]
+            char_x = seq1[x - 1]
+
+            band_start = max(1, x - max_distance)
+            band_end = min(size_y, x + max_distance)
+            for y in range(band_start, band_end + 1):
+                # Substitution or match, deletion and insertion, capped
+                value = min(
+                    previous[y - 1] + (0 if char_x == seq2[y - 1] else 1),
+                    previous[y] + 1,
+                    current[y - 1] + 1,
+                    over_bound,
+                )
+                current[y] = value
+                row_min = min(row_min, value)
+
+            # Every alignment crosses this row, so the bound cannot be met
+            if row_min > max_distance:
+                return over_bound
+            previous = current
+
+        return previous[size_y]
+
+    @staticmethod
+    def bitparallel_distance(seq1: str, seq2: str) -> int:
+        """
+        Calculate the Levenshtein distance using bit-vector operations.
+
+        Implements Myers' bit-parallel algorithm, as formulated by Hyyrö for
+        the edit distance. The vertical differences of a whole column of the
+        dynamic programming matrix are encoded as bits of an integer, so each
+        character of the longer string is processed with a constant number of
+        word operations instead of a loop over the shorter string.
+
+        Args:
+            seq1 (str): The first string to compare.
+            seq2 (str): The second string to compare.
+
+        Returns:
+            int: The Levenshtein distance between seq1 and seq2.
+        """
+        # Use the shorter string as the bit-vector pattern
+        if len(seq1) > len(seq2):
+            seq1, seq2 = seq2, seq1
+        size = len(seq1)
+        if size == 0:
+            return len(seq2)
+
+        # Bit mask of the positions of each character in the pattern
+        peq = {}
+        for i, char in enumerate(seq1):
+            peq[char] = peq.get(char, 0) | (1 << i)
+
+        full = (1 << size) - 1
+        last = 1 << (size - 1)
+        vp = full  # Positive vertical differences
+        vn = 0  # Negative vertical differences
+        score = size
+
+        for char in seq2:
+            eq = peq.get(char, 0)
+            xv = eq | vn
+            xh = (((eq & vp) + vp) ^ vp) | eq
+            hp = vn | (~(xh | vp) & full)
+            hn = vp & xh
+
+            # Track the value of the last row
+            if hp & last:
+                score += 1
+            elif hn & last:
+                score -= 1
+
+            # Shift in the first row, which grows by one at each column
+            hp = ((hp << 1) | 1) & full
+            hn = (hn << 1) & full
+            vp = hn | (~(xv | hp) & full)
+            vn = hp & xv
+
+        return score
+
+    @staticmethod
+    def distance(seq1: str, seq2: str, backend: str = "auto") -> int:
         """
         Calculate the Levenshtein distance between two strings.
 
@@ -72,17 +281,23 @@ class Levenshtein:
         the minimum number of single-character edits (insertions, deletions, or
         substitutions) required to change one string into another.
 
-        The algorithm uses dynamic programming with a matrix approach to efficiently
-        compute the minimum edit distance.
+        With the "auto" backend, strings whose shorter side fits in
+        BITPARALLEL_MAX_LEN characters use the bit-parallel algorithm; longer
+        ones fall back to dynamic programming with a matrix approach. The
+        "bitparallel" and "dp" backends always use one of them.
 
         Args:
             seq1 (str): The first string to compare.
             seq2 (str): The second string to compare.
+            backend (str): Distance backend, one of BACKENDS (default: "auto").
 
         Returns:
             int: The Levenshtein distance - the minimum number of edit operations
                  required to transform seq1 into seq2.
         """
+        if Levenshtein.use_bitparallel(seq1, seq2, backend):
+            return Levenshtein.bitparallel_distance(seq1, seq2)
+
         # Create a matrix of size (len(seq1)+1) x (len(seq2)+1)
         size_x = len(seq1) + 1
         size_y = len(seq2) + 1
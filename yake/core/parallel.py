@@ -0,0 +1,397 @@
+"""
+Process pool helpers for parallel keyword extraction.
+
+This module contains the worker-side plumbing used by KeywordExtractor to
+spread extraction work over several processes. Each worker builds its own
+extractor once, in the pool initializer, and reuses it (and its stopword set)
+for every document it receives. Results are streamed back to the caller in
+input order while keeping the number of in-flight documents bounded.
+
+Corpus-level extraction follows a map-reduce scheme instead: workers build the
+statistics of consecutive chunks of texts and the caller merges them, in input
+order, into the statistics of the whole corpus, which is then scored once.
+A single large document is handled the same way, its sentences being split
+into contiguous shards built by different workers. Partial statistics are sent
+back as binary snapshots, which the caller merges straight from their arrays
+instead of unpickling whole documents first.
+"""
+
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from multiprocessing.util import Finalize
+
+from yake.data import DataCore
+from yake.data.utils import gc_paused
+
+# Extractor instance owned by the current worker process
+_WORKER_EXTRACTOR = None
+
+
+def _init_worker(config, stopwords, result_cache=None):
+    """
+    Build the extractor used by this worker process.
+
+    Args:
+        config (dict): Configuration of the parent KeywordExtractor
+        stopwords (set): Stopword set already loaded by the parent
+        result_cache (object, optional): Persistent result cache shared with
+            the parent, opened again by this worker (default: None)
+    """
+    # Imported here to avoid a circular import with the extractor module
+    from .yake import KeywordExtractor
+
+    # In-memory result caches are kept by the parent, not by each worker
+    global _WORKER_EXTRACTOR
+    _WORKER_EXTRACTOR = KeywordExtractor(
+        stopwords=stopwords,
+        result_cache=result_cache,
+        **{**config, "result_cache_size": 0},
+    )
+
+    # Buffered writes are committed when the worker exits, not after each chunk
+    if result_cache is not None:
+        Finalize(None, result_cache.close, exitpriority=10)
+
+
+def _extract_chunk(texts):
+    """
+    Extract keywords from a chunk of texts inside a worker process.
+
+    Args:
+        texts (list): Texts to process
+
+    Returns:
+        tuple: One list of (keyword, score) tuples per input text, and the
+               numbers of cache hits and misses of the chunk
+    """
+    cache = _WORKER_EXTRACTOR.result_cache
+    hits, misses = cache_counters(cache)
+    results = [_WORKER_EXTRACTOR.extract_keywords(text) for text in texts]
+    chunk_hits, chunk_misses = cache_counters(cache)
+    return results, chunk_hits - hits, chunk_misses - misses
+
+
+def _build_chunk(texts):
+    """
+    Build the statistics of a chunk of texts inside a worker process.
+
+    Args:
+        texts (list): Texts to process
+
+    Returns:
+        bytes: Snapshot of the statistics of the texts, one after another
+    """
+    return build_core(_WORKER_EXTRACTOR, texts).to_bytes()
+
+
+def _build_shard(sentences):
+    """
+    Tokenize a shard of sentences and build its statistics in a worker process.
+
+    Args:
+        sentences (list): Consecutive sentences of a document, as strings
+
+    Returns:
+        bytes: Snapshot of the statistics of the sentences
+    """
+    dc = build_core(_WORKER_EXTRACTOR, [])
+    dc.add_split_sentences(sentences)
+    return dc.to_bytes()
+
+
+def build_core(extractor, texts):
+    """
+    Build the statistics of several texts as a single document.
+
+    Args:
+        extractor (KeywordExtractor): Extractor providing the configuration
+        texts (iterable): Texts to process, in order
+
+    Returns:
+        DataCore: Statistics of the texts, one after another
+    """
+    # Only the statistics are needed, sentence tokens are not worth keeping
+    config = extractor._core_config()
+    config["keep_sentences"] = False
+    stopwords = extractor.stopword_set
+    dc = DataCore(text=None, stopword_set=stopwords, config=config)
+    for text in texts:
+        if text:
+            dc.add_text(text)
+    return dc
+
+
+def resolve_workers(workers):
+    """
+    Resolve the number of worker processes to use.
+
+    Args:
+        workers (int, optional): Requested number of workers, None to use
+            every core
+
+    Returns:
+        int: Number of worker processes (at least 1)
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    return max(1, int(workers))
+
+
+def chunked(iterable, size):
+    """
+    Group an iterable into lists of at most size elements.
+
+    Args:
+        iterable (iterable): Items to group
+        size (int): Maximum number of items per group
+
+    Yields:
+        list: Consecutive groups of items
+    """
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def imap_bounded(executor, func, chunks, max_pending):
+    """
+    Map a function over chunks keeping a bounded number of pending tasks.
+
+    Tasks are submitted lazily, so at most max_pending chunks are held in
+    memory at any time. Results are yielded in submission order as soon as
+    the oldest pending task finishes.
+
+    Args:
+        executor (Executor): Executor used to run the tasks
+        func (callable): Function to apply to each chunk
+        chunks (iterable): Chunks of work
+        max_pending (int): Maximum number of submitted but unconsumed tasks
+
+    Yields:
+        Any: The result of func for each chunk, in input order
+    """
+    pending = deque()
+    for chunk in chunks:
+        pending.append(executor.submit(func, chunk))
+        if len(pending) >= max_pending:
+            yield pending.popleft().result()
+
+    # Drain the remaining tasks
+    while pending:
+        yield pending.popleft().result()
+
+
+def lookup_cache(extractor, cache, text):
+    """
+    Look up the keywords of a text in an in-memory result cache.
+
+    Args:
+        extractor (KeywordExtractor): Extractor computing the cache key
+        cache (object): Result cache, or None
+        text (str): Input text
+
+    Returns:
+        tuple: Cache key of the text, or None when it is not looked up, and
+               the cached keywords, or None when they must be extracted
+    """
+    if not text:
+        return None, ()
+    if cache is None:
+        return None, None
+    key = extractor.cache_key(text)
+    return key, cache.get(key)
+
+
+def cache_counters(cache):
+    """
+    Get the numbers of hits and misses of a result cache.
+
+    Args:
+        cache (object): Result cache, or None
+
+    Returns:
+        tuple: Numbers of hits and misses, zero without a cache
+    """
+    return getattr(cache, "hits", 0), getattr(cache, "misses", 0)
+
+
+def flush_cache(cache):
+    """
+    Commit the buffered writes of a result cache, if it buffers them.
+
+    Args:
+        cache (object): Result cache, or None
+    """
+    flush = getattr(cache, "flush", None)
+    if flush is not None:
+        flush()
+
+
+def extract_batch(extractor, texts, options):
+    """
+    Extract keywords from many texts using a pool of worker processes.
+
+    Args:
+        extractor (KeywordExtractor): Extractor whose configuration is
+            replicated
+        texts (iterable): Texts to process, possibly unbounded
+        options (dict): Batch options including:
+            - workers (int): Number of worker processes
+            - chunksize (int): Number of texts sent to a worker per task
+            - max_in_flight (int): Maximum number of documents being processed
+
+    Yields:
+        list: Keywords for each text, in input order
+    """
+    workers = options["workers"]
+    chunksize = options["chunksize"]
+    max_pending = max(1, options["max_in_flight"] // chunksize)
+
+    # A single worker does not need a pool
+    cache = extractor.result_cache
+    if workers == 1:
+        try:
+            for text in texts:
+                yield extractor.extract_keywords(text)
+        finally:
+            flush_cache(cache)
+        return
+
+    # Persistent caches are shared with the workers, in-memory ones would be
+    # copied, so the parent looks texts up before sending them
+    if getattr(cache, "persistent", False):
+        shared, local = cache, None
+    else:
+        shared, local = None, cache
+
+    # Forked workers would otherwise commit the inherited writes a second time
+
+    flush_cache(shared)
+
+    lookups = deque()  # Cache keys and cached keywords of each submitted chunk
+
+    def uncached(chunks):
+        for chunk in chunks:
+            lookup = [lookup_cache(extractor, local, text) for text in chunk]
+            lookups.append(lookup)
+            pairs = zip(chunk, lookup)
+            yield [text for text, (_, cached) in pairs if cached is None]
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(extractor.config, extractor.stopword_set, shared),
+    ) as executor:
+        chunks = uncached(chunked(texts, chunksize))
+        for results, hits, misses in imap_bounded(
+            executor, _extract_chunk, chunks, max_pending
+        ):
+            # Lookups made by the workers are reported by the parent cache
+            if shared is not None:
+                shared.hits += hits
+                shared.misses += misses
+
+            results = iter(results)
+            for key, cached in lookups.popleft():
+                if cached is None:
+                    cached = next(results)
+                    if local is not None:
+                        local.put(key, tuple(cached))
+                yield list(cached)
+
+
+def build_corpus(extractor, texts, options):
+    """
+    Build the statistics of a corpus using a pool of worker processes.
+
+    Each worker builds the statistics of a chunk of consecutive texts, and the
+    partial statistics are merged in input order as soon as they are ready.
+
+    Args:
+        extractor (KeywordExtractor): Extractor whose configuration is
+            replicated
+        texts (iterable): Texts of the corpus, possibly unbounded
+        options (dict): Batch options including:
+            - workers (int): Number of worker processes
+            - chunksize (int): Number of texts sent to a worker per task
+            - max_in_flight (int): Maximum number of texts being processed
+
+    Returns:
+        DataCore: Statistics of the whole corpus
+    """
+    workers = options["workers"]
+    chunksize = options["chunksize"]
+    max_pending = max(1, options["max_in_flight"] // chunksize)
+
+    # A single worker adds every text to the same document
+    if workers == 1:
+        return build_core(extractor, texts)
+
+    corpus = build_core(extractor, [])
+    with (
+        ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(extractor.config, extractor.stopword_set),
+        ) as executor,
+        gc_paused(),
+    ):
+        chunks = chunked(texts, chunksize)
+        snapshots = imap_bounded(executor, _build_chunk, chunks, max_pending)
+        for snapshot in snapshots:
+            corpus.merge_bytes(snapshot)
+
+    return corpus
+
+
+def build_sharded(extractor, text, options):
+    """
+    Build the statistics of a single document using a pool of worker processes.
+
+    The document is split into sentences in the calling process. Contiguous
+    shards of sentences are then tokenized and built by the workers, and the
+    partial statistics are merged in document order, which offsets their
+    sentence ids and word positions.
+
+    Args:
+        extractor (KeywordExtractor): Extractor whose configuration is
+            replicated
+        text (str): Text of the document
+        options (dict): Sharding options including:
+            - workers (int): Number of worker processes
+            - shard_size (int): Number of sentences per shard, None to split
+              the sentences evenly between the workers
+
+    Returns:
+        DataCore: Statistics of the document
+    """
+    workers = options["workers"]
+    dc = build_core(extractor, [])
+    sentences = dc.split_text(text)
+
+    shard_size = options["shard_size"]
+    if shard_size is None:
+        shard_size = -(-len(sentences) // workers)
+
+    # Small documents do not need a pool
+    if workers == 1 or len(sentences) <= shard_size:
+        dc.add_split_sentences(sentences)
+        return dc
+
+    with (
+        ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(extractor.config, extractor.stopword_set),
+        ) as executor,
+        gc_paused(),
+    ):
+        shards = chunked(sentences, shard_size)
+        for snapshot in executor.map(_build_shard, shards):
+            dc.merge_bytes(snapshot)
+    return dc
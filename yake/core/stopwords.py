@@ -0,0 +1,225 @@
+"""
+Stopword registry module for YAKE.
+
+This module provides a process-wide registry of stopword sets. Language
+specific lists are read from the bundled StopwordsList resources only once and
+shared as frozensets by every KeywordExtractor, and custom stopword collections
+are interned so that equal collections share a single frozenset instance.
+"""
+
+import os
+import threading
+
+# Directory holding the bundled stopword lists
+STOPWORDS_DIR = os.path.join(
+    os.path.dirname(os.path.realpath(__file__)), "StopwordsList"
+)
+
+# Code of the language-agnostic fallback list
+NO_LANGUAGE = "noLang"
+
+
+class StopwordRegistry:
+    """
+    Cache of shared, immutable stopword sets.
+
+    Language lists are keyed by their two letter language code and custom
+    collections by their content. Entries can be preloaded, inspected and
+    evicted at any time; evicting an entry only affects future lookups.
+    """
+
+    def __init__(self, directory=STOPWORDS_DIR):
+        """
+        Initialize an empty registry.
+
+        Args:
+            directory (str): Directory containing the stopwords_xx.txt files
+        """
+        self.directory = directory
+        self._languages = {}
+        self._custom = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def normalize_language(lan):
+        """
+        Normalize a language identifier to the code used by the resource files.
+
+        Args:
+            lan (str): Language identifier (e.g. "en", "EN", "en_US")
+
+        Returns:
+            str: The two letter, lowercase language code
+        """
+        if lan == NO_LANGUAGE:
+            return lan
+        return lan[:2].lower()
+
+    def available_languages(self):
+        """
+        List the languages that have a bundled stopword list.
+
+        Returns:
+            list: Sorted language codes
+        """
+        return sorted(
+            name.removeprefix("stopwords_").removesuffix(".txt")
+            for name in os.listdir(self.directory)
+            if name.startswith("stopwords_") and name.endswith(".txt")
+        )
+
+    def _path(self, code):
+        """Get the path of the stopword list of a language."""
+        return os.path.join(self.directory, f"stopwords_{code}.txt")
+
+    def _read(self, code):
+        """
+        Read a stopword list from disk.
+
+        Args:
+            code (str): Language code of the list to read
+
+        Returns:
+            frozenset: The stopwords in the list
+        """
+        resource_path = self._path(code)
+
+        # Attempt to read the stopword file with UTF-8 encoding
+        try:
+            with open(resource_path, encoding="utf-8") as stop_file:
+                return frozenset(stop_file.read().lower().split("\n"))
+        except UnicodeDecodeError:
+            # Fall back to ISO-8859-1 encoding if UTF-8 fails
+            print("Warning: reading stopword list as ISO-8859-1")
+            with open(resource_path, encoding="ISO-8859-1") as stop_file:
+                return frozenset(stop_file.read().lower().split("\n"))
+
+    def get(self, lan):
+        """
+        Get the stopword set for a language, loading it on first use.
+
+        Languages without a bundled list fall back to the language-agnostic
+        list, which is then cached under the requested code as well.
+
+        Args:
+            lan (str): Language identifier
+
+        Returns:
+            frozenset: The shared stopword set for the language
+        """
+        code = self.normalize_language(lan)
+        stopwords = self._languages.get(code)
+        if stopwords is not None:
+            return stopwords
+
+        with self._lock:
+            # Another thread may have loaded it while we were waiting
+            if code in self._languages:
+                return self._languages[code]
+
+            if os.path.exists(self._path(code)):
+                stopwords = self._read(code)
+            else:
+                stopwords = self._languages.get(NO_LANGUAGE)
+                if stopwords is None:
+                    stopwords = self._read(NO_LANGUAGE)
+                    self._languages[NO_LANGUAGE] = stopwords
+
+            self._languages[code] = stopwords
+            return stopwords
+
+    def intern(self, stopwords):
+        """
+        Get the shared frozenset for a custom stopword collection.
+
+        Args:
+            stopwords (iterable): Custom stopwords
+
+        Returns:
+            frozenset: A frozenset equal to the collection, shared by all
+                       callers that provide the same words
+        """
+        key = stopwords
+        if not isinstance(key, frozenset):
+            key = frozenset(key)
+        with self._lock:
+            return self._custom.setdefault(key, key)
+
+    def preload(self, languages=None):
+        """
+        Load stopword lists ahead of time.
+
+        Args:
+            languages (list, optional): Languages to load (default: all
+                bundled lists)
+
+        Returns:
+            list: The normalized codes of the loaded languages
+        """
+        if languages is None:
+            languages = self.available_languages()
+
+        codes = []
+        for lan in languages:
+            self.get(lan)
+            codes.append(self.normalize_language(lan))
+        return codes
+
+    def info(self):
+        """
+        Describe the current content of the registry.
+
+        Returns:
+            dict: Dictionary with the cached language codes ("languages") and
+                  the number of interned custom collections ("custom")
+        """
+        with self._lock:
+            return {
+                "languages": sorted(self._languages),
+                "custom": len(self._custom),
+            }
+
+    def __contains__(self, lan):
+        """Check whether the stopword list of a language is cached."""
+        return self.normalize_language(lan) in self._languages
+
+    def evict(self, key):
+        """
+        Remove a cached entry.
+
+        Args:
+            key (str or iterable): Language identifier, or custom stopword
+                collection
+
+        Returns:
+            bool: True if an entry was removed, False otherwise
+        """
+        with self._lock:
+            if isinstance(key, str):
+                code = self.normalize_language(key)
+                return self._languages.pop(code, None) is not None
+            return self._custom.pop(frozenset(key), None) is not None
+
+    def clear(self):
+        """Remove every cached entry."""
+        with self._lock:
+            self._languages.clear()
+            self._custom.clear()
+
+
+# Registry shared by every extractor in the process
+registry = StopwordRegistry()
+
+
+def preload(languages=None):
+    """
+    Warm up the process-wide stopword registry.
+
+    Args:
+        languages (list, optional): Languages to load (default: all bundled
+            lists)
+
+    Returns:
+        list: The normalized codes of the loaded languages
+    """
+    return registry.preload(languages)
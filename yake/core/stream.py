@@ -0,0 +1,63 @@
+"""
+Streaming keyword extraction module for YAKE.
+
+This module contains the KeywordStream class, returned by
+KeywordExtractor.stream, which extracts keywords from a text received in
+chunks. Sentences are processed once their boundaries are confirmed by the
+text that follows and their tokens are not kept, so memory usage depends on
+the vocabulary of the text rather than on its length.
+"""
+
+from yake.data import DataCore
+
+
+class KeywordStream:
+    """
+    Incremental keyword extraction over a text fed in chunks.
+
+    Attributes:
+        data_core (DataCore): Statistics of the text fed so far
+    """
+
+    def __init__(self, extractor):
+        """
+        Initialize an empty stream.
+
+        Args:
+            extractor (KeywordExtractor): Extractor providing the configuration
+        """
+        self._extractor = extractor
+        config = extractor._core_config()
+        config["keep_sentences"] = False
+        self.data_core = DataCore(
+            text=None, stopword_set=extractor.stopword_set, config=config
+        )
+        self._keywords = None
+
+    def feed(self, chunk):
+        """
+        Add the next chunk of the text.
+
+        Args:
+            chunk (str): The next part of the text, split anywhere
+
+        Raises:
+            RuntimeError: If the stream was already finalized
+        """
+        if self._keywords is not None:
+            raise RuntimeError("Cannot feed a finalized keyword stream")
+        self.data_core.feed(chunk)
+
+    def finalize(self):
+        """
+        Process the end of the text and extract its keywords.
+
+        Calling finalize again returns the same keywords.
+
+        Returns:
+            List of (keyword, score) tuples sorted by score (lower is better)
+        """
+        if self._keywords is None:
+            self.data_core.finalize()
+            self._keywords = self._extractor._extract_from_core(self.data_core)
+        return self._keywords
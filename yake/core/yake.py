@@ -7,10 +7,110 @@ deduplication of similar keywords, and the entire extraction pipeline from raw t
 to ranked keywords.
 """
 
+import codecs
+import hashlib
+import heapq
+import io
+import json
+import mmap
 import os
+import sys
 import jellyfish
-from yake.data import DataCore
+from yake.data import DataCore, LRUCache
+from .Levenshtein import BACKENDS as LEVENSHTEIN_BACKENDS
 from .Levenshtein import Levenshtein
+from .parallel import (
+    build_corpus,
+    build_sharded,
+    extract_batch,
+    resolve_workers,
+)
+from .stream import KeywordStream
+from .stopwords import registry as stopword_registry
+
+
+def _read_file(path, encoding, chunk_size):
+    """
+    Decode a memory-mapped text file incrementally.
+
+    Args:
+        path (str): Path of the file to read
+        encoding (str): Encoding of the file
+        chunk_size (int): Number of bytes decoded at a time
+
+    Yields:
+        str: Consecutive parts of the text, with newlines translated
+    """
+    decoder = io.IncrementalNewlineDecoder(
+        codecs.getincrementaldecoder(encoding)(), translate=True
+    )
+
+    with open(path, "rb") as file:
+        # Empty files cannot be memory-mapped
+        if os.fstat(file.fileno()).st_size > 0:
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            with mapped:
+                for chunk in _mapped_chunks(mapped, chunk_size):
+                    yield decoder.decode(chunk)
+
+    yield decoder.decode(b"", final=True)
+
+
+def _file_digest(path, encoding, chunk_size):
+    """
+    Hash the raw bytes of a memory-mapped text file, without decoding it.
+
+    The bytes of UTF-8 files without carriage returns are the UTF-8 encoding
+    of their decoded text, so their digest is the digest of the text used by
+    KeywordExtractor.cache_key. Other files are hashed with a digest
+    personalized by their encoding, which cannot match the digest of a text.
+
+    Args:
+        path (str): Path of the file to read
+        encoding (str): Encoding of the file
+        chunk_size (int): Number of bytes hashed at a time
+
+    Returns:
+        str: Hexadecimal digest of the file
+    """
+    with open(path, "rb") as file:
+        # Empty files cannot be memory-mapped
+        if os.fstat(file.fileno()).st_size == 0:
+            return hashlib.blake2b(digest_size=16).hexdigest()
+
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            name = codecs.lookup(encoding).name
+            if name == "utf-8" and mapped.find(b"\r") < 0:
+                digest = hashlib.blake2b(digest_size=16)
+            else:
+                person = name.encode("ascii", "replace")[:16]
+                digest = hashlib.blake2b(digest_size=16, person=person)
+            for chunk in _mapped_chunks(mapped, chunk_size):
+                digest.update(chunk)
+            return digest.hexdigest()
+
+
+def _mapped_chunks(mapped, chunk_size):
+    """Cut a memory-mapped file into consecutive chunks of bytes."""
+    for start in range(0, len(mapped), chunk_size):
+        end = start + chunk_size
+        yield mapped[start:end]
+
+
+def _keywords_size(keywords):
+    """
+    Estimate the memory used by a list of keywords.
+
+    Args:
+        keywords (tuple): (keyword, score) tuples
+
+    Returns:
+        int: Estimated size in bytes
+    """
+    return sys.getsizeof(keywords) + sum(
+        sys.getsizeof(kw) + sys.getsizeof(kw[0]) + sys.getsizeof(kw[1])
+        for kw in keywords
+    )
 
 
 class KeywordExtractor:
@@ -36,10 +136,40 @@ class KeywordExtractor:
                 n (int): Maximum n-gram size (default: 3)
                 dedup_lim (float): Similarity threshold for deduplication (default: 0.9)
                 dedup_func (str): Deduplication function: "seqm", "jaro", or "levs" (default: "seqm")
+                levenshtein_backend (str): Edit distance algorithm of "seqm"
+                    and "levs": "auto" for the bit-parallel algorithm on
+                    keywords of up to 64 characters and dynamic programming
+                    beyond, "bitparallel" or "dp" to always use one of them
+                    (default: "auto")
                 window_size (int): Size of word window for co-occurrence (default: 1)
                 top (int): Maximum number of keywords to extract (default: 20)
                 features (list): List of features to use for scoring (default: None = all features)
                 stopwords (set): Custom set of stopwords (default: None = use language-specific)
+                vectorized (bool): Score terms with NumPy arrays instead of
+                    per-object Python code (default: False)
+                engine (str): Engine used to build the document statistics,
+                    "object" or "array" (default: "object")
+                prune (bool): Skip scoring candidates that cannot reach the top
+                    keywords (default: False)
+                tokenizer (str or object): Tokenizer backend, "segtok" for
+                    segtok-compatible output, "fast" for the regex based
+                    tokenizer, or a custom object with split_sentences and
+                    tokenize methods (default: "segtok")
+                paragraphs (bool): Treat line breaks before capitalized lines
+                    as paragraph breaks instead of plain spaces (default:
+                    False)
+                token_cache_size (int): Number of tokenized sentences cached
+                    across documents, 0 to disable the cache (default: 0)
+                result_cache_size (int): Number of extraction results cached,
+                    keyed by the text and the configuration, 0 to disable the
+                    cache (default: 0)
+                result_cache_bytes (int): Maximum estimated memory used by the
+                    cached results, in bytes (default: None, no limit)
+                result_cache (object): Cache of extraction results with get and
+                    put methods, e.g. an LRUCache shared by several extractors
+                    or a SQLiteCache kept on disk and shared with the workers
+                    of extract_keywords_batch, used instead of
+                    result_cache_size (default: None)
         """
         # Initialize configuration dictionary with default values
         self.config = {
@@ -47,54 +177,65 @@ class KeywordExtractor:
             "n": kwargs.get("n", 3),
             "dedup_lim": kwargs.get("dedup_lim", 0.9),
             "dedup_func": kwargs.get("dedup_func", "seqm"),
+            "levenshtein_backend": kwargs.get("levenshtein_backend", "auto"),
             "window_size": kwargs.get("window_size", 1),
             "top": kwargs.get("top", 20),
             "features": kwargs.get("features", None),
+            "vectorized": kwargs.get("vectorized", False),
+            "engine": kwargs.get("engine", "object"),
+            "prune": kwargs.get("prune", False),
+            "tokenizer": kwargs.get("tokenizer", "segtok"),
+            "paragraphs": kwargs.get("paragraphs", False),
+            "token_cache_size": kwargs.get("token_cache_size", 0),
+            "result_cache_size": kwargs.get("result_cache_size", 0),
+            "result_cache_bytes": kwargs.get("result_cache_bytes", None),
         }
 
+        # Cache of tokenized sentences, reused across documents
+        self.token_cache = None
+        if self.config["token_cache_size"] > 0:
+            self.token_cache = LRUCache(self.config["token_cache_size"])
+
+        # Cache of extraction results, reused for repeated texts
+        self.result_cache = kwargs.get("result_cache")
+        if self.result_cache is None and self.config["result_cache_size"] > 0:
+            self.result_cache = LRUCache(
+                self.config["result_cache_size"],
+                maxbytes=self.config["result_cache_bytes"],
+                sizeof=_keywords_size,
+            )
+        self._stopwords_digest = None
+
         # Load appropriate stopwords and deduplication function
         self.stopword_set = self._load_stopwords(kwargs.get("stopwords"))
         self.dedup_function = self._get_dedup_function(self.config["dedup_func"])
+        backend = self.config["levenshtein_backend"]
+        if backend not in LEVENSHTEIN_BACKENDS:
+            raise ValueError(
+                f"Unknown Levenshtein backend {backend!r}, "
+                f"expected one of {LEVENSHTEIN_BACKENDS}"
+            )
 
     def _load_stopwords(self, stopwords):
         """
-        Load stopwords from file or use provided set.
+        Load stopwords from the shared registry or use provided set.
 
-        This method handles the loading of language-specific stopwords from
-        the appropriate resource file, falling back to a language-agnostic
-        list if the specific language is not available.
+        Language-specific lists are read from the appropriate resource file
+        only once per process, falling back to a language-agnostic list if the
+        specific language is not available. Custom collections are interned so
+        that equal collections share the same frozenset.
 
         Args:
             stopwords (set, optional): Custom set of stopwords to use
 
         Returns:
-            set: A set of stopwords for filtering non-content words
+            frozenset: A set of stopwords for filtering non-content words
         """
         # Use provided stopwords if available
         if stopwords is not None:
-            return set(stopwords)
-
-        # Determine the path to the appropriate stopword list
-        dir_path = os.path.dirname(os.path.realpath(__file__))
-        local_path = os.path.join(
-            "StopwordsList", f"stopwords_{self.config['lan'][:2].lower()}.txt"
-        )
-
-        # Fall back to language-agnostic list if specific language not available
-        if not os.path.exists(os.path.join(dir_path, local_path)):
-            local_path = os.path.join("StopwordsList", "stopwords_noLang.txt")
-
-        resource_path = os.path.join(dir_path, local_path)
+            return stopword_registry.intern(stopwords)
 
-        # Attempt to read the stopword file with UTF-8 encoding
-        try:
-            with open(resource_path, encoding="utf-8") as stop_file:
-                return set(stop_file.read().lower().split("\n"))
-        except UnicodeDecodeError:
-            # Fall back to ISO-8859-1 encoding if UTF-8 fails
-            print("Warning: reading stopword list as ISO-8859-1")
-            with open(resource_path, encoding="ISO-8859-1") as stop_file:
-                return set(stop_file.read().lower().split("\n"))
+        return stopword_registry.get(self.config["lan"])
 
     def _get_dedup_function(self, func_name):
         """
@@ -147,7 +288,10 @@ class KeywordExtractor:
         Returns:
             float: Similarity score between 0.0 (different) and 1.0 (identical)
         """
-        return 1 - Levenshtein.distance(cand1, cand2) / max(len(cand1), len(cand2))
+        distance = Levenshtein.distance(
+            cand1, cand2, self.config["levenshtein_backend"]
+        )
+        return 1 - distance / max(len(cand1), len(cand2))
 
     def seqm(self, cand1, cand2):
         """
@@ -164,7 +308,32 @@ class KeywordExtractor:
         Returns:
             float: Similarity score between 0.0 (different) and 1.0 (identical)
         """
-        return Levenshtein.ratio(cand1, cand2)
+        backend = self.config["levenshtein_backend"]
+        return Levenshtein.ratio(cand1, cand2, backend)
+
+    def is_duplicate(self, cand1, cand2):
+        """
+        Check whether two keywords are too similar to both be kept.
+
+        Levenshtein based functions use a bounded computation that gives up as
+        soon as the deduplication threshold becomes unreachable, which is the
+        common case for unrelated keywords.
+
+        Args:
+            cand1 (str): First keyword to compare
+            cand2 (str): Second keyword to compare
+
+        Returns:
+            bool: True if the similarity exceeds the deduplication threshold
+        """
+        if self.dedup_function in (self.levs, self.seqm):
+            return Levenshtein.within(
+                cand1,
+                cand2,
+                self.config["dedup_lim"],
+                self.config["levenshtein_backend"],
+            )
+        return self.dedup_function(cand1, cand2) > self.config["dedup_lim"]
 
     def extract_keywords(self, text):
         """
@@ -181,7 +350,8 @@ class KeywordExtractor:
            - For single terms: frequency, position, case, etc.
            - For n-grams: combines features from constituent terms
         4. Filters candidates based on validity criteria (e.g., no stopwords at boundaries)
-        5. Sorts candidates by their importance score (H), where lower is better
+        5. Orders candidates lazily by their importance score (H), where lower
+           is better
         6. Performs deduplication to remove similar candidates based on string similarity
         7. Returns the top k keywords with their scores
 
@@ -200,43 +370,310 @@ class KeywordExtractor:
         if not text:
             return []
 
-        # Normalize text by replacing newlines with spaces
-        text = text.replace("\n", " ")
+        def extract():
+            # Initialize the data core with the text, newlines are replaced
+            # with spaces during preprocessing unless paragraphs are enabled
+            dc = DataCore(text, self.stopword_set, self._core_config())
+            return self._extract_from_core(dc)
+
+        return self._extract_cached(lambda: self.cache_key(text), extract)
+
+    def extract_keywords_sharded(self, text, workers=None, shard_size=None):
+        """
+        Extract keywords from a large text using multiple processes.
+
+        The text is split into sentences, which worker processes tokenize and
+        process in contiguous shards. The statistics of the shards are merged
+        before scoring, so the result is the same as extract_keywords.
+
+        Sentence splitting, merging and scoring stay in the calling process,
+        which bounds the speedup: on a 240k-word text made of prose, about a
+        fifth of the single-process time is spent splitting sentences.
+
+        Args:
+            text: Input text
+            workers (int, optional): Number of worker processes (default: all
+                cores). With a single worker the text is processed in the
+                calling process.
+            shard_size (int, optional): Number of sentences per shard
+                (default: None, one shard per worker)
+
+        Returns:
+            List of (keyword, score) tuples sorted by score (lower is better)
+        """
+        # Handle empty input
+        if not text:
+            return []
+
+        if shard_size is not None:
+            shard_size = max(1, int(shard_size))
+        options = {
+            "workers": resolve_workers(workers),
+            "shard_size": shard_size,
+        }
+
+        def extract():
+            dc = build_sharded(self, text, options)
+            return self._extract_from_core(dc)
+
+        return self._extract_cached(lambda: self.cache_key(text), extract)
+
+    def extract_keywords_from_tokens(self, sentences):
+        """
+        Extract keywords from a document that is already tokenized.
+
+        Pre-filtering, sentence segmentation and tokenization are skipped:
+        the tokens are processed as they are, punctuation tokens included.
+        Empty sentences are skipped, as in the segmentation of plain text, so
+        that they do not count in the number of sentences.
+
+        Args:
+            sentences (list): Sentences of the document, each one a list of
+                tokens
+
+        Returns:
+            List of (keyword, score) tuples sorted by score (lower is better)
+        """
+        dc = DataCore(None, self.stopword_set, self._core_config())
+        tokens = [list(sentence) for sentence in sentences if sentence]
+        dc.add_sentences(tokens)
+        return self._extract_from_core(dc)
+
+    def extract_keywords_from_file(
+        self,
+        path,
+        encoding="utf-8",
+        chunk_size=1 << 20,
+    ):
+        """
+        Extract keywords from a text file without reading it all into memory.
+
+        The file is memory-mapped and decoded incrementally, chunk_size bytes
+        at a time, and the decoded text is fed to a keyword stream. Newlines
+        are translated as when reading the file in text mode, so the result
+        is the same as extract_keywords on the file content. The cache key is
+        computed from the raw bytes, and results of UTF-8 files without
+        carriage returns are shared with extract_keywords in the result cache.
+
+        Args:
+            path (str): Path of the file to read
+            encoding (str): Encoding of the file (default: "utf-8")
+            chunk_size (int): Number of bytes decoded at a time (default: 1
+                MiB)
+
+        Returns:
+            List of (keyword, score) tuples sorted by score (lower is better)
+        """
+
+        def extract():
+            stream = self.stream()
+            for chunk in _read_file(path, encoding, chunk_size):
+                stream.feed(chunk)
+            return stream.finalize()
+
+        return self._extract_cached(
+            lambda: (
+                self.config_fingerprint(),
+                _file_digest(path, encoding, chunk_size),
+            ),
+            extract,
+        )
+
+    def config_fingerprint(self):
+        """
+        Get a digest of the configuration that determines the keywords.
+
+        Extractors with the same fingerprint return the same keywords for any
+        text, so the fingerprint can identify cached results shared between
+        extractors or processes. It covers the YAKE version, the extraction
+        parameters and the stopwords, but not options like the build engine
+        that have no effect on the keywords. Vectorized scoring is covered,
+        since its scores can differ from the scalar ones in the last bits. It
+        is computed from the current configuration on each call, so changes
+        to config are taken into account.
 
-        # Create a configuration dictionary for DataCore
-        core_config = {
+        Returns:
+            str: Hexadecimal digest of the configuration
+        """
+        # Imported here to avoid a circular import with the package
+        from yake import __version__
+
+        tokenizer = self.config["tokenizer"]
+        if not isinstance(tokenizer, str):
+            tokenizer = getattr(tokenizer, "name", None) or (
+                f"{type(tokenizer).__module__}.{type(tokenizer).__qualname__}"
+            )
+        features = self.config["features"]
+        settings = {
+            "version": __version__,
+            "lan": self.config["lan"],
+            "n": self.config["n"],
+            "dedup_lim": self.config["dedup_lim"],
+            "dedup_func": self.config["dedup_func"],
+            "window_size": self.config["window_size"],
+            "top": self.config["top"],
+            "features": None if features is None else sorted(features),
+            "tokenizer": tokenizer,
+            "paragraphs": self.config["paragraphs"],
+            "vectorized": self.config["vectorized"],
+            "stopwords": self._stopwords_fingerprint(),
+        }
+        encoded = json.dumps(settings, sort_keys=True).encode("utf-8")
+        return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
+    def _stopwords_fingerprint(self):
+        """
+        Get a digest of the stopwords, computed again only when they change.
+
+        Returns:
+            str: Hexadecimal digest of the sorted stopwords
+        """
+        stopwords = self.stopword_set
+        cached = self._stopwords_digest
+        stale = cached is None or cached[0] is not stopwords
+        if stale or cached[1] != len(stopwords):
+            encoded = json.dumps(sorted(stopwords)).encode("utf-8")
+            digest = hashlib.blake2b(encoded, digest_size=16).hexdigest()
+            self._stopwords_digest = (stopwords, len(stopwords), digest)
+        return self._stopwords_digest[2]
+
+    def cache_key(self, text):
+        """
+        Get the key identifying the keywords of a text in a result cache.
+
+        Args:
+            text (str): Input text
+
+        Returns:
+            tuple: (configuration fingerprint, text digest) hexadecimal strings
+        """
+        digest = hashlib.blake2b(
+            text.encode("utf-8", "surrogatepass"), digest_size=16
+        ).hexdigest()
+        return (self.config_fingerprint(), digest)
+
+    def _extract_cached(self, make_key, extract):
+        """
+        Extract the keywords of a text through the result cache, if any.
+
+        Args:
+            make_key (callable): Function returning the cache key of the text,
+                only called when there is a cache
+            extract (callable): Function extracting the keywords on a cache
+                miss
+
+        Returns:
+            List of (keyword, score) tuples sorted by score (lower is better)
+        """
+        if self.result_cache is None:
+            return extract()
+
+        key = make_key()
+        keywords = self.result_cache.get(key)
+        if keywords is None:
+            keywords = tuple(extract())
+            self.result_cache.put(key, keywords)
+        return list(keywords)
+
+    def stream(self):
+        """
+        Start extracting keywords from a text received in chunks.
+
+        The returned stream has a feed(chunk) method, to be called with
+        consecutive parts of the text, and a finalize() method returning the
+        keywords. The whole text never needs to be held in memory.
+
+        Returns:
+            KeywordStream: A new stream using this extractor's configuration
+        """
+        return KeywordStream(self)
+
+    def _core_config(self):
+        """
+        Build the DataCore configuration matching this extractor.
+
+        Returns:
+            dict: Configuration for DataCore
+        """
+        return {
             "windows_size": self.config["window_size"],
             "n": self.config["n"],
+            "engine": self.config["engine"],
+            "tokenizer": self.config["tokenizer"],
+            "token_cache": self.token_cache,
+            "keep_paragraphs": self.config["paragraphs"],
         }
 
-        # Initialize the data core with the text
-        dc = DataCore(text=text, stopword_set=self.stopword_set, config=core_config)
+    def _extract_from_core(self, dc):
+        """
+        Score the candidates of a built DataCore and select the top keywords.
+
+        Args:
+            dc (DataCore): Data representation of the document
 
+        Returns:
+            List of (keyword, score) tuples sorted by score (lower is better)
+        """
         # Build features for single terms and multi-word terms
-        dc.build_single_terms_features(features=self.config["features"])
-        dc.build_mult_terms_features(features=self.config["features"])
-
-        # Collect and sort all valid candidates by score (lower is better)
-        result_set = []
-        candidates_sorted = sorted(
-            [cc for cc in dc.candidates.values() if cc.is_valid()], key=lambda c: c.h
+        features = self.config["features"]
+        dc.build_single_terms_features(
+            features=features, vectorized=self.config["vectorized"]
+        )
+        valid_candidates = dc.build_mult_terms_features(
+            features=features,
+            prune=self.config["top"] if self.config["prune"] else None,
         )
 
-        # If deduplication is disabled, return all candidates up to the limit
+        threshold = dc.pruning_threshold
+        keywords = self._rank_candidates(valid_candidates, threshold)
+        if keywords is None:
+            # Deduplication needs the pruned candidates, so score them too
+            valid_candidates = dc.score_pruned_candidates(features=features)
+            keywords = self._rank_candidates(valid_candidates)
+
+        return keywords
+
+    def _rank_candidates(self, candidates, threshold=None):
+        """
+        Select the top keywords among scored candidates.
+
+        Candidates are not fully sorted. With deduplication disabled the best
+        ones are selected with a bounded heap; otherwise candidates are popped
+        from a heap in score order and deduplicated until enough keywords are
+        found. Ties are broken by candidate order, as a stable sort would do.
+
+        Args:
+            candidates (list): Valid ComposedWord candidates with their final
+                score
+            threshold (float, optional): Score exceeded by every candidate left
+                out by pruning, or None if no candidate was pruned
+
+        Returns:
+            List of (keyword, score) tuples sorted by score (lower is better),
+            or None if the result could depend on candidates beyond the
+            threshold
+        """
+        # Without deduplication, return the best candidates up to the limit
         if self.config["dedup_lim"] >= 1.0:
-            return [(cand.unique_kw, cand.h) for cand in candidates_sorted][
-                : self.config["top"]
-            ]
+            top = self.config["top"]
+            best = heapq.nsmallest(top, candidates, key=lambda c: c.h)
+            return [(cand.unique_kw, cand.h) for cand in best]
+
+        # Order candidates lazily by score (lower is better)
+        heap = [(cand.h, index, cand) for index, cand in enumerate(candidates)]
+        heapq.heapify(heap)
 
         # Perform deduplication by comparing candidates
-        for cand in candidates_sorted:
+        result_set = []
+        while heap:
+            _, _, cand = heapq.heappop(heap)
+            if threshold is not None and cand.h > threshold:
+                return None
+
             should_add = True
             # Check if this candidate is too similar to any already selected
             for h, cand_result in result_set:
-                if (
-                    self.dedup_function(cand.unique_kw, cand_result.unique_kw)
-                    > self.config["dedup_lim"]
-                ):
+                if self.is_duplicate(cand.unique_kw, cand_result.unique_kw):
                     should_add = False
                     break
 
@@ -247,6 +684,89 @@ class KeywordExtractor:
             # Stop once we have enough candidates
             if len(result_set) == self.config["top"]:
                 break
+        else:
+            # Pruned candidates could have filled the remaining places
+            if threshold is not None:
+                return None
 
         # Format results as (keyword, score) tuples
         return [(cand.kw, h) for (h, cand) in result_set]
+
+    def extract_keywords_batch(
+        self, texts, workers=None, chunksize=1, max_in_flight=None
+    ):
+        """
+        Extract keywords from many texts using multiple processes.
+
+        Each worker process builds its own extractor once, with this
+        extractor's configuration and already loaded stopword set, and reuses
+        it for every text it receives. Texts are consumed lazily and results
+        are yielded in input order as soon as they are available, so unbounded
+        iterables can be processed with flat memory usage. Texts found in an
+        in-memory result cache are not sent to the workers, whose results are
+        added to it, while a persistent result cache is used by the workers
+        directly.
+
+        Args:
+            texts (iterable): Texts to extract keywords from
+            workers (int, optional): Number of worker processes (default: all
+                cores). With a single worker texts are processed in the
+                calling process.
+            chunksize (int): Number of texts sent to a worker per task
+                (default: 1)
+            max_in_flight (int, optional): Maximum number of documents
+                submitted but not yet yielded (default: 2 * workers *
+                chunksize)
+
+        Yields:
+            list: (keyword, score) tuples for each text, in input order
+        """
+        workers = resolve_workers(workers)
+        chunksize = max(1, int(chunksize))
+        if max_in_flight is None:
+            max_in_flight = 2 * workers * chunksize
+
+        options = {
+            "workers": workers,
+            "chunksize": chunksize,
+            "max_in_flight": max(chunksize, int(max_in_flight)),
+        }
+        yield from extract_batch(self, texts, options)
+
+    def extract_keywords_corpus(
+        self, texts, workers=None, chunksize=16, max_in_flight=None
+    ):
+        """
+        Extract the keywords of a whole collection of texts.
+
+        Worker processes build the statistics of chunks of texts, which are
+        merged into the statistics of the collection before scoring, so the
+        keywords are those of a single document made of every text, one after
+        another. Each text starts a new sentence: when every text ends at a
+        sentence boundary, the result is the same as extract_keywords on the
+        concatenated texts.
+
+        Args:
+            texts (iterable): Texts of the collection
+            workers (int, optional): Number of worker processes (default: all
+                cores). With a single worker texts are processed in the
+                calling process.
+            chunksize (int): Number of texts sent to a worker per task
+                (default: 16)
+            max_in_flight (int, optional): Maximum number of texts submitted
+                but not yet merged (default: 2 * workers * chunksize)
+
+        Returns:
+            List of (keyword, score) tuples sorted by score (lower is better)
+        """
+        workers = resolve_workers(workers)
+        chunksize = max(1, int(chunksize))
+        if max_in_flight is None:
+            max_in_flight = 2 * workers * chunksize
+
+        options = {
+            "workers": workers,
+            "chunksize": chunksize,
+            "max_in_flight": max(chunksize, int(max_in_flight)),
+        }
+        return self._extract_from_core(build_corpus(self, texts, options))
@@ -3,5 +3,14 @@
 from .core import DataCore
 from .single_word import SingleWord
 from .composed_word import ComposedWord
+from .graph import CooccurrenceGraph
+from .cache import LRUCache, SQLiteCache
 
-__all__ = ["DataCore", "SingleWord", "ComposedWord"]
+__all__ = [
+    "DataCore",
+    "SingleWord",
+    "ComposedWord",
+    "CooccurrenceGraph",
+    "LRUCache",
+    "SQLiteCache",
+]
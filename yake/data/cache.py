@@ -0,0 +1,431 @@
+"""
+Caching module for YAKE keyword extraction.
+
+This module contains the LRUCache class, a small bounded mapping used to reuse
+the results of expensive processing steps, such as sentence tokenization or
+whole extractions, across the documents handled by one extractor, and the
+SQLiteCache class, which keeps extraction results on disk across processes
+and runs.
+"""
+
+import json
+import os
+import sqlite3
+import sys
+import time
+from collections import OrderedDict
+
+
+class LRUCache:
+    """
+    Bounded mapping that evicts the least recently used entries.
+
+    The number of entries is bounded and, optionally, their estimated size in
+    memory. The cache counts hits, misses and evictions, so its effectiveness
+    can be monitored on real workloads.
+
+    Attributes:
+        maxsize (int): Maximum number of entries
+        persistent (bool): Whether the cache outlives the process
+        maxbytes (int): Maximum total size of the values in bytes, or None
+        nbytes (int): Total size of the cached values, when maxbytes is set
+        hits (int): Number of lookups that found an entry
+        misses (int): Number of lookups that found no entry
+        evictions (int): Number of entries removed to respect the bounds
+    """
+
+    persistent = False
+
+    def __init__(self, maxsize=1024, maxbytes=None, sizeof=None):
+        """
+        Initialize an empty cache.
+
+        Args:
+            maxsize (int): Maximum number of entries (default: 1024)
+            maxbytes (int, optional): Maximum total size of the values in bytes
+                (default: None, no limit)
+            sizeof (callable, optional): Function estimating the size of a
+                value in bytes, only used with maxbytes (default:
+                sys.getsizeof)
+        """
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._sizes = {}  # Key -> size of the value, when maxbytes is set
+        self._sizeof = sys.getsizeof if sizeof is None else sizeof
+
+    def __len__(self):
+        """Get the number of cached entries."""
+        return len(self._entries)
+
+    def __contains__(self, key):
+        """Check whether a key is cached, without counting a lookup."""
+        return key in self._entries
+
+    def get(self, key, default=None):
+        """
+        Look up an entry and mark it as recently used.
+
+        Args:
+            key (hashable): Key of the entry
+            default (Any): Value returned when the key is not cached
+
+        Returns:
+            Any: The cached value, or default
+        """
+        try:
+            value = self._entries[key]
+        except KeyError:
+            self.misses += 1
+            return default
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key, value):
+        """
+        Store an entry, evicting the least recently used ones if needed.
+
+        A value larger than maxbytes is not stored.
+
+        Args:
+            key (hashable): Key of the entry
+            value (Any): Value to cache
+        """
+        if self.maxbytes is not None:
+            size = self._sizeof(value)
+            self.nbytes -= self._sizes.pop(key, 0)
+            if size > self.maxbytes:
+                self._entries.pop(key, None)
+                return
+            self._sizes[key] = size
+            self.nbytes += size
+
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize or (
+            self.maxbytes is not None and self.nbytes > self.maxbytes
+        ):
+            evicted, _ = self._entries.popitem(last=False)
+            self.nbytes -= self._sizes.pop(evicted, 0)
+            self.evictions += 1
+
+    def clear(self):
+        """Remove every entry and reset the counters."""
+        self._entries.clear()
+        self._sizes.clear()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def info(self):
+        """
+        Describe the current state of the cache.
+
+        Returns:
+            dict: Dictionary with the keys "hits", "misses", "evictions",
+                  "size", "maxsize", "nbytes" and "maxbytes"
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "nbytes": self.nbytes,
+            "maxbytes": self.maxbytes,
+        }
+
+
+class SQLiteCache:
+    """
+    Persistent cache of extraction results stored in a SQLite database.
+
+    Entries are keyed by a (configuration fingerprint, text digest) pair, as
+    returned by KeywordExtractor.cache_key, and hold lists of (keyword, score)
+    tuples. Writes are buffered and committed in batches, and the database
+    uses write-ahead logging, so that several processes can read it while one
+    of them writes. Entries expire after a time to live, and the oldest ones
+    are evicted when the number of entries or their total size is too large.
+    Eviction runs after every evict_interval writes and when the cache is
+    closed, so the limits can be exceeded by that many entries meanwhile.
+
+    The cache can be pickled: each process opens its own connection to the
+    database, so it can be shared with the worker processes of a batch.
+    Workers commit their writes when they exit, and report their hits and
+    misses to the cache of the parent process, but not their evictions.
+
+    Attributes:
+        path (str): Path of the database file
+        ttl (float): Time to live of the entries in seconds, or None
+        max_entries (int): Maximum number of entries, or None
+        max_bytes (int): Maximum total size of the stored results, or None
+        batch_size (int): Number of buffered writes committed at once
+        evict_interval (int): Number of writes between two evictions
+        persistent (bool): Whether the cache outlives the process
+        hits (int): Number of lookups that found an entry
+        misses (int): Number of lookups that found no entry
+        evictions (int): Number of entries removed as expired or to respect
+            the size limits
+    """
+
+    persistent = True
+
+    # Schema of the database, created when the cache is first used
+    SCHEMA = (
+        """CREATE TABLE IF NOT EXISTS results (
+            fingerprint TEXT NOT NULL,
+            digest TEXT NOT NULL,
+            keywords TEXT NOT NULL,
+            size INTEGER NOT NULL,
+            created REAL NOT NULL,
+            PRIMARY KEY (fingerprint, digest)
+        )""",
+        "CREATE INDEX IF NOT EXISTS results_created ON results (created)",
+    )
+
+    def __init__(
+        self,
+        path,
+        ttl=None,
+        max_entries=None,
+        max_bytes=None,
+        batch_size=64,
+        evict_interval=1024,
+    ):
+        """
+        Initialize a cache backed by a database file, created if needed.
+
+        Args:
+            path (str): Path of the database file
+            ttl (float, optional): Time to live of the entries in seconds
+                (default: None, entries do not expire)
+            max_entries (int, optional): Maximum number of entries
+                (default: None, no limit)
+            max_bytes (int, optional): Maximum total size of the stored
+                results in bytes (default: None, no limit)
+            batch_size (int): Number of writes buffered before they are
+                committed (default: 64)
+            evict_interval (int): Number of writes after which expired and
+                excess entries are removed (default: 1024)
+        """
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.batch_size = max(1, batch_size)
+        self.evict_interval = max(1, evict_interval)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._pending = {}  # Key -> (keywords, serialized keywords, time)
+        self._unevicted = 0  # Writes committed since the last eviction
+        self._connection = None
+        self._pid = None
+
+    def __getstate__(self):
+        """
+        Get the settings to pickle, without connection or buffered writes.
+
+        Returns:
+            dict: The arguments of __init__
+        """
+        return {
+            "path": self.path,
+            "ttl": self.ttl,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+            "batch_size": self.batch_size,
+            "evict_interval": self.evict_interval,
+        }
+
+    def __setstate__(self, state):
+        """
+        Restore a pickled cache, which opens its own connection when used.
+
+        Args:
+            state (dict): The settings returned by __getstate__
+        """
+        self.__init__(**state)
+
+    def __enter__(self):
+        """Use the cache as a context manager, closing it on exit."""
+        return self
+
+    def __exit__(self, *exc_info):
+        """Commit the buffered writes and close the connection."""
+        self.close()
+
+    def _connect(self):
+        """
+        Get the connection of the current process, opening it if needed.
+
+        Returns:
+            sqlite3.Connection: Connection to the database
+        """
+        # Connections cannot be used across a fork
+        if self._connection is None or self._pid != os.getpid():
+            self._connection = sqlite3.connect(self.path, timeout=30.0)
+            self._pid = os.getpid()
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            with self._connection:
+                for statement in self.SCHEMA:
+                    self._connection.execute(statement)
+        return self._connection
+
+    def get(self, key, default=None):
+        """
+        Look up the keywords of a text.
+
+        Args:
+            key (tuple): (configuration fingerprint, text digest) pair
+            default (Any): Value returned when the key is not cached
+
+        Returns:
+            tuple: The cached (keyword, score) tuples, or default
+        """
+        pending = self._pending.get(key)
+        if pending is not None:
+            self.hits += 1
+            return pending[0]
+
+        row = (
+            self._connect()
+            .execute(
+                "SELECT keywords, created FROM results"
+                " WHERE fingerprint = ? AND digest = ?",
+                key,
+            )
+            .fetchone()
+        )
+        if row is None or self._expired(row[1]):
+            self.misses += 1
+            return default
+
+        self.hits += 1
+        return tuple(tuple(keyword) for keyword in json.loads(row[0]))
+
+    def put(self, key, value):
+        """
+        Store the keywords of a text, committing the buffer if it is full.
+
+        Args:
+            key (tuple): (configuration fingerprint, text digest) pair
+            value (tuple): (keyword, score) tuples
+        """
+        self._pending[key] = (value, json.dumps(value), time.time())
+        if len(self._pending) >= self.batch_size:
+            self.flush()
+
+    def flush(self, evict=False):
+        """
+        Commit the buffered writes, and remove expired and excess entries
+        once evict_interval writes were made since the last eviction.
+
+        Args:
+            evict (bool): Remove expired and excess entries after any write
+                made since the last eviction (default: False)
+        """
+        unevicted = self._unevicted + len(self._pending)
+        evict = unevicted >= self.evict_interval or (evict and unevicted > 0)
+        if not self._pending and not evict:
+            return
+
+        connection = self._connect()
+        rows = [
+            (*key, serialized, len(serialized), created)
+            for key, (_, serialized, created) in self._pending.items()
+        ]
+        with connection:
+            connection.executemany(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?)", rows
+            )
+            if evict:
+                self._evict(connection)
+        self._pending.clear()
+        self._unevicted = 0 if evict else unevicted
+
+    def _expired(self, created):
+        """Check whether an entry created at the given time has expired."""
+        return self.ttl is not None and created < time.time() - self.ttl
+
+    def _evict(self, connection):
+        """
+        Remove expired entries, then the oldest ones beyond the size limits.
+
+        Args:
+            connection (sqlite3.Connection): Connection in a transaction
+        """
+        removed = 0
+        if self.ttl is not None:
+            expired = time.time() - self.ttl
+            removed += connection.execute(
+                "DELETE FROM results WHERE created < ?", (expired,)
+            ).rowcount
+        if self.max_entries is not None:
+            removed += connection.execute(
+                "DELETE FROM results WHERE rowid IN (SELECT rowid FROM results"
+                " ORDER BY created DESC, rowid DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            ).rowcount
+        if self.max_bytes is not None:
+            removed += connection.execute(
+                "DELETE FROM results WHERE rowid IN (SELECT rowid FROM"
+                " (SELECT rowid, SUM(size) OVER"
+                " (ORDER BY created DESC, rowid DESC) AS total FROM results)"
+                " WHERE total > ?)",
+                (self.max_bytes,),
+            ).rowcount
+        self.evictions += removed
+
+    def clear(self):
+        """Remove every entry, buffered or stored, and reset the counters."""
+        self._pending.clear()
+        self._unevicted = 0
+        with self._connect() as connection:
+            connection.execute("DELETE FROM results")
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def close(self):
+        """Commit the buffered writes, evict entries and close the database."""
+        self.flush(evict=True)
+        if self._connection is not None and self._pid == os.getpid():
+            self._connection.close()
+        self._connection = None
+
+    def info(self):
+        """
+        Describe the current state of the cache.
+
+        Buffered writes are committed and entries evicted first, so that the
+        size reflects the limits.
+
+        Returns:
+            dict: Dictionary with the keys "hits", "misses", "evictions",
+                  "size", "nbytes", "max_entries", "max_bytes" and "ttl"
+        """
+        self.flush(evict=True)
+        size, nbytes = (
+            self._connect()
+            .execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM results")
+            .fetchone()
+        )
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": size,
+            "nbytes": nbytes,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+            "ttl": self.ttl,
+        }
@@ -21,10 +21,34 @@ class ComposedWord:
     It tracks statistics like term frequency, integrity, and provides methods to
     validate whether a phrase is likely to be a good keyword.
 
+    Attributes are kept in __slots__ rather than in a per-object dictionary,
+    since a document creates one instance per distinct candidate.
+
     Attributes:
-        See property accessors below for available attributes.
+        tags (set): Part-of-speech tag sequences seen for this phrase
+        kw (str): Original form of the keyword phrase
+        unique_kw (str): Normalized (lowercase) form of the keyword phrase
+        size (int): Number of words in this phrase
+        terms (list): SingleWord objects for each constituent term
+        tf (float): Term frequency (number of occurrences) in the document
+        integrity (float): Integrity score indicating phrase coherence
+        h (float): Final relevance score of this phrase (lower is better)
+        start_or_end_stopwords (bool): Whether the phrase starts or ends with
+            stopwords
     """
 
+    __slots__ = (
+        "h",
+        "integrity",
+        "kw",
+        "size",
+        "start_or_end_stopwords",
+        "tags",
+        "terms",
+        "tf",
+        "unique_kw",
+    )
+
     def __init__(self, terms):
         """
         Initialize a ComposedWord object representing a multi-word term.
@@ -36,105 +60,74 @@ class ComposedWord:
         """
         # If terms is None, initialize an invalid candidate
         if terms is None:
-            self.data = {
-                "start_or_end_stopwords": True,
-                "tags": set(),
-                "h": 0.0,
-                "tf": 0.0,
-                "kw": "",
-                "unique_kw": "",
-                "size": 0,
-                "terms": [],
-                "integrity": 0.0,
-            }
+            self.start_or_end_stopwords = True
+            self.tags = set()
+            self.h = 0.0
+            self.tf = 0.0
+            self.kw = ""
+            self.unique_kw = ""
+            self.size = 0
+            self.terms = []
+            self.integrity = 0.0
             return
 
-        # Basic initialization from terms
-        self.data = {}
-
         # Calculate derived properties
-        self.data["tags"] = set(["".join([w[0] for w in terms])])
-        self.data["kw"] = " ".join([w[1] for w in terms])
-        self.data["unique_kw"] = self.data["kw"].lower()
-        self.data["size"] = len(terms)
-        self.data["terms"] = [w[2] for w in terms if w[2] is not None]
-        self.data["tf"] = 0.0
-        self.data["integrity"] = 1.0
-        self.data["h"] = 1.0
+        self.tags = set(["".join([w[0] for w in terms])])
+        self.kw = " ".join([w[1] for w in terms])
+        self.unique_kw = self.kw.lower()
+        self.size = len(terms)
+        self.terms = [w[2] for w in terms if w[2] is not None]
+        self.tf = 0.0
+        self.integrity = 1.0
+        self.h = 1.0
 
         # Check if the candidate starts or ends with stopwords
-        if len(self.data["terms"]) > 0:
-            self.data["start_or_end_stopwords"] = (
-                self.data["terms"][0].stopword or self.data["terms"][-1].stopword
+        if len(self.terms) > 0:
+            self.start_or_end_stopwords = (
+                self.terms[0].stopword or self.terms[-1].stopword
             )
         else:
-            self.data["start_or_end_stopwords"] = True
-
-    # Property accessors for backward compatibility
-    @property
-    def tags(self):
-        """Get the set of part-of-speech tag sequences for this phrase."""
-        return self.data["tags"]
-
-    @property
-    def kw(self):
-        """Get the original form of the keyword phrase."""
-        return self.data["kw"]
-
-    @property
-    def unique_kw(self):
-        """Get the normalized (lowercase) form of the keyword phrase."""
-        return self.data["unique_kw"]
-
-    @property
-    def size(self):
-        """Get the number of words in this phrase."""
-        return self.data["size"]
-
-    @property
-    def terms(self):
-        """Get the list of SingleWord objects for each constituent term."""
-        return self.data["terms"]
-
-    @property
-    def tf(self):
-        """Get the term frequency (number of occurrences) in the document."""
-        return self.data["tf"]
-
-    @tf.setter
-    def tf(self, value):
+            self.start_or_end_stopwords = True
+
+    def __getitem__(self, key):
         """
-        Set the term frequency value.
+        Access attributes dictionary-style with obj['key'].
 
         Args:
-            value (float): The new term frequency value
-        """
-        self.data["tf"] = value
+            key (str): The attribute key to access
 
-    @property
-    def integrity(self):
-        """Get the integrity score indicating phrase coherence."""
-        return self.data["integrity"]
+        Returns:
+            Any: The value associated with the key
 
-    @property
-    def h(self):
-        """Get the final relevance score of this phrase (lower is better)."""
-        return self.data["h"]
+        Raises:
+            KeyError: If the key is not an attribute of the candidate
+        """
+        if key not in ComposedWord.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
 
-    @h.setter
-    def h(self, value):
+    def copy(self, terms=None):
         """
-        Set the final relevance score of this phrase.
+        Create a copy of this candidate.
 
         Args:
-            value (float): The new score value
-        """
-        self.data["h"] = value
+            terms (list, optional): SingleWord objects replacing the terms of
+                the copy, e.g. the equivalent terms of another document
 
-    @property
-    def start_or_end_stopwords(self):
-        """Get whether this phrase starts or ends with stopwords."""
-        return self.data["start_or_end_stopwords"]
+        Returns:
+            ComposedWord: A candidate with the same attributes and its own tags
+        """
+        cand = ComposedWord.__new__(ComposedWord)
+        cand.tags = set(self.tags)
+        cand.kw = self.kw
+        cand.unique_kw = self.unique_kw
+        cand.size = self.size
+        cand.terms = list(self.terms) if terms is None else terms
+        cand.tf = self.tf
+        cand.integrity = self.integrity
+        cand.h = self.h
+        cand.start_or_end_stopwords = self.start_or_end_stopwords
+        return cand
 
     def uptade_cand(self, cand):
         """
@@ -335,25 +328,22 @@ class ComposedWord:
             else:
                 if STOPWORD_WEIGHT == "bi":
                     # BiWeight: use probabilities of adjacent term connections
+                    graph = term_base.g
                     prob_t1 = 0.0
                     # Check connection with previous term
-                    if t > 0 and term_base.g.has_edge(
-                        self.terms[t - 1].id, self.terms[t].id
-                    ):
-                        prob_t1 = (
-                            term_base.g[self.terms[t - 1].id][self.terms[t].id]["tf"]
-                            / self.terms[t - 1].tf
-                        )
+                    if t > 0:
+                        previous = self.terms[t - 1]
+                        if graph.has_edge(previous.id, term_base.id):
+                            weight = graph.weight(previous.id, term_base.id)
+                            prob_t1 = weight / previous.tf
 
                     prob_t2 = 0.0
                     # Check connection with next term
-                    if t < len(self.terms) - 1 and term_base.g.has_edge(
-                        self.terms[t].id, self.terms[t + 1].id
-                    ):
-                        prob_t2 = (
-                            term_base.g[self.terms[t].id][self.terms[t + 1].id]["tf"]
-                            / self.terms[t + 1].tf
-                        )
+                    if t < len(self.terms) - 1:
+                        following = self.terms[t + 1]
+                        if graph.has_edge(term_base.id, following.id):
+                            weight = graph.weight(term_base.id, following.id)
+                            prob_t2 = weight / following.tf
 
                     # Calculate combined probability and update scores
                     prob = prob_t1 * prob_t2
@@ -379,6 +369,45 @@ class ComposedWord:
         # Calculate final score (lower is better)
         self.h = prod_h / ((sum_h + 1) * tf_used)
 
+    def lower_bound_h(self, features=None):
+        """
+        Compute a cheap lower bound of the score given by update_h.
+
+        The bound only uses the scores of the constituent terms. With the "bi"
+        stopword weight each stopword multiplies the product by 2 - prob and
+        lowers the sum by 1 - prob, so assuming the bigram probabilities prob
+        are at most 1, ignoring stopwords can only lower the score as long as
+        the denominator stays positive. With the other weights, the bound is
+        the score itself.
+
+        Args:
+            features (list, optional): Specific features to use for scoring
+
+        Returns:
+            float: Lower bound of the score, or -inf if no bound is available
+        """
+        sum_h = 0.0
+        prod_h = 1.0
+        stopwords = 0
+
+        for term_base in self.terms:
+            if not term_base.stopword or STOPWORD_WEIGHT == "h":
+                sum_h += term_base.h
+                prod_h *= term_base.h
+            elif STOPWORD_WEIGHT == "bi":
+                stopwords += 1
+
+        # The denominator could reach zero or change sign
+        if stopwords > 0 and sum_h + 1 - stopwords <= 0:
+            return float("-inf")
+
+        # Determine term frequency to use in scoring
+        tf_used = 1.0
+        if features is None or "KPF" in features:
+            tf_used = self.tf
+
+        return prod_h / ((sum_h + 1) * tf_used)
+
     def update_h_old(self, features=None, is_virtual=False):
         """
         Legacy method for updating the term's score.
@@ -402,20 +431,19 @@ class ComposedWord:
             # Handle stopwords with probability-based weighting
             if term_base.stopword:
                 # Calculate probability of co-occurrence with previous term
+                graph = term_base.g
+                previous = self.terms[t - 1]
                 prob_t1 = 0.0
-                if term_base.g.has_edge(self.terms[t - 1].id, self.terms[t].id):
-                    prob_t1 = (
-                        term_base.g[self.terms[t - 1].id][self.terms[t].id]["tf"]
-                        / self.terms[t - 1].tf
-                    )
+                if graph.has_edge(previous.id, term_base.id):
+                    weight = graph.weight(previous.id, term_base.id)
+                    prob_t1 = weight / previous.tf
 
                 # Calculate probability of co-occurrence with next term
+                following = self.terms[t + 1]
                 prob_t2 = 0.0
-                if term_base.g.has_edge(self.terms[t].id, self.terms[t + 1].id):
-                    prob_t2 = (
-                        term_base.g[self.terms[t].id][self.terms[t + 1].id]["tf"]
-                        / self.terms[t + 1].tf
-                    )
+                if graph.has_edge(term_base.id, following.id):
+                    weight = graph.weight(term_base.id, following.id)
+                    prob_t2 = weight / following.tf
 
                 # Update scores based on combined probability
                 prob = prob_t1 * prob_t2
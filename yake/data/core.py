@@ -1,20 +1,48 @@
 """
 Core data representation module for YAKE keyword extraction.
 
-This module contains the DataCore class which serves as the foundation for 
-processing and analyzing text documents to extract keywords. It handles text 
-preprocessing, term identification, co-occurrence analysis, and candidate 
+This module contains the DataCore class which serves as the foundation for
+processing and analyzing text documents to extract keywords. It handles text
+preprocessing, term identification, co-occurrence analysis, and candidate
 keyword generation.
 """
 
+import heapq
 import string
-import networkx as nx
+import time
+from itertools import chain
+
 import numpy as np
 
-from segtok.tokenizer import web_tokenizer, split_contractions
-from .utils import pre_filter, tokenize_sentences, get_tag
+from .utils import (
+    FLATTEN_TABLE,
+    gc_paused,
+    get_tag,
+    pre_filter,
+    preprocess,
+    tokenize_split_sentences,
+)
+from .tokenizers import get_tokenizer
 from .single_word import SingleWord
 from .composed_word import ComposedWord
+from .graph import CooccurrenceGraph
+from .scoring import score_single_terms
+from .encoding import TAG_CODES, cooccurrence_counts, ngram_occurrences
+from .serialization import (
+    encode_state,
+    merge_snapshot,
+    read_config,
+    read_snapshot,
+    restore_state,
+)
+
+# Relative margin kept between a score bound and the pruning threshold, so that
+# rounding differences between the bound and the full score never matter
+PRUNE_TOLERANCE = 1e-9
+
+# Number of characters of fed text held back beyond which sentences are
+# processed even if their boundaries are not confirmed, bounding memory usage
+MAX_STREAM_BUFFER = 1 << 20
 
 
 class DataCore:
@@ -35,13 +63,27 @@ class DataCore:
         Initialize the data core with text and configuration.
 
         Args:
-            text (str): The input text to analyze for keyword extraction
+            text (str): The input text to analyze for keyword extraction, or
+                None to start from an empty document and add its content
+                with add_text, add_sentences, feed or merge
             stopword_set (set): A set of stopwords to filter out non-content words
             config (dict, optional): Configuration options including:
                 - windows_size (int): Size of word window for co-occurrence (default: 2)
                 - n (int): Maximum length of keyword phrases (default: 3)
                 - tags_to_discard (set): POS tags to ignore (default: {"u", "d"})
                 - exclude (set): Characters to exclude (default: string.punctuation)
+                - tokenizer (str or object): Tokenizer backend, "segtok",
+                  "fast" or a custom tokenizer object (default: "segtok")
+                - keep_paragraphs (bool): Whether line breaks can mark
+                  paragraph breaks during preprocessing (default: True)
+                - keep_sentences (bool): Whether to keep the tokens of
+                  processed sentences in sentences_str and sentences_obj
+                  (default: True)
+                - token_cache (LRUCache): Cache of sentence tokens shared
+                  between documents (default: None, no caching)
+                - engine (str): Build engine, "object" to update the statistics
+                  word by word or "array" to derive them from NumPy arrays
+                  (default: "object")
         """
         # Initialize default configuration if none provided
         if config is None:
@@ -52,6 +94,11 @@ class DataCore:
         n = config.get("n", 3)
         tags_to_discard = config.get("tags_to_discard", set(["u", "d"]))
         exclude = config.get("exclude", set(string.punctuation))
+        engine = config.get("engine", "object")
+        token_cache = config.get("token_cache")
+        tokenizer = get_tokenizer(config.get("tokenizer"))
+        keep_paragraphs = config.get("keep_paragraphs", True)
+        keep_sentences = config.get("keep_sentences", True)
 
         # Initialize the state dictionary containing all component data structures
         self._state = {
@@ -60,6 +107,15 @@ class DataCore:
                 "exclude": exclude,  # Punctuation and other characters to exclude
                 "tags_to_discard": tags_to_discard,  # POS tags to ignore during analysis
                 "stopword_set": stopword_set,  # Set of stopwords for filtering
+                "engine": engine,  # Engine used to build the data structures
+                "windows_size": windows_size,  # Co-occurrence window size
+                "n": n,  # Maximum length of keyword phrases
+                "token_cache": token_cache,  # Cache of sentence tokens
+                "tokenizer": tokenizer,  # Sentence and word tokenizer
+                "keep_paragraphs": keep_paragraphs,  # Paragraph-aware
+                "keep_sentences": keep_sentences,  # Keep sentence tokens
+                # Translation table removing the excluded characters
+                "exclude_table": str.maketrans("", "", "".join(exclude)),
             },
             # Text corpus statistics
             "text_stats": {
@@ -73,9 +129,32 @@ class DataCore:
                 "sentences_obj": [],  # Nested list of processed sentence objects
                 "sentences_str": [],  # List of raw sentence strings
                 "freq_ns": {},  # Frequency distribution of n-grams by length
+                "surface_ids": {},  # Ids of the lowercased surface forms
+                "candidate_index": {},  # Surface id tuples to ComposedWord
+            },
+            # Memoized per-token results, keyed by surface form
+            "caches": {
+                "tags": {},  # (word, not first in sentence) -> tag
+                "terms": {},  # word -> (normalized term, stopword flag)
+            },
+            # Candidates skipped by score-bound pruning
+            "pruning": {
+                "valid": [],  # Every valid candidate, in insertion order
+                "pruned": [],  # Valid candidates left unscored
+                "threshold": None,  # Score that pruned candidates cannot reach
+            },
+            # Text received by feed but not processed yet
+            "stream": {
+                "raw": "",  # Raw text waiting for preprocessing
+                "text": "",  # Preprocessed text of the unconfirmed sentences
+                "started": False,  # Whether the text start was preprocessed
+                "held": [],  # Sentences of the text when it was last split
+                "scanned": 0,  # Length of the text left after the last split
             },
+            # Time spent in each stage of the pipeline, in seconds
+            "timings": {"preprocess": 0.0, "tokenize": 0.0, "build": 0.0},
             # Graph for term co-occurrence analysis
-            "g": nx.DiGraph(),  # Directed graph where nodes are terms and edges represent co-occurrences
+            "g": CooccurrenceGraph(),  # Terms linked by their co-occurrences
         }
 
         # Initialize n-gram frequencies with zero counts for each length 1 to n
@@ -83,7 +162,8 @@ class DataCore:
             self._state["collections"]["freq_ns"][i + 1] = 0.0
 
         # Process the text and build all data structures
-        self._build(text, windows_size, n)
+        if text is not None:
+            self.add_text(text)
 
     # --- Property accessors for backward compatibility ---
 
@@ -103,6 +183,21 @@ class DataCore:
         """Get the set of stopwords used for filtering."""
         return self._state["config"]["stopword_set"]
 
+    @property
+    def pruning_threshold(self):
+        """Get the score no pruned candidate reaches, None without pruning."""
+        return self._state["pruning"]["threshold"]
+
+    @property
+    def tokenizer(self):
+        """Get the tokenizer used to split text into sentences and words."""
+        return self._state["config"]["tokenizer"]
+
+    @property
+    def timings(self):
+        """Get the seconds spent preprocessing, tokenizing and building."""
+        return self._state["timings"]
+
     @property
     def g(self):
         """Get the directed graph representing term co-occurrences."""
@@ -161,37 +256,599 @@ class DataCore:
         return self._state["collections"]["freq_ns"]
 
     # --- Internal utility methods ---
-    def _build(self, text, windows_size, n):
+    def add_text(self, text):
         """
-        Build the core data structures from the input text.
+        Add a raw text to the document.
 
-        This method handles the initial processing of text, including
-        pre-filtering, sentence segmentation, and word tokenization.
+        This method handles the processing of text, including pre-filtering,
+        sentence segmentation, and word tokenization. The sentences of the
+        text are appended after those already processed, so several texts can
+        be added to the same document.
 
         Args:
             text (str): The input text to process
+        """
+        self.add_split_sentences(self.split_text(text))
+
+    def split_text(self, text):
+        """
+        Pre-filter a raw text and split it into sentences.
+
+        The document is not modified, so the sentences can be tokenized and
+        added by add_split_sentences, possibly on several documents.
+
+        Args:
+            text (str): The input text to split
+
+        Returns:
+            list: The sentences of the text, as strings
+        """
+        timings = self._state["timings"]
+        start = time.perf_counter()
+
+        # Pre-process text for normalization
+        text = preprocess(text, self._state["config"]["keep_paragraphs"])
+        preprocessed = time.perf_counter()
+        timings["preprocess"] += preprocessed - start
+
+        # Split text into sentences
+        sentences = self.tokenizer.split_sentences(text)
+        timings["tokenize"] += time.perf_counter() - preprocessed
+        return sentences
+
+    def add_split_sentences(self, sentences):
+        """
+        Tokenize sentences and add them to the document.
+
+        Args:
+            sentences (list): Sentences to add, as strings
+        """
+        start = time.perf_counter()
+        tokenized = tokenize_split_sentences(
+            sentences, self._state["config"]["token_cache"], self.tokenizer
+        )
+        self._state["timings"]["tokenize"] += time.perf_counter() - start
+
+        self.add_sentences(tokenized)
+
+    def add_sentences(self, sentences):
+        """
+        Add tokenized sentences to the document.
+
+        Sentences are appended after those already processed, so a document
+        can be built from several batches of sentences. Tokens are used as
+        they are: no pre-filtering or tokenization is applied.
+
+        Args:
+            sentences (list): Sentences to add, each one a list of tokens
+        """
+        start = time.perf_counter()
+        first_sentence_id = self.number_of_sentences
+        self.number_of_sentences += len(sentences)
+        if self._state["config"]["keep_sentences"]:
+            self.sentences_str.extend(sentences)
+
+        windows_size = self._state["config"]["windows_size"]
+        n = self._state["config"]["n"]
+
+        # Derive all statistics from arrays if requested
+        if self._state["config"]["engine"] == "array":
+            self._build_arrays(sentences, first_sentence_id, windows_size, n)
+        else:
+            # Continue from the global position of the last processed word
+            pos_text = self.number_of_words
+
+            # Create a processing context dictionary to pass fewer arguments
+            context = {"windows_size": windows_size, "n": n}
+
+            # Process each sentence individually
+            sentence_ids = range(first_sentence_id, self.number_of_sentences)
+            for sentence_id, sentence in zip(sentence_ids, sentences):
+                pos_text = self._process_sentence(
+                    sentence, sentence_id, pos_text, context
+                )
+
+            # Store the total number of processed words
+            self.number_of_words = pos_text
+
+        self._state["timings"]["build"] += time.perf_counter() - start
+
+    def merge(self, other):
+        """
+        Add the statistics of another document after those of this one.
+
+        The sentences of the other document are considered to follow the
+        sentences already processed: their sentence ids and word positions
+        are offset, terms and candidates are matched by their normalized form
+        and term ids are remapped. The result is the same as adding the
+        sentences of the other document with add_sentences, so parts of a
+        corpus can be processed separately and combined before scoring.
+
+        Both documents must share the same configuration and stopwords. The
+        other document is left unchanged.
+
+        Args:
+            other (DataCore): Document whose statistics are added
+        """
+        start = time.perf_counter()
+        sentence_offset = self.number_of_sentences
+        word_offset = self.number_of_words
+
+        # Match terms by normalized form, new terms are created in id order
+        term_map = []
+        for other_term in other.terms.values():
+            unique_term = other_term.unique_term
+            term_obj = self.terms.get(unique_term)
+            if term_obj is None:
+                term_obj = SingleWord(unique_term, len(self.terms), self.g)
+                term_obj.stopword = other_term.stopword
+                self.g.add_node(term_obj.id)
+                self.terms[unique_term] = term_obj
+            term_map.append(term_obj)
+
+            # Occurrences of the other document come after the existing ones
+            term_obj.tf += other_term.tf
+            term_obj.tf_a += other_term.tf_a
+            term_obj.tf_n += other_term.tf_n
+            for sentence_id, occurrences in other_term.occurs.items():
+                term_obj.occurs[sentence_id + sentence_offset] = [
+                    (pos_sent, pos_text + word_offset)
+                    for pos_sent, pos_text in occurrences
+                ]
+                term_obj.sentence_ids.append(sentence_id + sentence_offset)
+
+        for left, right, count in other.g.edges():
+            self.g.add_cooccur(term_map[left].id, term_map[right].id, count)
+
+        # Match candidates by normalized form, copying the new ones
+        candidates = self.candidates
+        for other_cand in other.candidates.values():
+            cand = candidates.get(other_cand.unique_kw)
+            if cand is None:
+                candidates[other_cand.unique_kw] = other_cand.copy(
+                    [term_map[term.id] for term in other_cand.terms]
+                )
+            else:
+                cand.uptade_cand(other_cand)
+                cand.tf += other_cand.tf
+
+        # Remap the surface ids identifying the n-grams of the candidates
+        other_collections = other._state["collections"]
+        other_surfaces = other_collections["surface_ids"]
+        surface_map = [self._get_surface_id(word) for word in other_surfaces]
+        candidate_index = self._state["collections"]["candidate_index"]
+        other_index = other_collections["candidate_index"]
+        for other_key, other_cand in other_index.items():
+            key = tuple(map(surface_map.__getitem__, other_key))
+            candidate_index[key] = candidates[other_cand.unique_kw]
+
+        for size, count in other.freq_ns.items():
+            self.freq_ns[size] += count
+
+        if self._state["config"]["keep_sentences"]:
+            self.sentences_str.extend(other.sentences_str)
+            self.sentences_obj.extend(
+                [
+                    [
+                        (tag, word, term_map[term_obj.id])
+                        for tag, word, term_obj in block
+                    ]
+                    for block in sentence
+                ]
+                for sentence in other.sentences_obj
+            )
+
+        self.number_of_sentences += other.number_of_sentences
+        self.number_of_words += other.number_of_words
+
+        # Per-token results only depend on the configuration
+        for name, cache in other._state["caches"].items():
+            self._state["caches"][name].update(cache)
+
+        self._state["timings"]["build"] += time.perf_counter() - start
+
+    def merge_bytes(self, data):
+        """
+        Add the statistics of a binary snapshot after those of this document.
+
+        The result is the same as merging the document loaded by from_bytes,
+        but the statistics are read from the arrays of the snapshot without
+        building that document first, which makes snapshots the cheapest way
+        to send partial statistics between processes.
+
+        Args:
+            data (bytes-like): Snapshot created by to_bytes from a document
+                with the same configuration and stopwords
+
+        Raises:
+            ValueError: If data is not a snapshot or has an unsupported version
+        """
+        start = time.perf_counter()
+        header, arrays = read_snapshot(data)
+        with gc_paused():
+            merge_snapshot(self._state, header, arrays)
+        self._state["timings"]["build"] += time.perf_counter() - start
+
+    def to_bytes(self):
+        """
+        Serialize the document to a compact binary snapshot.
+
+        Terms, occurrences, co-occurrence edges, candidates and sentences are
+        stored as flat arrays in a versioned format, which from_bytes reads
+        back. Caches are left out, and custom tokenizer objects must be given
+        again when loading the snapshot.
+
+        Returns:
+            bytes: The snapshot
+        """
+        return encode_state(self._state)
+
+    @classmethod
+    def from_bytes(cls, data, stopword_set=None, config=None):
+        """
+        Load a document from a binary snapshot created by to_bytes.
+
+        The arrays of the snapshot are read in place with NumPy, without
+        copying data, before the term and candidate objects are rebuilt in
+        bulk, one array at a time, with the garbage collector paused.
+
+        Args:
+            data (bytes-like): The snapshot, e.g. bytes, bytearray or mmap
+            stopword_set (set, optional): Stopwords replacing the stored ones,
+                e.g. to share an already loaded set
+            config (dict, optional): Configuration options overriding the
+                stored ones, e.g. a token cache or a custom tokenizer
+
+        Returns:
+            DataCore: The loaded document
+
+        Raises:
+            ValueError: If data is not a snapshot or has an unsupported version
+        """
+        header, arrays = read_snapshot(data)
+        core_config, stored_stopwords = read_config(header, arrays)
+        core_config.update(config or {})
+        if stopword_set is None:
+            stopword_set = stored_stopwords
+
+        dc = cls(text=None, stopword_set=stopword_set, config=core_config)
+        with gc_paused():
+            restore_state(dc._state, header, arrays)
+        return dc
+
+    def __getstate__(self):
+        """
+        Get the state to pickle, leaving out caches.
+
+        The token cache is shared with other documents and the per-token
+        caches can be rebuilt, so neither is worth sending to another process.
+
+        Returns:
+            dict: The state of the document
+        """
+        state = dict(self._state)
+        state["config"] = dict(state["config"], token_cache=None)
+        state["caches"] = {name: {} for name in state["caches"]}
+        return state
+
+    def __setstate__(self, state):
+        """
+        Restore a pickled document.
+
+        Args:
+            state (dict): The state returned by __getstate__
+        """
+        self._state = state
+
+    def feed(self, chunk):
+        """
+        Add a chunk of raw text to the document.
+
+        Chunks can split the text anywhere, even inside words. Sentence
+        boundaries may depend on the text that follows them, so sentences are
+        only processed once their boundaries are confirmed: they must be found
+        again when the text is split after more chunks were fed, and be
+        followed by two more sentences. The text held back is split again
+        each time it grows by half, so that the total work stays linear. Call
+        finalize once the whole text was fed.
+
+        Sentences are processed without confirmation once more than
+        MAX_STREAM_BUFFER characters are held back, and a single longer
+        sentence is then cut, so results can only differ from those on the
+        whole text for such texts.
+
+        Args:
+            chunk (str): The next part of the text
+        """
+        self._feed(chunk, final=False)
+
+    def finalize(self):
+        """Process the text held back by feed, as the end of the text."""
+        self._feed("", final=True)
+
+    def _feed(self, chunk, final):
+        """
+        Preprocess, split and process the confirmed sentences of a chunk.
+
+        Args:
+            chunk (str): The next part of the text
+            final (bool): Whether this is the end of the text
+        """
+        stream = self._state["stream"]
+        timings = self._state["timings"]
+        start = time.perf_counter()
+
+        stream["text"] += self._preprocess_chunk(chunk, final)
+        text = stream["text"]
+        preprocessed = time.perf_counter()
+        timings["preprocess"] += preprocessed - start
+
+        # Splitting again is only worth it once the held back text grew by half
+        overflow = len(text) > MAX_STREAM_BUFFER
+        grown = 2 * len(text) >= 3 * stream["scanned"]
+        if not final and not overflow and not grown:
+            return
+
+        sentences = self.tokenizer.split_sentences(text)
+        if final:
+            count, rest = len(sentences), len(text)
+        else:
+            count, rest = self._confirmed_sentences(text, sentences, overflow)
+        stream["text"] = text[rest:]
+        stream["held"] = [] if final else sentences[count:]
+        stream["scanned"] = len(stream["text"])
+        timings["tokenize"] += time.perf_counter() - preprocessed
+
+        if count > 0:
+            self.add_split_sentences(sentences[:count])
+
+    def _confirmed_sentences(self, text, sentences, overflow):
+        """
+        Find the held back sentences whose boundaries are confirmed.
+
+        Args:
+            text (str): Preprocessed text held back so far
+            sentences (list): Sentences of the text
+            overflow (bool): Whether the text exceeds MAX_STREAM_BUFFER
+
+        Returns:
+            tuple: Number of confirmed sentences, and offset in the text of the
+                   first sentence left
+        """
+        # Offsets of the sentences, which are substrings of the text
+        offsets = []
+        offset = 0
+        for sentence in sentences:
+            offset = text.find(sentence, offset)
+            if offset < 0:
+                break
+            offsets.append(offset)
+            offset += len(sentence)
+
+        # Past the limit, only the last sentence is held back if it is short
+        if overflow:
+            last = offsets[-1] if len(offsets) == len(sentences) > 0 else 0
+            if last == 0 or len(text) - last > MAX_STREAM_BUFFER:
+                return len(sentences), len(text)
+            return len(sentences) - 1, last
+
+        # Boundaries must be the same in the previous split of the text
+        count = 0
+        held = self._state["stream"]["held"]
+        limit = min(len(offsets) - 1, len(sentences) - 2, len(held) - 1)
+        while count < limit and sentences[count] == held[count]:
+            count += 1
+        return count, offsets[count] if count > 0 else 0
+
+    def _preprocess_chunk(self, chunk, final):
+        """
+        Preprocess a chunk of raw text consistently with preprocess.
+
+        Args:
+            chunk (str): The next part of the text
+            final (bool): Whether this is the end of the text
+
+        Returns:
+            str: The preprocessed text that can be appended to the stream
+        """
+        stream = self._state["stream"]
+        raw = stream["raw"] + chunk
+
+        # Paragraph detection needs complete lines
+        if self._state["config"]["keep_paragraphs"]:
+            cut = len(raw) if final else raw.rfind("\n")
+            if cut < 0:
+                stream["raw"] = raw
+                return ""
+            rest = cut + 1
+            stream["raw"] = raw[rest:]
+            return pre_filter(raw[:cut])
+
+        # The separator put before the text depends on its first characters
+        if not stream["started"]:
+            if not raw.strip() and not final:
+                stream["raw"] = raw
+                return ""
+            stream["raw"] = ""
+            stream["started"] = True
+            return preprocess(raw, keep_paragraphs=False)
+
+        return raw.translate(FLATTEN_TABLE)
+
+    def _build_arrays(self, sentences, first_sentence_id, windows_size, n):
+        """
+        Build the core data structures with the array engine.
+
+        The tokenized document is first encoded as NumPy arrays holding the
+        term id, surface id, tag code, block id and sentence id of every word.
+        Term frequencies, co-occurrence counts and candidate n-grams are then
+        derived from these arrays at once, giving the same structures as the
+        word-by-word build.
+
+        Args:
+            sentences (list): Sentences to process, each one a list of tokens
+            first_sentence_id (int): Id of the first sentence
             windows_size (int): Size of word window for co-occurrence analysis
             n (int): Maximum n-gram length to consider for keyword candidates
         """
-        # Pre-process text for normalization
-        text = pre_filter(text)
+        # Encode the words of every sentence, split into blocks at punctuation
+        words = []  # (tag, word, term_obj) tuple of each word
+        encoded = []  # Term, surface, tag, block, sentence and position
+        block = 0
+        for sentence_id, sentence in enumerate(sentences, first_sentence_id):
+            sentence_obj_aux = []
+            block_of_word_obj = []
+            block += 1
+
+            for pos_sent, word in enumerate(sentence):
+                if len([c for c in word if c in self.exclude]) == len(word):
+                    if len(block_of_word_obj) > 0:
+                        sentence_obj_aux.append(block_of_word_obj)
+                        block_of_word_obj = []
+                        block += 1
+                    continue
+
+                tag = self.get_tag(word, pos_sent)
+                term_obj = self.get_term(word)
+                block_of_word_obj.append((tag, word, term_obj))
+                encoded.append(
+                    (
+                        term_obj.id,
+                        self._get_surface_id(word),
+                        TAG_CODES[tag],
+                        block,
+                        sentence_id,
+                        pos_sent,
+                    )
+                )
 
-        # Split text into sentences and tokenize
-        self.sentences_str = tokenize_sentences(text)
-        self.number_of_sentences = len(self.sentences_str)
+            if len(block_of_word_obj) > 0:
+                sentence_obj_aux.append(block_of_word_obj)
+            if len(sentence_obj_aux) > 0:
+                if self._state["config"]["keep_sentences"]:
+                    self.sentences_obj.append(sentence_obj_aux)
+                words.extend(chain.from_iterable(sentence_obj_aux))
 
-        # Initialize position counter for global word positions
-        pos_text = 0
+        first_position = self.number_of_words
+        self.number_of_words += len(words)
+        if len(words) == 0:
+            return
 
-        # Create a processing context dictionary to pass fewer arguments
-        context = {"windows_size": windows_size, "n": n}
+        columns = np.array(encoded, dtype=np.int64).T
+        term_ids, surface_ids, tag_codes = columns[:3]
+        blocks, sentence_ids, positions = columns[3:]
 
-        # Process each sentence individually
-        for sentence_id, sentence in enumerate(self.sentences_str):
-            pos_text = self._process_sentence(sentence, sentence_id, pos_text, context)
+        self._add_array_occurrences(
+            term_ids, tag_codes, sentence_ids, positions, first_position
+        )
+
+        # Count co-occurrences between usable words of the same block
+        known = TAG_CODES.keys() & self.tags_to_discard
+        discarded = [TAG_CODES[tag] for tag in known]
+        usable = ~np.isin(tag_codes, discarded)
+        left, right, counts = cooccurrence_counts(
+            term_ids, blocks, usable, windows_size
+        )
+        for left_id, right_id, count in zip(
+            left.tolist(), right.tolist(), counts.tolist()
+        ):
+            self.g.add_cooccur(left_id, right_id, float(count))
 
-        # Store the total number of processed words
-        self.number_of_words = pos_text
+        self._add_array_candidates(words, surface_ids, tag_codes, blocks, n)
+
+    def _add_array_occurrences(
+        self, term_ids, tag_codes, sentence_ids, positions, first_position
+    ):
+        """
+        Record the occurrences of the encoded words in their term objects.
+
+        Args:
+            term_ids (np.ndarray): Term id of each word
+            tag_codes (np.ndarray): Tag code of each word
+            sentence_ids (np.ndarray): Sentence id of each word
+            positions (np.ndarray): Position of each word in its sentence
+            first_position (int): Position of the first word in the document
+        """
+        terms = list(self.terms.values())
+        count = len(terms)
+        acronyms = term_ids[tag_codes == TAG_CODES["a"]]
+        capitalized = term_ids[tag_codes == TAG_CODES["n"]]
+        frequencies = {
+            "tf": np.bincount(term_ids, minlength=count),
+            "tf_a": np.bincount(acronyms, minlength=count),
+            "tf_n": np.bincount(capitalized, minlength=count),
+        }
+        for name, values in frequencies.items():
+            for term_obj, value in zip(terms, values.tolist()):
+                setattr(term_obj, name, getattr(term_obj, name) + float(value))
+
+        # Words are encoded in document order, so sentence ids stay sorted
+        for pos_text, (term_id, sentence_id, pos_sent) in enumerate(
+            zip(term_ids.tolist(), sentence_ids.tolist(), positions.tolist()),
+            first_position,
+        ):
+            term_obj = terms[term_id]
+            if sentence_id not in term_obj.occurs:
+                term_obj.occurs[sentence_id] = []
+                term_obj.sentence_ids.append(sentence_id)
+            term_obj.occurs[sentence_id].append((pos_sent, pos_text))
+
+    def _add_array_candidates(self, words, surface_ids, tag_codes, blocks, n):
+        """
+        Create the candidates of every n-gram found in the encoded words.
+
+        Candidates are created in the order of their first occurrence, sorted
+        by end position then length, as in the word-by-word build, so that
+        candidates with equal scores keep the same ranking.
+
+        Args:
+            words (list): (tag, word, term_obj) tuple of each word
+            surface_ids (np.ndarray): Surface id of each word
+            tag_codes (np.ndarray): Tag code of each word
+            blocks (np.ndarray): Block id of each word
+            n (int): Maximum candidate length
+        """
+        candidate_index = self._state["collections"]["candidate_index"]
+        levels = ngram_occurrences(surface_ids, tag_codes, blocks, n)
+
+        ngrams = []
+        for level in levels:
+            size = level["size"]
+            if size > 1:
+                self.freq_ns[size] += float(len(level["starts"]))
+
+            # Collect the distinct tag sequences of each n-gram
+            tags = [set() for _ in range(len(level["counts"]))]
+            width = int(level["tags"].max()) + 1
+            pairs = level["ngrams"] * width + level["tags"]
+            _, distinct = np.unique(pairs, return_index=True)
+            for occurrence in distinct.tolist():
+                start = int(level["starts"][occurrence])
+                end = start + size
+                tags[level["ngrams"][occurrence]].add(
+                    "".join(w[0] for w in words[start:end])
+                )
+
+            for start, count, ngram_tags in zip(
+                level["first"].tolist(), level["counts"].tolist(), tags
+            ):
+                end = start + size
+                ngrams.append((end - 1, size, start, count, ngram_tags))
+
+        # Create the candidates in order of first occurrence
+        ngrams.sort(key=lambda ngram: (ngram[0], ngram[1]))
+        for _, size, start, count, ngram_tags in ngrams:
+            end = start + size
+            cand = ComposedWord(words[start:end])
+            cand.tags = ngram_tags
+            if cand.unique_kw not in self.candidates:
+                self.candidates[cand.unique_kw] = cand
+            else:
+                self.candidates[cand.unique_kw].uptade_cand(cand)
+            self.candidates[cand.unique_kw].tf += float(count)
+
+            key = tuple(surface_ids[start:end].tolist())
+            candidate_index[key] = self.candidates[cand.unique_kw]
 
     def _process_sentence(self, sentence, sentence_id, pos_text, context):
         """
@@ -214,6 +871,7 @@ class DataCore:
         block_of_word_obj = (
             []
         )  # Current block of continuous words (separated by punctuation)
+        block_keys = []  # Surface ids of the words in the current block
 
         # Extend the context with sentence information for word processing
         processing_context = context.copy()
@@ -227,11 +885,13 @@ class DataCore:
                 if len(block_of_word_obj) > 0:
                     sentence_obj_aux.append(block_of_word_obj)
                     block_of_word_obj = []
+                    block_keys = []
             else:
                 # Process meaningful words
                 word_context = {
                     "pos_sent": pos_sent,  # Position within the sentence
                     "block_of_word_obj": block_of_word_obj,  # Current word block
+                    "block_keys": block_keys,  # Surface ids of the block words
                 }
                 # Process this word and update position counter
                 pos_text = self._process_word(
@@ -243,7 +903,8 @@ class DataCore:
             sentence_obj_aux.append(block_of_word_obj)
 
         # Add processed sentence to collection if not empty
-        if len(sentence_obj_aux) > 0:
+        keep_sentences = self._state["config"]["keep_sentences"]
+        if len(sentence_obj_aux) > 0 and keep_sentences:
             self.sentences_obj.append(sentence_obj_aux)
 
         return pos_text
@@ -270,6 +931,7 @@ class DataCore:
         n = context["n"]
         pos_sent = word_context["pos_sent"]
         block_of_word_obj = word_context["block_of_word_obj"]
+        block_keys = word_context["block_keys"]
 
         # Get the part-of-speech tag for this word
         tag = self.get_tag(word, pos_sent)
@@ -288,10 +950,14 @@ class DataCore:
             self._update_cooccurrence(block_of_word_obj, term_obj, windows_size)
 
         # Generate keyword candidates involving this term
-        self._generate_candidates((tag, word), term_obj, block_of_word_obj, n)
+        surface_id = self._get_surface_id(word)
+        self._generate_candidates(
+            (tag, word, term_obj, surface_id), block_of_word_obj, block_keys, n
+        )
 
         # Add this word to the current block
         block_of_word_obj.append((tag, word, term_obj))
+        block_keys.append(surface_id)
 
         return pos_text
 
@@ -318,43 +984,83 @@ class DataCore:
                 # Add co-occurrence edge from previous term to current term
                 self.add_cooccur(block_of_word_obj[w][2], term_obj)
 
-    def _generate_candidates(self, term, term_obj, block_of_word_obj, n):
+    def _get_surface_id(self, word):
+        """
+        Get the integer id of the lowercased surface form of a word.
+
+        Args:
+            word (str): The word as it appears in the text
+
+        Returns:
+            int: Id shared by every occurrence of the same lowercased word
+        """
+        surface_ids = self._state["collections"]["surface_ids"]
+        unique_word = word.lower()
+        surface_id = surface_ids.get(unique_word)
+        if surface_id is None:
+            surface_id = len(surface_ids)
+            surface_ids[unique_word] = surface_id
+        return surface_id
+
+    def _generate_candidates(self, term, block_of_word_obj, block_keys, n):
         """
         Generate keyword candidates from terms.
 
-        Creates single-term candidates and multi-term candidates up to length n,
-        combining the current term with previous terms.
+        Creates single-term candidates and multi-term candidates up to length
+        n, combining the current term with previous terms. Each n-gram is
+        looked up by the tuple of its surface ids first, so a ComposedWord
+        (and its surface strings) is only built the first time the n-gram is
+        seen.
 
         Args:
-            term (tuple): Current term as (tag, word) tuple
-            term_obj (SingleWord): Term object for the current word
+            term (tuple): Current term as a (tag, word, term_obj, surface_id)
+                tuple
             block_of_word_obj (list): Current block of words
+            block_keys (list): Surface ids of the words in the current block
             n (int): Maximum candidate length to generate
         """
+        tag, word, term_obj, surface_id = term
+        current = [(tag, word, term_obj)]
+
         # Create single-term candidate
-        candidate = [term + (term_obj,)]
-        cand = ComposedWord(candidate)
-        self.add_or_update_composedword(cand)
+        self._add_candidate_occurrence((surface_id,), tag, current)
 
-        # Calculate window of previous words to consider for multi-term candidates
-        word_windows = list(
-            range(max(0, len(block_of_word_obj) - (n - 1)), len(block_of_word_obj))
-        )[
-            ::-1
-        ]  # Reverse to build phrases from right to left
+        # Extend the candidate from right to left with the previous words
+        block_size = len(block_of_word_obj)
+        first_start = max(0, block_size - (n - 1))
+        for start in range(block_size - 1, first_start - 1, -1):
+            # Update frequency count for this n-gram length
+            self.freq_ns[block_size - start + 1] += 1.0
 
-        # Generate multi-term candidates with increasing length
-        for w in word_windows:
-            # Add previous term to candidate
-            candidate.append(block_of_word_obj[w])
+            words = block_of_word_obj[start:]
+            self._add_candidate_occurrence(
+                tuple(block_keys[start:]) + (surface_id,),
+                "".join([w[0] for w in words]) + tag,
+                words + current,
+            )
 
-            # Update frequency count for this n-gram length
-            self.freq_ns[len(candidate)] += 1.0
+    def _add_candidate_occurrence(self, key, tags, words):
+        """
+        Record an occurrence of a candidate n-gram.
+
+        Args:
+            key (tuple): Surface ids of the words of the n-gram
+            tags (str): Tag sequence of this occurrence
+            words (list): (tag, word, term_obj) tuples of the n-gram, only used
+                          when the n-gram is seen for the first time
+        """
+        candidate_index = self._state["collections"]["candidate_index"]
+        cand = candidate_index.get(key)
 
-            # Create and register the composed word candidate
-            # (reverse to maintain correct word order)
-            cand = ComposedWord(candidate[::-1])
+        if cand is None:
+            # First occurrence: build the candidate and register it
+            cand = ComposedWord(words)
             self.add_or_update_composedword(cand)
+            candidate_index[key] = self.candidates[cand.unique_kw]
+            return
+
+        cand.tags.add(tags)
+        cand.tf += 1.0
 
     # --- Public API methods ---
 
@@ -371,7 +1077,14 @@ class DataCore:
                  ("d" for digit, "u" for unusual, "a" for acronym,
                   "n" for proper noun, "p" for plain word)
         """
-        return get_tag(word, i, self.exclude)
+        # The tag only depends on the position through i > 0
+        key = (word, i > 0)
+        tags = self._state["caches"]["tags"]
+        tag = tags.get(key)
+        if tag is None:
+            tag = get_tag(word, i, self.exclude)
+            tags[key] = tag
+        return tag
 
     def build_candidate(self, candidate_string):
         """
@@ -389,11 +1102,7 @@ class DataCore:
         """
 
         # Tokenize the candidate string
-        tokenized_words = [
-            w
-            for w in split_contractions(web_tokenizer(candidate_string.lower()))
-            if not (w.startswith("'") and len(w) > 1) and len(w) > 0
-        ]
+        tokenized_words = self.tokenizer.tokenize(candidate_string.lower())
 
         # Process each word in the candidate
         candidate_terms = []
@@ -416,7 +1125,7 @@ class DataCore:
         # Create and return the composed word
         return ComposedWord(candidate_terms)
 
-    def build_single_terms_features(self, features=None):
+    def build_single_terms_features(self, features=None, vectorized=False):
         """
         Calculates and updates statistical features for all single terms in the text.
         This includes term frequency statistics and other features specified in the
@@ -425,6 +1134,14 @@ class DataCore:
 
         Args:
             features (list, optional): Specific features to calculate
+            vectorized (bool, optional): Compute the features of all terms at
+                once with NumPy instead of calling SingleWord.update_h on each
+                term
+
+        Returns:
+            dict or None: With vectorized, arrays of every feature and of the
+                final score "h", aligned with self.terms; only "h" is written
+                back to the term objects. None otherwise.
         """
         # Filter to valid terms (non-stopwords)
         valid_terms = [term for term in self.terms.values() if not term.stopword]
@@ -432,7 +1149,7 @@ class DataCore:
 
         # Skip if no valid terms
         if len(valid_tfs) == 0:
-            return
+            return None
 
         # Calculate frequency statistics
         avg_tf = valid_tfs.mean()
@@ -448,25 +1165,114 @@ class DataCore:
         }
 
         # Update all terms with the calculated statistics
+        if vectorized:
+            return score_single_terms(
+                list(self.terms.values()), self.g, stats, features
+            )
         list(map(lambda x: x.update_h(stats, features=features), self.terms.values()))
+        return None
 
-    def build_mult_terms_features(self, features=None):
+    def build_mult_terms_features(self, features=None, prune=None):
         """
         Build features for multi-word terms.
 
         Updates the features for all valid multi-word candidate terms (n-grams).
         Only candidates that pass the validity check will have their features updated.
 
+        With pruning, candidates are scored in increasing order of a cheap
+        lower bound of their score, and the remaining ones are skipped as soon
+        as the bound exceeds the score of the prune-th best candidate, since
+        they can not reach the top prune candidates. Skipped candidates can
+        still be scored later with score_pruned_candidates.
+
         Args:
             features (list, optional): List of features to build. If None, all available features will be built.
+            prune (int, optional): Number of best candidates that must be
+                scored, None to score every candidate (default: None)
+
+        Returns:
+            list: The scored valid candidates, in insertion order
         """
+        valid_candidates = [
+            cand for cand in self.candidates.values() if cand.is_valid()
+        ]
+        pruning = self._state["pruning"]
+        pruning.update(valid=valid_candidates, pruned=[], threshold=None)
+
+        if prune is not None and 0 < prune < len(valid_candidates):
+            return self._build_pruned(valid_candidates, features, prune)
+
         # Update only valid candidates (filter then apply update_h)
-        list(
-            map(
-                lambda x: x.update_h(features=features),
-                [cand for cand in self.candidates.values() if cand.is_valid()],
-            )
-        )
+        list(map(lambda x: x.update_h(features=features), valid_candidates))
+        return valid_candidates
+
+    def score_pruned_candidates(self, features=None):
+        """
+        Score the candidates skipped by the last pruned build.
+
+        Args:
+            features (list, optional): Specific features to use for scoring
+
+        Returns:
+            list: Every valid candidate, in insertion order
+        """
+        pruning = self._state["pruning"]
+        for cand in pruning["pruned"]:
+            cand.update_h(features=features)
+        pruning.update(pruned=[], threshold=None)
+        return pruning["valid"]
+
+    def _build_pruned(self, candidates, features, keep):
+        """
+        Score candidates in bound order until the rest cannot reach the top.
+
+        Args:
+            candidates (list): Valid candidates, in insertion order
+            features (list, optional): Specific features to use for scoring
+            keep (int): Number of best candidates that must be scored
+
+        Returns:
+            list: The scored candidates, in insertion order
+        """
+        # Bigram probabilities are at most 1 only with a window of one word
+        bounded = self._state["config"]["windows_size"] <= 1
+        bounds = []
+        for cand in candidates:
+            if bounded or not any(term.stopword for term in cand.terms):
+                bounds.append(cand.lower_bound_h(features))
+            else:
+                bounds.append(float("-inf"))
+        order = sorted(range(len(candidates)), key=bounds.__getitem__)
+
+        # Max-heap (negated scores) of the keep best scores seen so far
+        best = []
+        position = 0
+        while position < len(order):
+            if len(best) == keep:
+                threshold = -best[0]
+                if (
+                    bounds[order[position]]
+                    > threshold + abs(threshold) * PRUNE_TOLERANCE
+                ):
+                    break
+
+            cand = candidates[order[position]]
+            cand.update_h(features=features)
+            if len(best) < keep:
+                heapq.heappush(best, -cand.h)
+            elif cand.h < -best[0]:
+                heapq.heapreplace(best, -cand.h)
+            position += 1
+
+        if position == len(order):
+            return candidates
+
+        skipped = set(order[position:])
+        pruning = self._state["pruning"]
+        pruning["pruned"] = [candidates[index] for index in sorted(skipped)]
+        pruning["threshold"] = -best[0]
+        numbered = enumerate(candidates)
+        return [cand for index, cand in numbered if index not in skipped]
 
     def get_term(self, str_word, save_non_seen=True):
         """
@@ -481,6 +1287,40 @@ class DataCore:
         Returns:
             SingleWord: Term object representing this word
         """
+        # Normalize the term once per surface form
+        term_cache = self._state["caches"]["terms"]
+        normalized = term_cache.get(str_word)
+        if normalized is None:
+            normalized = self._normalize_term(str_word)
+            term_cache[str_word] = normalized
+        unique_term, isstopword = normalized
+
+        # Return existing term if already processed
+        if unique_term in self.terms:
+            return self.terms[unique_term]
+
+        # Create the term object
+        term_id = len(self.terms)
+        term_obj = SingleWord(unique_term, term_id, self.g)
+        term_obj.stopword = isstopword
+
+        # Save the term to the collection if requestedComposedWord instance to add or update in the candidates dictionary
+        if save_non_seen:
+            self.g.add_node(term_id)
+            self.terms[unique_term] = term_obj
+
+        return term_obj
+
+    def _normalize_term(self, str_word):
+        """
+        Compute the normalized form and stopword flag of a word.
+
+        Args:
+            str_word (str): The word as it appears in the text
+
+        Returns:
+            tuple: (unique_term, isstopword) for the word
+        """
         # Normalize the term (convert to lowercase)
         unique_term = str_word.lower()
 
@@ -491,14 +1331,10 @@ class DataCore:
         if unique_term.endswith("s") and len(unique_term) > 3:
             unique_term = unique_term[:-1]
 
-        # Return existing term if already processed
-        if unique_term in self.terms:
-            return self.terms[unique_term]
-
         # Remove punctuation for further analysis
-        simples_unique_term = unique_term
-        for pontuation in self.exclude:
-            simples_unique_term = simples_unique_term.replace(pontuation, "")
+        simples_unique_term = unique_term.translate(
+            self._state["config"]["exclude_table"]
+        )
 
         # Determine if this is a stopword (original form, normalized form, or too short)
         isstopword = (
@@ -506,18 +1342,7 @@ class DataCore:
             or unique_term in self.stopword_set
             or len(simples_unique_term) < 3
         )
-
-        # Create the term object
-        term_id = len(self.terms)
-        term_obj = SingleWord(unique_term, term_id, self.g)
-        term_obj.stopword = isstopword
-
-        # Save the term to the collection if requestedComposedWord instance to add or update in the candidates dictionary
-        if save_non_seen:
-            self.g.add_node(term_id)
-            self.terms[unique_term] = term_obj
-
-        return term_obj
+        return unique_term, isstopword
 
     def add_cooccur(self, left_term, right_term):
         """
@@ -531,13 +1356,8 @@ class DataCore:
             left_term (SingleWord): Source term in the relationship
             right_term (SingleWord): Target term in the relationship
         """
-        # Check if the edge already exists
-        if right_term.id not in self.g[left_term.id]:
-            # Create a new edge with initial weight
-            self.g.add_edge(left_term.id, right_term.id, tf=0.0)
-
-        # Increment the co-occurrence frequency
-        self.g[left_term.id][right_term.id]["tf"] += 1.0
+        # Create the edge if needed and increment the co-occurrence frequency
+        self.g.add_cooccur(left_term.id, right_term.id)
 
     def add_or_update_composedword(self, cand):
         """
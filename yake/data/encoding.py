@@ -0,0 +1,137 @@
+"""
+Array encoding module for YAKE keyword extraction.
+
+This module contains the vectorized helpers of the "array" build engine of
+DataCore. The document is first encoded as parallel NumPy arrays with one
+entry per word (term id, surface id, tag code and block id), and co-occurrence
+counts and n-gram occurrences are then derived from these arrays at once,
+instead of being updated word by word.
+"""
+
+import numpy as np
+
+# Tags produced by get_tag, indexed by their integer code
+TAGS = "duanp"
+TAG_CODES = {tag: code for code, tag in enumerate(TAGS)}
+
+
+def cooccurrence_counts(term_ids, blocks, usable, windows_size):
+    """
+    Count the co-occurrences of terms within a window.
+
+    A pair (left, right) is counted for every word and each of the previous
+    windows_size words of the same block, when both words are usable.
+
+    Args:
+        term_ids (np.ndarray): Term id of each word
+        blocks (np.ndarray): Block id of each word
+        usable (np.ndarray): Whether each word takes part in co-occurrences
+        windows_size (int): Size of the co-occurrence window
+
+    Returns:
+        tuple: (left, right, counts) arrays with one entry per distinct pair,
+               ordered by first occurrence as in the word-by-word build
+    """
+    count = len(term_ids)
+    positions = np.arange(count, dtype=np.int64)
+    pair_codes = []
+    pair_ranks = []
+
+    # Previous words are visited from the farthest to the nearest
+    for distance in range(windows_size, 0, -1):
+        right = positions[distance:]
+        left = right - distance
+        valid = (blocks[left] == blocks[right]) & usable[left] & usable[right]
+        left, right = left[valid], right[valid]
+        pair_codes.append((term_ids[left] << 32) | term_ids[right])
+        pair_ranks.append(right * windows_size + (windows_size - distance))
+
+    codes = np.concatenate(pair_codes) if pair_codes else np.zeros(0, np.int64)
+    ranks = np.concatenate(pair_ranks) if pair_ranks else np.zeros(0, np.int64)
+    codes = codes[np.argsort(ranks, kind="stable")]
+
+    unique_codes, first, counts = np.unique(
+        codes, return_index=True, return_counts=True
+    )
+    order = np.argsort(first, kind="stable")
+    unique_codes = unique_codes[order]
+    return unique_codes >> 32, unique_codes & 0xFFFFFFFF, counts[order]
+
+
+def ngram_occurrences(surface_ids, tag_codes, blocks, n):
+    """
+    Find the occurrences of every n-gram up to length n.
+
+    N-grams never cross block boundaries. For each length, n-grams (and their
+    tag sequences) are identified by a dense integer code computed from the
+    code of their prefix and their last word, so codes never overflow whatever
+    the length.
+
+    Args:
+        surface_ids (np.ndarray): Surface id of each word
+        tag_codes (np.ndarray): Tag code of each word
+        blocks (np.ndarray): Block id of each word
+        n (int): Maximum n-gram length
+
+    Returns:
+        list: One dictionary per length having at least one n-gram, with
+              the keys "size", "starts" (start of each occurrence), "ngrams"
+              (n-gram index of each occurrence), "first" (start of the first
+              occurrence of each n-gram), "counts" (occurrences of each
+              n-gram) and "tags" (tag sequence index of each occurrence)
+    """
+    count = len(surface_ids)
+    if count == 0:
+        return []
+
+    vocabulary = int(surface_ids.max()) + 1
+    prefix_codes = surface_ids
+    prefix_tags = tag_codes
+    prefix_valid = np.ones(count, dtype=bool)
+    levels = []
+
+    for size in range(1, n + 1):
+        width = count - size + 1
+        if width <= 0:
+            break
+
+        if size == 1:
+            valid = prefix_valid
+            codes = surface_ids
+            tags = tag_codes
+        else:
+            last = slice(size - 1, None)
+            valid = prefix_valid[:width] & (blocks[last] == blocks[:width])
+            codes = prefix_codes[:width] * vocabulary + surface_ids[last]
+            tags = prefix_tags[:width] * len(TAGS) + tag_codes[last]
+
+        # Longer n-grams cannot exist once none of this length fits a block
+        starts = np.flatnonzero(valid)
+        if len(starts) == 0:
+            break
+        _, first, ngrams, counts = np.unique(
+            codes[starts],
+            return_index=True,
+            return_inverse=True,
+            return_counts=True,
+        )
+        _, tag_index = np.unique(tags[starts], return_inverse=True)
+        levels.append(
+            {
+                "size": size,
+                "starts": starts,
+                "ngrams": ngrams.reshape(-1),
+                "first": starts[first],
+                "counts": counts,
+                "tags": tag_index.reshape(-1),
+            }
+        )
+
+        # Dense codes of valid n-grams become the prefixes of the next length
+        prefix_codes = np.zeros(width, dtype=np.int64)
+        prefix_codes[starts] = ngrams.reshape(-1)
+        prefix_tags = np.zeros(width, dtype=np.int64)
+        prefix_tags[starts] = tag_index.reshape(-1)
+        prefix_valid = valid
+
+    return levels
@@ -0,0 +1,215 @@
+"""
+Term co-occurrence graph module for YAKE keyword extraction.
+
+This module contains the CooccurrenceGraph class, a compact directed graph
+keyed by integer term ids. It stores only what keyword extraction needs: the
+number of times a term is immediately followed by another, plus adjacency
+lists and running weight totals for the degree and weight metrics of each
+term, so these metrics never require walking the edges.
+"""
+
+import numpy as np
+
+
+class CooccurrenceGraph:
+    """
+    Directed, weighted co-occurrence graph of document terms.
+
+    Nodes are the integer ids of SingleWord terms and an edge (left, right)
+    counts how many times the left term appears before the right term within
+    the co-occurrence window. Edge counts live in a single flat dictionary
+    keyed by an integer encoding of the pair.
+
+    Attributes:
+        See methods below for available operations.
+    """
+
+    def __init__(self):
+        """Initialize an empty graph."""
+        self._weights = {}  # Edge key -> co-occurrence count
+        self._successors = []  # Node id -> list of right neighbours
+        self._predecessors = []  # Node id -> list of left neighbours
+        self._out_weights = []  # Node id -> sum of outgoing edge counts
+        self._in_weights = []  # Node id -> sum of incoming edge counts
+
+    @staticmethod
+    def edge_key(left, right):
+        """
+        Encode an ordered pair of node ids into a single integer.
+
+        Args:
+            left (int): Id of the source term
+            right (int): Id of the target term
+
+        Returns:
+            int: Key identifying the edge
+        """
+        return (left << 32) | right
+
+    def add_node(self, node):
+        """
+        Add a node, and any node with a smaller id, to the graph.
+
+        Args:
+            node (int): Id of the term to add
+        """
+        while len(self._successors) <= node:
+            self._successors.append([])
+            self._predecessors.append([])
+            self._out_weights.append(0.0)
+            self._in_weights.append(0.0)
+
+    def add_cooccur(self, left, right, count=1.0):
+        """
+        Record co-occurrences of two terms.
+
+        Creates the edge if needed and increments its count, along with the
+        weight totals of both terms.
+
+        Args:
+            left (int): Id of the term appearing first
+            right (int): Id of the term appearing second
+            count (float): Number of co-occurrences to add (default: 1.0)
+        """
+        key = (left << 32) | right
+        if key not in self._weights:
+            self.add_node(max(left, right))
+            self._weights[key] = 0.0
+            self._successors[left].append(right)
+            self._predecessors[right].append(left)
+        self._weights[key] += count
+        self._out_weights[left] += count
+        self._in_weights[right] += count
+
+    def has_edge(self, left, right):
+        """
+        Check whether two terms co-occur in the given order.
+
+        Args:
+            left (int): Id of the source term
+            right (int): Id of the target term
+
+        Returns:
+            bool: True if the edge exists
+        """
+        return ((left << 32) | right) in self._weights
+
+    def weight(self, left, right, default=0.0):
+        """
+        Get the co-occurrence count of an edge.
+
+        Args:
+            left (int): Id of the source term
+            right (int): Id of the target term
+            default (float): Value returned when the edge does not exist
+
+        Returns:
+            float: The co-occurrence count
+        """
+        return self._weights.get((left << 32) | right, default)
+
+    def successors(self, node):
+        """
+        Get the terms that appear after a term.
+
+        Args:
+            node (int): Id of the term
+
+        Returns:
+            list: Ids of the right neighbours, in insertion order
+        """
+        if node < len(self._successors):
+            return self._successors[node]
+        return []
+
+    def predecessors(self, node):
+        """
+        Get the terms that appear before a term.
+
+        Args:
+            node (int): Id of the term
+
+        Returns:
+            list: Ids of the left neighbours, in insertion order
+        """
+        if node < len(self._predecessors):
+            return self._predecessors[node]
+        return []
+
+    def out_degree(self, node):
+        """Get the number of distinct terms appearing after a term."""
+        return len(self.successors(node))
+
+    def in_degree(self, node):
+        """Get the number of distinct terms appearing before a term."""
+        return len(self.predecessors(node))
+
+    def out_weight(self, node):
+        """Get the total number of co-occurrences with terms after a term."""
+        if node < len(self._out_weights):
+            return self._out_weights[node]
+        return 0.0
+
+    def in_weight(self, node):
+        """Get the total number of co-occurrences with terms before a term."""
+        if node < len(self._in_weights):
+            return self._in_weights[node]
+        return 0.0
+
+    def node_arrays(self):
+        """
+        Get the degree and weight metrics of every node as arrays.
+
+        Returns:
+            dict: NumPy arrays indexed by node id with the keys "out_degree",
+                  "out_weight", "in_degree" and "in_weight"
+        """
+        return {
+            "out_degree": np.fromiter(
+                map(len, self._successors),
+                dtype=np.float64,
+                count=len(self._successors),
+            ),
+            "out_weight": np.array(self._out_weights, dtype=np.float64),
+            "in_degree": np.fromiter(
+                map(len, self._predecessors),
+                dtype=np.float64,
+                count=len(self._predecessors),
+            ),
+            "in_weight": np.array(self._in_weights, dtype=np.float64),
+        }
+
+    def number_of_nodes(self):
+        """Get the number of nodes in the graph."""
+        return len(self._successors)
+
+    def number_of_edges(self):
+        """Get the number of edges in the graph."""
+        return len(self._weights)
+
+    def edges(self):
+        """
+        Iterate over all edges.
+
+        Yields:
+            tuple: (left, right, count) for each edge, in insertion order
+        """
+        for key, count in self._weights.items():
+            yield key >> 32, key & 0xFFFFFFFF, count
+
+    def to_networkx(self):
+        """
+        Export the graph as a networkx DiGraph.
+
+        Edge counts are stored in the "tf" attribute, as in the graphs
+        previously built by DataCore.
+
+        Returns:
+            networkx.DiGraph: The equivalent networkx graph
+        """
+        import networkx as nx
+
+        graph = nx.DiGraph()
+        graph.add_nodes_from(range(self.number_of_nodes()))
+        graph.add_weighted_edges_from(self.edges(), weight="tf")
+        return graph
@@ -0,0 +1,183 @@
+"""
+Vectorized scoring module for YAKE keyword extraction.
+
+This module provides a columnar alternative to the per-object scoring method
+of SingleWord. Term statistics are gathered into NumPy arrays and the YAKE
+features are computed for all terms at once, which keeps the scoring time
+nearly independent of the vocabulary size. The formulas are the same as in
+SingleWord.update_h, so scores match the scalar path up to floating point
+rounding.
+"""
+
+from itertools import chain, repeat
+from operator import attrgetter
+
+import numpy as np
+
+# Getters of the term attributes gathered into arrays
+_ID = attrgetter("id")
+_OCCURS = attrgetter("occurs")
+_SENTENCE_IDS = attrgetter("sentence_ids")
+
+
+def _safe_divide(numerator, denominator):
+    """
+    Divide two arrays, using 0 where the denominator is 0.
+
+    Args:
+        numerator (np.ndarray): Dividend values
+        denominator (np.ndarray): Divisor values
+
+    Returns:
+        np.ndarray: The element-wise quotient
+    """
+    return np.divide(
+        numerator,
+        denominator,
+        out=np.zeros_like(numerator, dtype=np.float64),
+        where=denominator != 0,
+    )
+
+
+def _median_sentences(terms):
+    """
+    Compute the median sentence id of many terms at once.
+
+    Args:
+        terms (list): SingleWord objects
+
+    Returns:
+        np.ndarray: The median sentence id of each term, as in
+                    SingleWord.median_sentence
+    """
+    lengths = np.fromiter(
+        map(len, map(_SENTENCE_IDS, terms)), dtype=np.int64, count=len(terms)
+    )
+    flat = np.fromiter(
+        chain.from_iterable(map(_SENTENCE_IDS, terms)),
+        dtype=np.float64,
+        count=int(lengths.sum()),
+    )
+    if len(flat) == 0:
+        return np.zeros(len(terms), dtype=np.float64)
+
+    # Middle of each run of sentence ids, and the one before for even runs
+    starts = np.cumsum(lengths) - lengths
+    middle = np.minimum(starts + lengths // 2, len(flat) - 1)
+    before = np.maximum(middle - (lengths % 2 == 0), 0)
+    return (flat[before] + flat[middle]) / 2
+
+
+def gather_term_arrays(terms, graph):
+    """
+    Collect the statistics of the given terms into NumPy arrays.
+
+    Args:
+        terms (list): SingleWord objects to collect
+        graph (CooccurrenceGraph): Co-occurrence graph of the document
+
+    Returns:
+        dict: Arrays aligned with terms, with the keys "tf", "tf_a", "tf_n",
+              "sentences", "median_sentence", "out_degree", "out_weight",
+              "in_degree" and "in_weight"
+    """
+    count = len(terms)
+    ids = np.fromiter(map(_ID, terms), dtype=np.int64, count=count)
+    arrays = {}
+    for name in ("tf", "tf_a", "tf_n"):
+        values = map(attrgetter(name), terms)
+        arrays[name] = np.fromiter(values, dtype=np.float64, count=count)
+    arrays["sentences"] = np.fromiter(
+        map(len, map(_OCCURS, terms)), dtype=np.float64, count=count
+    )
+    arrays["median_sentence"] = _median_sentences(terms)
+
+    # Graph metrics are indexed by term id
+    for name, values in graph.node_arrays().items():
+        gathered = np.zeros(count, dtype=np.float64)
+        known = ids < len(values)
+        gathered[known] = values[ids[known]]
+        arrays[name] = gathered
+
+    return arrays
+
+
+def score_single_terms(terms, graph, stats, features=None):
+    """
+    Compute the features and final score of many terms at once.
+
+    Features excluded from the features list keep their current values, as in
+    SingleWord.update_h. Only the final score is written back to the term
+    objects, since it is the only value candidates read; the features are
+    returned as arrays.
+
+    Args:
+        terms (list): SingleWord objects to score
+        graph (CooccurrenceGraph): Co-occurrence graph of the document
+        stats (dict): Document statistics including:
+            - max_tf (float): Maximum term frequency in the document
+            - avg_tf (float): Average term frequency
+            - std_tf (float): Standard deviation of term frequency
+            - number_of_sentences (int): Total number of sentences
+        features (list, optional): Specific features to calculate, or None
+            for all
+
+    Returns:
+        dict: Arrays of every feature and of the final score "h", aligned
+              with terms
+    """
+    arrays = gather_term_arrays(terms, graph)
+    max_tf = stats["max_tf"]
+    tf = arrays["tf"]
+
+    scores = {}
+
+    if features is None or "wrel" in features:
+        # Calculate relatedness metrics using graph connections
+        pwr = _safe_divide(arrays["out_degree"], arrays["out_weight"])
+        pwl = _safe_divide(arrays["in_degree"], arrays["in_weight"])
+        scores["pl"] = arrays["in_degree"] / max_tf
+        scores["pr"] = arrays["out_degree"] / max_tf
+        relative_tf = tf / max_tf
+        left = 0.5 + (pwl * relative_tf)
+        right = 0.5 + (pwr * relative_tf)
+        scores["wrel"] = left + right
+
+    if features is None or "wfreq" in features:
+        # Calculate frequency metric normalized by corpus statistics
+        scores["wfreq"] = tf / (stats["avg_tf"] + stats["std_tf"])
+
+    if features is None or "wspread" in features:
+        # Calculate spread as proportion of sentences containing the term
+        scores["wspread"] = arrays["sentences"] / stats["number_of_sentences"]
+
+    if features is None or "wcase" in features:
+        # Calculate case feature from uppercase and proper noun occurrences
+        scores["wcase"] = np.maximum(arrays["tf_a"], arrays["tf_n"]) / (
+            1.0 + np.log(tf)
+        )
+
+    if features is None or "wpos" in features:
+        # Calculate position feature from median position of occurrences
+        scores["wpos"] = np.log(np.log(3.0 + arrays["median_sentence"]))
+
+    # Excluded features keep their current values
+    current = {
+        name: np.fromiter(
+            map(attrgetter(name), terms), dtype=np.float64, count=len(terms)
+        )
+        for name in ("wrel", "wfreq", "wspread", "wcase", "wpos")
+        if name not in scores
+    }
+    values = {**current, **scores}
+
+    # Calculate final score
+    wrel = values["wrel"]
+    values["h"] = (values["wpos"] * wrel) / (
+        values["wcase"] + (values["wfreq"] / wrel) + (values["wspread"] / wrel)
+    )
+
+    # Write the final score back to the term objects
+    list(map(setattr, terms, repeat("h"), values["h"].tolist()))
+
+    return values
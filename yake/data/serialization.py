@@ -0,0 +1,631 @@
+"""
+Binary serialization module for YAKE keyword extraction.
+
+This module converts the state of a DataCore to a compact, versioned binary
+snapshot and back. Terms, occurrences, co-occurrence edges, candidates and
+sentences are stored as flat NumPy arrays, strings being stored as a single
+UTF-8 blob plus an array of offsets. Small values, such as the configuration
+and the text statistics, go in a JSON header along with the directory of the
+arrays. Arrays are read back with np.frombuffer, directly from the snapshot.
+
+Layout of a snapshot:
+
+    magic (6 bytes) | version (uint16) | header size (uint64) | JSON header
+    | arrays, each one aligned on 8 bytes
+"""
+
+import json
+import struct
+from itertools import accumulate, chain, pairwise, repeat, starmap
+from operator import attrgetter
+
+import numpy as np
+
+from .composed_word import ComposedWord
+from .single_word import SingleWord
+
+# Identifier and version of the snapshot format. Readers must keep accepting
+# every version up to FORMAT_VERSION, so that old snapshots remain readable.
+MAGIC = b"YAKEDC"
+FORMAT_VERSION = 1
+
+# Magic, version and header size, in little-endian order
+PREFIX = struct.Struct("<6sHQ")
+
+# Numeric attributes of SingleWord stored for every term
+TERM_METRICS = (
+    "tf",
+    "tf_a",
+    "tf_n",
+    "h",
+    "wfreq",
+    "wcase",
+    "wrel",
+    "wpos",
+    "wspread",
+    "pl",
+    "pr",
+    "pagerank",
+)
+
+# Arrays storing the term id, sentence id, position in the sentence and
+# position in the text of every occurrence
+OCCURRENCE_COLUMNS = (
+    "occurrence_terms",
+    "occurrence_sentences",
+    "occurrence_positions",
+    "occurrence_offsets",
+)
+
+# Numeric attributes of ComposedWord stored for every candidate, in this order
+CANDIDATE_METRICS = ("tf", "integrity", "h")
+
+
+def _uint_array(values):
+    """
+    Store non-negative integers in the narrowest unsigned type holding them.
+
+    Args:
+        values (list): Integers to store
+
+    Returns:
+        np.ndarray: The integers, as 8, 16, 32 or 64-bit little-endian values
+    """
+    array = np.array(values, dtype=np.uint64)
+    top = int(array.max()) if array.size > 0 else 0
+    for dtype in ("u1", "<u2", "<u4"):
+        if top <= np.iinfo(dtype).max:
+            return array.astype(dtype)
+    return array.astype("<u8")
+
+
+def _add_strings(arrays, name, strings):
+    """
+    Store a list of strings as a UTF-8 blob and character offsets.
+
+    Args:
+        arrays (dict): Arrays of the snapshot, by name
+        name (str): Name of the list
+        strings (list): Strings to store
+    """
+    offsets = [0]
+    for string in strings:
+        offsets.append(offsets[-1] + len(string))
+    arrays[name] = np.frombuffer(
+        "".join(strings).encode("utf-8", "surrogatepass"), dtype="u1"
+    )
+    arrays[name + "_offsets"] = _uint_array(offsets)
+
+
+def _get_strings(arrays, name):
+    """
+    Read a list of strings stored by _add_strings.
+
+    Args:
+        arrays (dict): Arrays of the snapshot, by name
+        name (str): Name of the list
+
+    Returns:
+        list: The strings
+    """
+    text = arrays[name].tobytes().decode("utf-8", "surrogatepass")
+    offsets = arrays[name + "_offsets"].tolist()
+    return list(map(text.__getitem__, starmap(slice, pairwise(offsets))))
+
+
+def _add_sequences(arrays, name, sequences):
+    """
+    Store a list of integer sequences as a flat array and their lengths.
+
+    Args:
+        arrays (dict): Arrays of the snapshot, by name
+        name (str): Name of the list
+        sequences (list): Sequences to store
+    """
+    arrays[name] = _uint_array(list(chain.from_iterable(sequences)))
+    arrays[name + "_lengths"] = _uint_array(list(map(len, sequences)))
+
+
+def _get_sequences(arrays, name):
+    """
+    Read a list of sequences stored by _add_sequences.
+
+    Args:
+        arrays (dict): Arrays of the snapshot, by name
+        name (str): Name of the list
+
+    Returns:
+        list: The sequences, as lists
+    """
+    return _split(arrays[name].tolist(), arrays[name + "_lengths"].tolist())
+
+
+def _split(values, lengths):
+    """
+    Split a list into consecutive parts.
+
+    Args:
+        values (list): Values to split
+        lengths (list): Length of each part
+
+    Returns:
+        list: The parts, as lists
+    """
+    ends = accumulate(lengths, initial=0)
+    return list(map(values.__getitem__, starmap(slice, pairwise(ends))))
+
+
+def encode_state(state):
+    """
+    Encode the state of a DataCore as a binary snapshot.
+
+    Memoization caches, the token cache and any metric stored outside the
+    attributes of SingleWord are not part of the snapshot. Custom tokenizer
+    objects are not stored either, only the name of built-in tokenizers.
+
+    Args:
+        state (dict): The state of the DataCore
+
+    Returns:
+        bytes: The snapshot
+    """
+    config = state["config"]
+    collections = state["collections"]
+    terms = list(collections["terms"].values())
+    candidates = list(collections["candidates"].values())
+    positions = {id(cand): index for index, cand in enumerate(candidates)}
+    arrays = {}
+
+    # Terms, in id order, and their occurrences in sentence order
+    _add_strings(arrays, "terms", [term.unique_term for term in terms])
+    stopwords = [term.stopword for term in terms]
+    arrays["term_stopwords"] = np.array(stopwords, dtype="u1")
+    arrays["term_metrics"] = np.array(
+        list(map(attrgetter(*TERM_METRICS), terms)), dtype="<f8"
+    ).reshape(-1, len(TERM_METRICS))
+    occurrences = [
+        (term_id, sentence_id, pos_sent, pos_text)
+        for term_id, term in enumerate(terms)
+        for sentence_id, term_occurrences in term.occurs.items()
+        for pos_sent, pos_text in term_occurrences
+    ]
+    for column, name in enumerate(OCCURRENCE_COLUMNS):
+        values = [occurrence[column] for occurrence in occurrences]
+        arrays[name] = _uint_array(values)
+
+    # Co-occurrence edges, in insertion order
+    graph = state["g"]
+    edges = list(graph.edges())
+    arrays["edge_left"] = _uint_array([left for left, _, _ in edges])
+    arrays["edge_right"] = _uint_array([right for _, right, _ in edges])
+    counts = [count for _, _, count in edges]
+    arrays["edge_counts"] = np.array(counts, dtype="<f8")
+
+    # Candidates, in insertion order
+    _add_strings(arrays, "candidates", [cand.kw for cand in candidates])
+    arrays["candidate_sizes"] = _uint_array([cand.size for cand in candidates])
+    arrays["candidate_stopwords"] = np.array(
+        [cand.start_or_end_stopwords for cand in candidates], dtype="u1"
+    )
+    arrays["candidate_metrics"] = np.array(
+        list(map(attrgetter(*CANDIDATE_METRICS), candidates)), dtype="<f8"
+    ).reshape(-1, len(CANDIDATE_METRICS))
+    _add_sequences(
+        arrays,
+        "candidate_terms",
+        [[term.id for term in cand.terms] for cand in candidates],
+    )
+    tags = [sorted(cand.tags) for cand in candidates]
+    _add_strings(arrays, "candidate_tags", list(chain.from_iterable(tags)))
+    arrays["candidate_tag_counts"] = _uint_array(list(map(len, tags)))
+
+    # Surface forms and the n-gram index of the candidates
+    _add_strings(arrays, "surface_forms", list(collections["surface_ids"]))
+    candidate_index = collections["candidate_index"]
+    _add_sequences(arrays, "index_keys", list(candidate_index))
+    arrays["index_candidates"] = _uint_array(
+        [positions[id(cand)] for cand in candidate_index.values()]
+    )
+
+    # Tokens of the sentences, and their blocks of words
+    sentences = collections["sentences_str"]
+    tokens = list(chain.from_iterable(sentences))
+    _add_strings(arrays, "sentence_tokens", tokens)
+    arrays["sentence_lengths"] = _uint_array(list(map(len, sentences)))
+    sentences_obj = collections["sentences_obj"]
+    blocks = list(chain.from_iterable(sentences_obj))
+    words = list(chain.from_iterable(blocks))
+    arrays["sentence_blocks"] = _uint_array(list(map(len, sentences_obj)))
+    arrays["block_lengths"] = _uint_array(list(map(len, blocks)))
+    _add_strings(arrays, "block_tags", ["".join(tag for tag, _, _ in words)])
+    _add_strings(arrays, "block_words", [word for _, word, _ in words])
+    arrays["block_terms"] = _uint_array([term.id for _, _, term in words])
+
+    # Candidates selected by the last scoring
+    pruning = state["pruning"]
+    for name in ("valid", "pruned"):
+        arrays["pruning_" + name] = _uint_array(
+            [positions[id(cand)] for cand in pruning[name]]
+        )
+
+    _add_strings(arrays, "stopwords", sorted(config["stopword_set"]))
+
+    tokenizer = getattr(config["tokenizer"], "name", None)
+    header = {
+        "version": FORMAT_VERSION,
+        "config": {
+            "windows_size": config["windows_size"],
+            "n": config["n"],
+            "engine": config["engine"],
+            "tokenizer": tokenizer,
+            "keep_paragraphs": config["keep_paragraphs"],
+            "keep_sentences": config["keep_sentences"],
+            "exclude": sorted(config["exclude"]),
+            "tags_to_discard": sorted(config["tags_to_discard"]),
+        },
+        "text_stats": state["text_stats"],
+        "freq_ns": list(collections["freq_ns"].items()),
+        "nodes": graph.number_of_nodes(),
+        "threshold": pruning["threshold"],
+        "stream": state["stream"],
+        "timings": state["timings"],
+        "arrays": {},
+    }
+
+    # Lay the arrays out one after another, aligned on 8 bytes
+    chunks = []
+    offset = 0
+    for name, array in arrays.items():
+        data = np.ascontiguousarray(array).tobytes()
+        header["arrays"][name] = [array.dtype.str, list(array.shape), offset]
+        chunks.append(data)
+        chunks.append(b"\0" * (-len(data) % 8))
+        offset += len(data) + (-len(data) % 8)
+
+    header_bytes = json.dumps(header).encode("utf-8")
+    header_bytes += b" " * (-len(header_bytes) % 8)
+    prefix = PREFIX.pack(MAGIC, FORMAT_VERSION, len(header_bytes))
+    return b"".join([prefix, header_bytes, *chunks])
+
+
+def read_snapshot(data):
+    """
+    Read the header and the arrays of a binary snapshot.
+
+    The arrays are read-only views of the snapshot, so data must not be
+    modified while they are in use.
+
+    Args:
+        data (bytes-like): The snapshot, e.g. bytes, bytearray or mmap
+
+    Returns:
+        tuple: (header, arrays), the JSON header as a dict and the arrays by
+               name
+
+    Raises:
+        ValueError: If data is not a snapshot or has an unsupported version
+    """
+    view = memoryview(data)
+    if len(view) < PREFIX.size:
+        raise ValueError("Data is too short to be a DataCore snapshot")
+
+    magic, version, header_size = PREFIX.unpack_from(view)
+    if magic != MAGIC:
+        raise ValueError("Data is not a DataCore snapshot")
+    if version > FORMAT_VERSION:
+        raise ValueError(
+            f"Unsupported DataCore snapshot version {version}, "
+            f"expected at most {FORMAT_VERSION}"
+        )
+
+    header_start = PREFIX.size
+    start = header_start + header_size
+    header = json.loads(bytes(view[header_start:start]).decode("utf-8"))
+    arrays = {}
+    for name, (dtype, shape, offset) in header["arrays"].items():
+        arrays[name] = np.frombuffer(
+            view, dtype=dtype, count=int(np.prod(shape)), offset=start + offset
+        ).reshape(shape)
+    return header, arrays
+
+
+def read_config(header, arrays):
+    """
+    Read the DataCore configuration stored in a snapshot.
+
+    Args:
+        header (dict): JSON header returned by read_snapshot
+        arrays (dict): Arrays returned by read_snapshot
+
+    Returns:
+        tuple: (config, stopword_set), the DataCore configuration as a dict
+               and the stopwords as a frozenset
+    """
+    stored = header["config"]
+    config = dict(
+        stored,
+        exclude=set(stored["exclude"]),
+        tags_to_discard=set(stored["tags_to_discard"]),
+    )
+    return config, frozenset(_get_strings(arrays, "stopwords"))
+
+
+def _read_occurrences(arrays, sentence_offset=0, word_offset=0):
+    """
+    Read the occurrences stored in a snapshot, grouped by term.
+
+    Occurrences are stored by term then in sentence order, so the occurrences
+    of a term in a sentence are consecutive and are cut out of a single list.
+
+    Args:
+        arrays (dict): Arrays returned by read_snapshot
+        sentence_offset (int): Number added to every sentence id (default: 0)
+        word_offset (int): Number added to every position in the text
+            (default: 0)
+
+    Yields:
+        tuple: (term id, sentence ids, occurrences) for every term having
+               occurrences, the occurrences of each sentence being a list of
+               (position in the sentence, position in the text) tuples
+    """
+    term_ids, sentence_ids, positions, offsets = (
+        arrays[name] for name in OCCURRENCE_COLUMNS
+    )
+    if len(term_ids) == 0:
+        return
+
+    new_term = term_ids[1:] != term_ids[:-1]
+    new_sentence = sentence_ids[1:] != sentence_ids[:-1]
+    starts = np.concatenate(([0], np.flatnonzero(new_term | new_sentence) + 1))
+    bounds = [*starts.tolist(), len(term_ids)]
+    text_positions = (offsets.astype(np.int64) + word_offset).tolist()
+    pairs = list(zip(positions.tolist(), text_positions))
+    groups = list(map(pairs.__getitem__, starmap(slice, pairwise(bounds))))
+    group_terms = term_ids[starts]
+    group_sentences = sentence_ids[starts].astype(np.int64) + sentence_offset
+    group_sentences = group_sentences.tolist()
+
+    # Groups of each term, as consecutive ranges
+    first = np.flatnonzero(np.diff(group_terms, prepend=-1) != 0)
+    ranges = pairwise([*first.tolist(), len(group_terms)])
+    for term_id, (start, end) in zip(group_terms[first].tolist(), ranges):
+        yield term_id, group_sentences[start:end], groups[start:end]
+
+
+def _candidate_rows(arrays):
+    """
+    Read the columns of the candidates stored in a snapshot.
+
+    Args:
+        arrays (dict): Arrays returned by read_snapshot
+
+    Returns:
+        zip: (kw, size, stopwords, metrics, term ids, tags) of each candidate,
+             in insertion order
+    """
+    tags = _split(
+        _get_strings(arrays, "candidate_tags"),
+        arrays["candidate_tag_counts"].tolist(),
+    )
+    return zip(
+        _get_strings(arrays, "candidates"),
+        arrays["candidate_sizes"].tolist(),
+        arrays["candidate_stopwords"].tolist(),
+        arrays["candidate_metrics"].tolist(),
+        _get_sequences(arrays, "candidate_terms"),
+        tags,
+    )
+
+
+def _build_candidate(row, terms):
+    """
+    Build a candidate from its stored columns.
+
+    Args:
+        row (tuple): Columns of the candidate, as returned by _candidate_rows
+        terms (list): SingleWord objects of the stored term ids, by id
+
+    Returns:
+        ComposedWord: The candidate
+    """
+    kw, size, stopwords, metrics, term_ids, tags = row
+
+    # Every attribute is set below, so __init__ is not needed
+    cand = ComposedWord.__new__(ComposedWord)
+    cand.kw = kw
+    cand.unique_kw = kw.lower()
+    cand.size = size
+    cand.start_or_end_stopwords = bool(stopwords)
+    cand.tf, cand.integrity, cand.h = metrics
+    cand.terms = list(map(terms.__getitem__, term_ids))
+    cand.tags = set(tags)
+    return cand
+
+
+def _read_sentences(arrays, terms):
+    """
+    Read the sentences stored in a snapshot.
+
+    Args:
+        arrays (dict): Arrays returned by read_snapshot
+        terms (list): SingleWord objects of the stored term ids, by id
+
+    Returns:
+        tuple: (sentences_str, sentences_obj), the sentences as tokens and as
+               blocks of (tag, word, term) tuples
+    """
+    tokens = _get_strings(arrays, "sentence_tokens")
+    sentences_str = _split(tokens, arrays["sentence_lengths"].tolist())
+    words = list(
+        zip(
+            _get_strings(arrays, "block_tags")[0],
+            _get_strings(arrays, "block_words"),
+            map(terms.__getitem__, arrays["block_terms"].tolist()),
+        )
+    )
+    sentences_obj = _split(
+        _split(words, arrays["block_lengths"].tolist()),
+        arrays["sentence_blocks"].tolist(),
+    )
+    return sentences_str, sentences_obj
+
+
+def restore_state(state, header, arrays):
+    """
+    Fill the state of an empty DataCore from a snapshot.
+
+    Args:
+        state (dict): The state of a DataCore with no text
+        header (dict): JSON header returned by read_snapshot
+        arrays (dict): Arrays returned by read_snapshot
+    """
+    collections = state["collections"]
+    graph = state["g"]
+
+    # Terms, in id order, with their metrics set one column at a time
+    unique_terms = _get_strings(arrays, "terms")
+    term_ids = range(len(unique_terms))
+    terms = list(map(SingleWord, unique_terms, term_ids, repeat(graph)))
+    collections["terms"].update(zip(unique_terms, terms))
+    stopwords = arrays["term_stopwords"].astype(bool).tolist()
+    list(map(setattr, terms, repeat("stopword"), stopwords))
+    for name, column in zip(TERM_METRICS, arrays["term_metrics"].T):
+        list(map(setattr, terms, repeat(name), column.tolist()))
+    if header["nodes"] > 0:
+        graph.add_node(header["nodes"] - 1)
+
+    for term_id, sentence_ids, occurrences in _read_occurrences(arrays):
+        term = terms[term_id]
+        term.sentence_ids = sentence_ids
+        term.occurs = dict(zip(sentence_ids, occurrences))
+
+    for left, right, count in zip(
+        arrays["edge_left"].tolist(),
+        arrays["edge_right"].tolist(),
+        arrays["edge_counts"].tolist(),
+    ):
+        graph.add_cooccur(left, right, count)
+
+    # Candidates, in insertion order
+    rows = _candidate_rows(arrays)
+    candidates = [_build_candidate(row, terms) for row in rows]
+    unique_kws = [cand.unique_kw for cand in candidates]
+    collections["candidates"].update(zip(unique_kws, candidates))
+
+    for surface_id, word in enumerate(_get_strings(arrays, "surface_forms")):
+        collections["surface_ids"][word] = surface_id
+    positions = arrays["index_candidates"].tolist()
+    for key, position in zip(_get_sequences(arrays, "index_keys"), positions):
+        collections["candidate_index"][tuple(key)] = candidates[position]
+
+    sentences_str, sentences_obj = _read_sentences(arrays, terms)
+    collections["sentences_str"] = sentences_str
+    collections["sentences_obj"] = sentences_obj
+
+    collections["freq_ns"].update(header["freq_ns"])
+    state["text_stats"].update(header["text_stats"])
+    state["stream"].update(header["stream"])
+    state["timings"].update(header["timings"])
+    state["pruning"].update(
+        valid=[candidates[i] for i in arrays["pruning_valid"].tolist()],
+        pruned=[candidates[i] for i in arrays["pruning_pruned"].tolist()],
+        threshold=header["threshold"],
+    )
+
+
+def merge_snapshot(state, header, arrays):
+    """
+    Add the statistics stored in a snapshot after those of a DataCore.
+
+    The result is the same as DataCore.merge with the document the snapshot
+    was created from, but that document is never built: terms and candidates
+    are matched by their normalized form directly from the arrays.
+
+    Args:
+        state (dict): The state of a DataCore with the same configuration and
+            stopwords as the stored one
+        header (dict): JSON header returned by read_snapshot
+        arrays (dict): Arrays returned by read_snapshot
+    """
+    collections = state["collections"]
+    graph = state["g"]
+    text_stats = state["text_stats"]
+
+    # Match terms by normalized form, new terms are created in id order
+    terms = collections["terms"]
+    term_map = []
+    stopwords = arrays["term_stopwords"].astype(bool).tolist()
+    for unique_term, stopword in zip(_get_strings(arrays, "terms"), stopwords):
+        term = terms.get(unique_term)
+        if term is None:
+            term = SingleWord(unique_term, len(terms), graph)
+            term.stopword = stopword
+            graph.add_node(term.id)
+            terms[unique_term] = term
+        term_map.append(term)
+
+    # Occurrences of the snapshot come after the existing ones
+    for name in ("tf", "tf_a", "tf_n"):
+        column = arrays["term_metrics"][:, TERM_METRICS.index(name)].tolist()
+        for term, value in zip(term_map, column):
+            setattr(term, name, getattr(term, name) + value)
+    sentence_offset = text_stats["number_of_sentences"]
+    word_offset = text_stats["number_of_words"]
+    groups = _read_occurrences(arrays, sentence_offset, word_offset)
+    for term_id, sentence_ids, occurrences in groups:
+        term = term_map[term_id]
+        term.occurs.update(zip(sentence_ids, occurrences))
+        term.sentence_ids.extend(sentence_ids)
+
+    ids = np.array([term.id for term in term_map], dtype=np.int64)
+    for left, right, count in zip(
+        ids[arrays["edge_left"]].tolist(),
+        ids[arrays["edge_right"]].tolist(),
+        arrays["edge_counts"].tolist(),
+    ):
+        graph.add_cooccur(left, right, count)
+
+    # Match candidates by normalized form, building the new ones only
+    candidates = collections["candidates"]
+    stored = []
+    for row in _candidate_rows(arrays):
+        kw, _, _, metrics, _, tags = row
+        cand = candidates.get(kw.lower())
+        if cand is None:
+            cand = candidates[kw.lower()] = _build_candidate(row, term_map)
+        else:
+            # Same as ComposedWord.uptade_cand, then add the frequency
+            cand.tags.update(tags)
+            cand.tf += metrics[CANDIDATE_METRICS.index("tf")]
+        stored.append(cand)
+
+    # Remap the surface ids identifying the n-grams of the candidates
+    surface_ids = collections["surface_ids"]
+    surface_map = np.array(
+        [
+            surface_ids.setdefault(word.lower(), len(surface_ids))
+            for word in _get_strings(arrays, "surface_forms")
+        ],
+        dtype=np.int64,
+    )
+    keys = _split(
+        surface_map[arrays["index_keys"]].tolist(),
+        arrays["index_keys_lengths"].tolist(),
+    )
+    collections["candidate_index"].update(
+        zip(
+            map(tuple, keys),
+            map(stored.__getitem__, arrays["index_candidates"].tolist()),
+        )
+    )
+
+    for size, count in header["freq_ns"]:
+        collections["freq_ns"][size] += count
+
+    if state["config"]["keep_sentences"]:
+        sentences_str, sentences_obj = _read_sentences(arrays, term_map)
+        collections["sentences_str"].extend(sentences_str)
+        collections["sentences_obj"].extend(sentences_obj)
+
+    for name in ("number_of_sentences", "number_of_words"):
+        text_stats[name] += header["text_stats"][name]
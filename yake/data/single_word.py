@@ -8,7 +8,7 @@ a relevance score for each word.
 """
 
 import math
-import numpy as np
+from bisect import insort
 
 
 class SingleWord:
@@ -20,10 +20,48 @@ class SingleWord:
     are used to calculate a relevance score that indicates the word's importance
     in the document.
 
+    Attributes are kept in __slots__ rather than in a per-object dictionary,
+    since a document creates one instance per distinct term and the scoring
+    loops read them repeatedly. Dictionary-style access is still supported.
+
     Attributes:
-        See property accessors below for available attributes.
+        id (int): Unique identifier for the term in the document
+        g (CooccurrenceGraph): Word co-occurrence graph from the document
+        unique_term (str): The unique normalized term this object represents
+        stopword (bool): Whether this term is a stopword
+        h (float): Final score (lower is better)
+        tf, tf_a, tf_n (float): Term frequency, overall and for uppercase words
+            and proper nouns
+        wfreq, wcase, wrel, wpos, wspread (float): Word characteristic metrics
+        pl, pr (float): Probability left and right
+        pagerank (float): PageRank score
+        occurs (dict): Sentence occurrences, mapping sentence id to a list of
+            (position in sentence, position in text) tuples
+        sentence_ids (list): Sorted ids of the sentences containing the term
     """
 
+    __slots__ = (
+        "_extra",
+        "g",
+        "h",
+        "id",
+        "occurs",
+        "pagerank",
+        "pl",
+        "pr",
+        "sentence_ids",
+        "stopword",
+        "tf",
+        "tf_a",
+        "tf_n",
+        "unique_term",
+        "wcase",
+        "wfreq",
+        "wpos",
+        "wrel",
+        "wspread",
+    )
+
     def __init__(self, unique, idx, graph):
         """
         Initialize a SingleWord term object.
@@ -31,34 +69,36 @@ class SingleWord:
         Args:
             unique (str): The unique normalized term this object represents
             idx (int): Unique identifier for the term in the document
-            graph (networkx.DiGraph): Word co-occurrence graph from the document
+            graph (CooccurrenceGraph): Word co-occurrence graph of the
+                document
         """
         self.id = idx  # Fast access needed as it's used in graph operations
         self.g = graph  # Fast access needed for network calculations
 
-        self.data = {
-            # Basic information
-            "unique_term": unique,
-            "stopword": False,
-            "h": 0.0,  # Final Score
-            # Term frequency statistics
-            "tf": 0.0,  # Term frequency
-            "tf_a": 0.0,  # Term Frequency for uppercase words
-            "tf_n": 0.0,  # Term Frequency for proper nouns
-            # Word characteristic metrics
-            "wfreq": 0.0,  # Word frequency
-            "wcase": 0.0,  # Word case metric
-            "wrel": 1.0,  # Word relevance metric
-            "wpos": 1.0,  # Word position metric
-            "wspread": 0.0,  # Word spread across document
-            "pl": 0.0,  # Probability left
-            "pr": 0.0,  # Probability right
-            "pagerank": 1.0,  # PageRank score
-            # Ocurrence tracking
-            "occurs": {},  # Sentence Occurrences
-        }
-
-    # Forward common dictionary operations to self.data
+        # Basic information
+        self.unique_term = unique
+        self.stopword = False
+        self.h = 0.0  # Final Score
+        # Term frequency statistics
+        self.tf = 0.0  # Term frequency
+        self.tf_a = 0.0  # Term Frequency for uppercase words
+        self.tf_n = 0.0  # Term Frequency for proper nouns
+        # Word characteristic metrics
+        self.wfreq = 0.0  # Word frequency
+        self.wcase = 0.0  # Word case metric
+        self.wrel = 1.0  # Word relevance metric
+        self.wpos = 1.0  # Word position metric
+        self.wspread = 0.0  # Word spread across document
+        self.pl = 0.0  # Probability left
+        self.pr = 0.0  # Probability right
+        self.pagerank = 1.0  # PageRank score
+        # Ocurrence tracking
+        self.occurs = {}  # Sentence Occurrences
+        self.sentence_ids = []  # Sorted ids of the sentences with the term
+        # Metrics set by name that are not part of the slots
+        self._extra = None
+
+    # Dictionary-style access to the attributes
     def __getitem__(self, key):
         """
         Access attributes dictionary-style with obj['key'].
@@ -68,8 +108,15 @@ class SingleWord:
 
         Returns:
             Any: The value associated with the key
+
+        Raises:
+            KeyError: If the key is not an attribute of the term
         """
-        return self.data[key]
+        if key in SingleWord.__slots__:
+            return getattr(self, key)
+        if self._extra is not None and key in self._extra:
+            return self._extra[key]
+        raise KeyError(key)
 
     def __setitem__(self, key, value):
         """
@@ -79,7 +126,12 @@ class SingleWord:
             key (str): The attribute key to set
             value (Any): The value to associate with the key
         """
-        self.data[key] = value
+        if key in SingleWord.__slots__:
+            setattr(self, key, value)
+            return
+        if self._extra is None:
+            self._extra = {}
+        self._extra[key] = value
 
     def get(self, key, default=None):
         """
@@ -92,63 +144,24 @@ class SingleWord:
         Returns:
             Any: The value associated with the key or the default value
         """
-        return self.data.get(key, default)
-
-    # The most commonly used properties remain as explicit accessors for backward compatibility
-    @property
-    def unique_term(self):
-        """Get the unique normalized term this object represents."""
-        return self.data["unique_term"]
-
-    @property
-    def stopword(self):
-        """Get whether this term is a stopword."""
-        return self.data["stopword"]
-
-    @stopword.setter
-    def stopword(self, value):
-        """
-        Set whether this term is a stopword.
-
-        Args:
-            value (bool): True if the term is a stopword, False otherwise
-        """
-        self.data["stopword"] = value
-
-    @property
-    def h(self):
-        """Get the final relevance score of this term (lower is better)."""
-        return self.data["h"]
-
-    @h.setter
-    def h(self, value):
-        """
-        Set the final relevance score of this term.
-
-        Args:
-            value (float): The new score value
-        """
-        self.data["h"] = value
-
-    @property
-    def tf(self):
-        """Get the term frequency (number of occurrences) in the document."""
-        return self.data["tf"]
+        try:
+            return self[key]
+        except KeyError:
+            return default
 
-    @tf.setter
-    def tf(self, value):
+    def median_sentence(self):
         """
-        Set the term frequency value.
+        Get the median id of the sentences containing this term.
 
-        Args:
-            value (float): The new term frequency value
+        Returns:
+            float: The median sentence id, equal to
+                   np.median(list(self.occurs))
         """
-        self.data["tf"] = value
-
-    @property
-    def occurs(self):
-        """Get the dictionary of sentence occurrences for this term."""
-        return self.data["occurs"]
+        sentence_ids = self.sentence_ids
+        middle = len(sentence_ids) // 2
+        if len(sentence_ids) % 2 == 1:
+            return float(sentence_ids[middle])
+        return (sentence_ids[middle - 1] + sentence_ids[middle]) / 2
 
     # Everything else uses the generic accessor methods
     def get_metric(self, name):
@@ -161,7 +174,7 @@ class SingleWord:
         Returns:
             float: The value of the requested metric
         """
-        return self.data.get(name, 0.0)
+        return self.get(name, 0.0)
 
     def set_metric(self, name, value):
         """
@@ -171,7 +184,7 @@ class SingleWord:
             name (str): The name of the metric to set
             value (float): The new value for the metric
         """
-        self.data[name] = value
+        self[name] = value
 
     def get_graph_metrics(self):
         """
@@ -190,13 +203,13 @@ class SingleWord:
                 - pwl: Probability weight left (wdl/wil)
         """
         # Out-edges metrics
-        wdr = len(self.g.out_edges(self.id))
-        wir = sum(d["tf"] for (_, _, d) in self.g.out_edges(self.id, data=True))
+        wdr = self.g.out_degree(self.id)
+        wir = self.g.out_weight(self.id)
         pwr = 0 if wir == 0 else wdr / wir
 
         # In-edges metrics
-        wdl = len(self.g.in_edges(self.id))
-        wil = sum(d["tf"] for (_, _, d) in self.g.in_edges(self.id, data=True))
+        wdl = self.g.in_degree(self.id)
+        wil = self.g.in_weight(self.id)
         pwl = 0 if wil == 0 else wdl / wil
 
         return {"wdr": wdr, "wir": wir, "pwr": pwr, "wdl": wdl, "wil": wil, "pwl": pwl}
@@ -227,37 +240,31 @@ class SingleWord:
         # Update metrics based on features
         if features is None or "wrel" in features:
             # Calculate relatedness metrics using graph connections
-            self.data["pl"] = graph_metrics["wdl"] / max_tf
-            self.data["pr"] = graph_metrics["wdr"] / max_tf
-            self.data["wrel"] = (0.5 + (graph_metrics["pwl"] * (self.tf / max_tf))) + (
+            self.pl = graph_metrics["wdl"] / max_tf
+            self.pr = graph_metrics["wdr"] / max_tf
+            self.wrel = (0.5 + (graph_metrics["pwl"] * (self.tf / max_tf))) + (
                 0.5 + (graph_metrics["pwr"] * (self.tf / max_tf))
             )
 
         if features is None or "wfreq" in features:
             # Calculate frequency metric normalized by corpus statistics
-            self.data["wfreq"] = self.tf / (avg_tf + std_tf)
+            self.wfreq = self.tf / (avg_tf + std_tf)
 
         if features is None or "wspread" in features:
             # Calculate spread as proportion of sentences containing the term
-            self.data["wspread"] = len(self.occurs) / number_of_sentences
+            self.wspread = len(self.occurs) / number_of_sentences
 
         if features is None or "wcase" in features:
             # Calculate case feature from uppercase and proper noun occurrences
-            self.data["wcase"] = max(self.data["tf_a"], self.data["tf_n"]) / (
-                1.0 + math.log(self.tf)
-            )
+            self.wcase = max(self.tf_a, self.tf_n) / (1.0 + math.log(self.tf))
 
         if features is None or "wpos" in features:
             # Calculate position feature from median position of occurrences
-            self.data["wpos"] = math.log(
-                math.log(3.0 + np.median(list(self.occurs.keys())))
-            )
+            self.wpos = math.log(math.log(3.0 + self.median_sentence()))
 
         # Calculate final score
-        self.data["h"] = (self.data["wpos"] * self.data["wrel"]) / (
-            self.data["wcase"]
-            + (self.data["wfreq"] / self.data["wrel"])
-            + (self.data["wspread"] / self.data["wrel"])
+        self.h = (self.wpos * self.wrel) / (
+            self.wcase + (self.wfreq / self.wrel) + (self.wspread / self.wrel)
         )
 
     def add_occur(self, tag, sent_id, pos_sent, pos_text):
@@ -266,7 +273,7 @@ class SingleWord:
 
         Records where in the document this term appears, tracking sentence ID,
         position within sentence, global position in text, and updates term
-        frequency counters.
+        frequency counters and the sorted list of sentence ids.
 
         Args:
             tag (str): Part-of-speech tag for this occurrence ('a' for acronym, 'n' for proper noun, etc.)
@@ -277,84 +284,14 @@ class SingleWord:
         # Create empty list for this sentence if it's the first occurrence
         if sent_id not in self.occurs:
             self.occurs[sent_id] = []
+            insort(self.sentence_ids, sent_id)
 
         # Record position information for this occurrence
         self.occurs[sent_id].append((pos_sent, pos_text))
-        self.data["tf"] += 1.0
+        self.tf += 1.0
 
         # Update special counters for acronyms and proper nouns
         if tag == "a":
-            self.data["tf_a"] += 1.0
+            self.tf_a += 1.0
         if tag == "n":
-            self.data["tf_n"] += 1.0
-
-    # For backward compatibility, define access to common metrics as properties
-    @property
-    def wfreq(self):
-        """Get the word frequency metric."""
-        return self.data["wfreq"]
-
-    @wfreq.setter
-    def wfreq(self, value):
-        """Set the word frequency metric."""
-        self.data["wfreq"] = value
-
-    @property
-    def wcase(self):
-        """Get the word case metric."""
-        return self.data["wcase"]
-
-    @wcase.setter
-    def wcase(self, value):
-        """Set the word case metric."""
-        self.data["wcase"] = value
-
-    @property
-    def wrel(self):
-        """Get the word relevance metric."""
-        return self.data["wrel"]
-
-    @wrel.setter
-    def wrel(self, value):
-        """Set the word relevance metric."""
-        self.data["wrel"] = value
-
-    @property
-    def wpos(self):
-        """Get the word position metric."""
-        return self.data["wpos"]
-
-    @wpos.setter
-    def wpos(self, value):
-        """Set the word position metric."""
-        self.data["wpos"] = value
-
-    @property
-    def wspread(self):
-        """Get the word spread metric."""
-        return self.data["wspread"]
-
-    @wspread.setter
-    def wspread(self, value):
-        """Set the word spread metric."""
-        self.data["wspread"] = value
-
-    @property
-    def pl(self):
-        """Get the probability left metric."""
-        return self.data["pl"]
-
-    @pl.setter
-    def pl(self, value):
-        """Set the probability left metric."""
-        self.data["pl"] = value
-
-    @property
-    def pr(self):
-        """Get the probability right metric."""
-        return self.data["pr"]
-
-    @pr.setter
-    def pr(self, value):
-        """Set the probability right metric."""
-        self.data["pr"] = value
+            self.tf_n += 1.0
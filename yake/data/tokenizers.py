@@ -0,0 +1,137 @@
+"""
+Tokenizer backends module for YAKE keyword extraction.
+
+This module contains the tokenizers DataCore can use to split a document into
+sentences and words. A tokenizer is any object with two methods:
+
+- split_sentences(text), returning the non-empty sentences of a text
+- tokenize(sentence), returning the tokens of a sentence
+
+SegtokTokenizer relies on segtok and is the default. FastTokenizer uses a few
+precompiled regular expressions instead; it produces the same tokens for
+common prose, trading some fidelity on abbreviations, URLs and other unusual
+tokens for a much higher throughput.
+"""
+
+import re
+
+from segtok.segmenter import split_multi
+
+from .utils import tokenize_words
+
+
+class SegtokTokenizer:
+    """Tokenizer based on segtok's segmenter and web tokenizer."""
+
+    name = "segtok"
+
+    def split_sentences(self, text):
+        """
+        Split a text into sentences.
+
+        Args:
+            text (str): The text to split
+
+        Returns:
+            list: The non-empty sentences of the text
+        """
+        return [s for s in split_multi(text) if len(s.strip()) > 0]
+
+    def tokenize(self, sentence):
+        """
+        Tokenize a sentence into words.
+
+        Args:
+            sentence (str): The sentence to tokenize
+
+        Returns:
+            list: The tokens of the sentence
+        """
+        return tokenize_words(sentence)
+
+
+class FastTokenizer:
+    """Tokenizer based on precompiled regular expressions."""
+
+    name = "fast"
+
+    # Sentence ends: terminal punctuation before a capitalized word, a digit
+    # or an opening quote or bracket, and blank lines between paragraphs
+    SENTENCE_BOUNDARY = re.compile(
+        r"(?<=[.!?])\s+(?=[^\W_a-z]|[\"'(\[])|\n\s*\n",
+    )
+
+    # Tokens, tried in order: URLs, abbreviations, numbers with separators,
+    # negative contractions, (hyphenated) words, clitics and punctuation
+    TOKEN = re.compile(
+        r"https?://\S*[^\s.,;:!?)\]]"
+        r"|(?:[^\W\d_]\.){2,}"
+        r"|\d+(?:[.,]\d+)+"
+        r"|\w+(?=n't\b)|n't\b"
+        r"|\w+(?:-\w+)*"
+        r"|'\w+"
+        r"|\.{2,}|[^\w\s]"
+    )
+
+    def split_sentences(self, text):
+        """
+        Split a text into sentences.
+
+        Args:
+            text (str): The text to split
+
+        Returns:
+            list: The non-empty sentences of the text
+        """
+        sentences = map(str.strip, self.SENTENCE_BOUNDARY.split(text))
+        return [sentence for sentence in sentences if sentence]
+
+    def tokenize(self, sentence):
+        """
+        Tokenize a sentence into words.
+
+        Clitics such as "'s" are dropped, as with the segtok tokenizer.
+
+        Args:
+            sentence (str): The sentence to tokenize
+
+        Returns:
+            list: The tokens of the sentence
+        """
+        return [
+            w
+            for w in self.TOKEN.findall(sentence)
+            if not (w.startswith("'") and len(w) > 1)
+        ]
+
+
+# Built-in tokenizers, by name
+TOKENIZERS = {
+    SegtokTokenizer.name: SegtokTokenizer,
+    FastTokenizer.name: FastTokenizer,
+}
+
+
+def get_tokenizer(tokenizer=None):
+    """
+    Resolve a tokenizer specification.
+
+    Args:
+        tokenizer (str or object, optional): Name of a built-in tokenizer
+            ("segtok" or "fast"), a tokenizer object, or None for segtok
+
+    Returns:
+        object: A tokenizer object
+
+    Raises:
+        ValueError: If the name does not match a built-in tokenizer
+    """
+    if tokenizer is None:
+        tokenizer = SegtokTokenizer.name
+    if not isinstance(tokenizer, str):
+        return tokenizer
+    if tokenizer not in TOKENIZERS:
+        names = sorted(TOKENIZERS)
+        message = f"Unknown tokenizer {tokenizer!r}, expected one of {names}"
+        raise ValueError(message)
+    return TOKENIZERS[tokenizer]()
@@ -7,7 +7,9 @@ categorization. These utilities form the foundation for clean and consistent
 text analysis throughout the keyword extraction pipeline.
 """
 
+import gc
 import re
+from contextlib import contextmanager
 from segtok.segmenter import split_multi
 from segtok.tokenizer import web_tokenizer, split_contractions
 
@@ -17,6 +19,12 @@ from segtok.tokenizer import web_tokenizer, split_contractions
 # - "none": Ignore stopwords completely
 STOPWORD_WEIGHT = "bi"
 
+# Regular expression to detect lines starting with capital letters
+PARAGRAPH_START = re.compile("^(\\s*([A-Z]))")
+
+# Translation table turning line breaks and tabs into spaces
+FLATTEN_TABLE = str.maketrans({"\n": " ", "\t": " "})
+
 
 def pre_filter(text):
     """Pre-filter text before processing.
@@ -41,27 +49,60 @@ def pre_filter(text):
     Returns:
         Normalized text with consistent spacing and paragraph structure
     """
-    # Regular expression to detect lines starting with capital letters
-    prog = re.compile("^(\\s*([A-Z]))")
+    # Determine separator of each line: preserve paragraph breaks for lines
+    # starting with capital letters, then join everything in a single pass
+    buffer = "".join(
+        ("\n\n" if PARAGRAPH_START.match(part) else " ") + part
+        for part in text.split("\n")
+    )
+
+    # Replace tabs with spaces
+    return buffer.replace("\t", " ")
+
+
+def preprocess(text, keep_paragraphs=True):
+    """
+    Normalize raw text before sentence segmentation.
+
+    With keep_paragraphs, this is pre_filter: lines starting with a capital
+    letter begin a new paragraph. Otherwise line breaks are treated as plain
+    spaces, which is what KeywordExtractor.extract_keywords has always done,
+    and the text is normalized in a single pass.
 
-    # Split the text into lines
-    parts = text.split("\n")
-    buffer = ""
+    Args:
+        text (str): Raw input text
+        keep_paragraphs (bool): Whether line breaks can mark paragraph breaks
 
-    # Process each line
-    for part in parts:
-        # Determine separator: preserve paragraph breaks for lines starting with capital letters
-        sep = " "
-        if prog.match(part):
-            sep = "\n\n"
+    Returns:
+        str: Normalized text
+    """
+    if keep_paragraphs:
+        return pre_filter(text)
 
-        # Append the processed line to the buffer, replacing tabs with spaces
-        buffer += sep + part.replace("\t", " ")
+    # Same result as pre_filter(text.replace("\n", " ")), without copying twice
+    sep = "\n\n" if PARAGRAPH_START.match(text) else " "
+    return sep + text.translate(FLATTEN_TABLE)
 
-    return buffer
+
+def tokenize_words(sentence):
+    """
+    Tokenize a single sentence into words.
+
+    Args:
+        sentence (str): The sentence to be tokenized
+
+    Returns:
+        list: The tokens of the sentence
+    """
+    return [
+        w  # Keep only valid word tokens
+        for w in split_contractions(web_tokenizer(sentence))
+        # Filter out standalone apostrophes and empty tokens
+        if not (w.startswith("'") and len(w) > 1) and len(w) > 0
+    ]
 
 
-def tokenize_sentences(text):
+def tokenize_sentences(text, cache=None, tokenizer=None):
     """
     Split text into sentences and tokenize into words.
 
@@ -72,24 +113,51 @@ def tokenize_sentences(text):
 
     Args:
         text (str): The input text to be tokenized
+        cache (LRUCache, optional): Cache mapping sentences to their tokens,
+            so that sentences repeated across documents are tokenized once
+        tokenizer (object, optional): Tokenizer backend providing
+            split_sentences and tokenize methods (default: None, use segtok
+            directly)
 
     Returns:
         list: A nested list structure where each inner list contains the tokens
               for a single sentence in the original text
     """
-    return [
-        # Inner list: tokenize each sentence into words
-        [
-            w  # Keep only valid word tokens
-            for w in split_contractions(web_tokenizer(s))
-            # Filter out standalone apostrophes and empty tokens
-            if not (w.startswith("'") and len(w) > 1) and len(w) > 0
-        ]
-        # Outer list: iterate through sentences
-        for s in list(split_multi(text))
-        # Skip empty sentences
-        if len(s.strip()) > 0
-    ]
+    # Outer list: iterate through sentences, skipping empty ones
+    if tokenizer is None:
+        sentences = [s for s in split_multi(text) if len(s.strip()) > 0]
+    else:
+        sentences = tokenizer.split_sentences(text)
+
+    return tokenize_split_sentences(sentences, cache, tokenizer)
+
+
+def tokenize_split_sentences(sentences, cache=None, tokenizer=None):
+    """
+    Tokenize a list of sentence strings into words.
+
+    Args:
+        sentences (list): Sentence strings to tokenize
+        cache (LRUCache, optional): Cache mapping sentences to their tokens
+        tokenizer (object, optional): Tokenizer backend providing a tokenize
+            method (default: None, use segtok directly)
+
+    Returns:
+        list: One list of tokens per sentence
+    """
+    tokenize = tokenize_words if tokenizer is None else tokenizer.tokenize
+
+    if cache is None:
+        return [tokenize(s) for s in sentences]
+
+    tokenized = []
+    for s in sentences:
+        tokens = cache.get(s)
+        if tokens is None:
+            tokens = tuple(tokenize(s))
+            cache.put(s, tokens)
+        tokenized.append(list(tokens))
+    return tokenized
 
 
 def get_tag(word, i, exclude):
@@ -121,10 +189,17 @@ def get_tag(word, i, exclude):
     ):
         return "d"
 
-    # Count character types for classification
-    cdigit = sum(c.isdigit() for c in word)
-    calpha = sum(c.isalpha() for c in word)
-    cexclude = sum(c in exclude for c in word)
+    # Count character types for classification in a single pass
+    cdigit = calpha = cexclude = cupper = 0
+    for c in word:
+        if c.isdigit():
+            cdigit += 1
+        if c.isalpha():
+            calpha += 1
+        if c.isupper():
+            cupper += 1
+        if c in exclude:
+            cexclude += 1
 
     # Classify unusual tokens: mixed alphanumeric, special chars, or multiple punctuation
     if (cdigit > 0 and calpha > 0) or (cdigit == 0 and calpha == 0) or cexclude > 1:
@@ -137,8 +212,27 @@ def get_tag(word, i, exclude):
     # Identify proper nouns (capitalized words not at sentence beginning)
     if len(word) > 1 and word[0].isupper() and i > 0:
         # Check that only the first letter is uppercase (not an all-caps word)
-        if sum(c.isupper() for c in word) == 1:
+        if cupper == 1:
             return "n"
 
     # Default case: plain word
     return "p"
+
+
+@contextmanager
+def gc_paused():
+    """
+    Pause the cyclic garbage collector.
+
+    Merging partial statistics or loading a snapshot allocates many small
+    objects, which would otherwise trigger repeated collections scanning the
+    whole, growing heap. The statistics contain no reference cycles, so they
+    are still freed by reference counting.
+    """
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()